@@ -0,0 +1,276 @@
+"""
+Microbenchmarks of the SDK hot paths: message deserialization and serialization, dataclass decoding,
+message forwarding to listeners and haptic effects update.
+
+Each benchmark reports the operations per second (best of several timeit repeats) and the memory
+allocated by one operation, measured with tracemalloc: the peak of the memory allocated during the
+operation, and the memory blocks still allocated after it (caches and leaks).
+
+Usage:
+    python benchmarks/WeArtBenchmarks.py --output results.json
+    python benchmarks/WeArtBenchmarks.py --filter Deserialize --compare baseline.json
+"""
+import argparse
+import gc
+import json
+import logging
+import platform
+import sys
+import timeit
+import tracemalloc
+
+from weartsdk import WeArtCommon
+from weartsdk.WeArtCommon import HandSide, ActuationPoint, TextureType, G2DeviceStatus, SensorData, dataclass_from_dict
+from weartsdk import WeArtMessages
+from weartsdk.WeArtMessageSerializer import WeArtMessageSerializer
+from weartsdk.WeArtMessageListener import WeArtMessageListener
+from weartsdk.WeArtClient import WeArtClient
+from weartsdk.WeArtHapticObject import WeArtHapticObject
+from weartsdk.WeArtEffect import TouchEffect
+from weartsdk.WeArtTemperature import WeArtTemperature
+from weartsdk.WeArtForce import WeArtForce
+from weartsdk.WeArtTexture import WeArtTexture
+
+_SENSOR = {"accelerometer": {"x": 0.012, "y": -0.981, "z": 0.104}, "gyroscope": {"x": 1.25, "y": -0.5, "z": 0.0625}, "timeOfFlight": {"distance": 72}}
+_ANALOG = {"ntcTemperatureRaw": 2048.0, "ntcTemperatureConverted": 30.5, "forceSensingRaw": 1024.0, "forceSensingConverted": 0.25}
+_FINGERS = ("thumb", "index", "middle", "annular", "pinky", "palm")
+
+_G2_DEVICE = {
+    "macAddress": "00:00:00:00:00:01",
+    "handSide": "RIGHT",
+    "signalStrength": -50.0,
+    "sensorsCalibDate": "2024-01-01T00:00:00",
+    "master": {
+        "batteryLevel": 100, "charging": False, "chargeCompleted": False,
+        "connection": {"bluetoothOn": True, "bluetoothConnected": True, "wifiOn": False, "wifiConnected": False, "usbConnected": False},
+        "imuFault": False, "adcFault": False, "buttonPushed": False,
+    },
+    "nodes": [{"id": f.upper(), "connected": True, "imuFault": False, "adcFault": False, "tofFault": True} for f in _FINGERS[:5]],
+}
+
+_STATUS = {
+    "status": "RUNNING", "version": "2.0.0", "statusCode": 0, "errorDesc": "", "actuationsEnabled": True,
+    "connectedDevices": [{"macAddress": "00:00:00:00:00:01", "handSide": "RIGHT"}, {"macAddress": "00:00:00:00:00:02", "handSide": "LEFT"}],
+}
+
+def _JsonFrame(id: str, data: dict) -> bytes:
+    return json.dumps({"type": id, "ts": 1700000000000, "data": data}, separators=(",", ":")).encode()
+
+# A received frame of each message type, as sent by the Middleware or the WeArtApp
+FRAMES = {
+    WeArtMessages.TrackingMessage.ID:           b"Tracking:TrackType1:128:64:100:200:32:16:120:255",
+    WeArtMessages.TrackingBendingG2Message.ID:  _JsonFrame("TRACKING_BENDING_G2", dict(
+        {"handSide": "RIGHT", "wrist": {"quaternion": {"x": 0.0, "y": 0.247, "z": 0.0, "w": 0.969}}},
+        **{f: {"closure": 0.5, "abduction": 0.25} for f in _FINGERS})),
+    WeArtMessages.RawSensorsData.ID:            _JsonFrame("RAW_DATA", dict({"handSide": "RIGHT"}, **{f: _SENSOR for f in ("thumb", "index", "middle", "palm")})),
+    WeArtMessages.RawDataTDPro.ID:              _JsonFrame("RAW_DATA_TD_PRO", dict({"handSide": "RIGHT"}, **{f: _SENSOR for f in _FINGERS})),
+    WeArtMessages.AnalogSensorsData.ID:         _JsonFrame("RAW_SENSOR_ON_MASK", dict({"handSide": "RIGHT"}, **{f: _ANALOG for f in ("thumb", "index", "middle", "palm")})),
+    WeArtMessages.MiddlewareStatusMessage.ID:   _JsonFrame("MW_STATUS", _STATUS),
+    WeArtMessages.WeArtAppStatusMessage.ID:     _JsonFrame("WA_STATUS", dict(_STATUS, warningCode=0, warningDesc="", connectionType="BLE",
+                                                           autoconnection=False, trackingPlayback=False, rawDataLog=False, sensorOnMask=False)),
+    WeArtMessages.DevicesStatusMessage.ID:      _JsonFrame("DEVICES_STATUS", {"devices": [
+        {"macAddress": "00:00:00:00:00:01", "handSide": "RIGHT", "batteryLevel": 80, "charging": False,
+         "thimbles": [{"id": f.upper(), "connected": True, "statusCode": 0, "errorDesc": ""} for f in _FINGERS[:3]]}]}),
+    WeArtMessages.TDProStatusMessage.ID:        _JsonFrame("WEART_TD_PRO_STATUS", {"devices": [_G2_DEVICE]}),
+    WeArtMessages.CalibrationStatusMessage.ID:  b"CalibrationStatus:1:1",
+    WeArtMessages.CalibrationResultMessage.ID:  b"CalibrationResult:1:0",
+}
+
+class _CountingListener(WeArtMessageListener):
+    def __init__(self, ids: list):
+        super().__init__(ids)
+        self.count = 0
+
+    def OnMessageReceived(self, message):
+        self.count += 1
+
+def _Target(msg: WeArtMessages.WeArtMessage) -> WeArtMessages.WeArtMessage:
+    msg.setHandSide(HandSide.Right)
+    msg.setActuationPoint(ActuationPoint.Index)
+    return msg
+
+def DeserializeBenchmarks(codec = None) -> list:
+    serializer = WeArtMessageSerializer(codec)
+    return [(f"Deserialize/{ id }", lambda frame=frame: serializer.Deserialize(frame)) for id, frame in FRAMES.items()]
+
+def SerializeBenchmarks(codec = None) -> list:
+    serializer = WeArtMessageSerializer(codec)
+    messages = [
+        _Target(WeArtMessages.SetTemperatureMessage(0.62)),
+        _Target(WeArtMessages.SetForceMessage([0.5, 0.0, 0.0])),
+        _Target(WeArtMessages.SetTextureMessage(TextureType.TextileMeshMedium, 0.5, 100.0)),
+        _Target(WeArtMessages.StopForceMessage()),
+    ]
+    benchmarks = []
+    for msg in messages:
+        benchmarks.append((f"Serialize/{ msg.getID() }", msg.serialize))
+        benchmarks.append((f"SerializeBytes/{ msg.getID() }", lambda msg=msg: serializer.Serialize(msg)))
+    return benchmarks
+
+def DataclassBenchmarks(codec = None) -> list:
+    return [
+        ("dataclass_from_dict/G2DeviceStatus", lambda: dataclass_from_dict(G2DeviceStatus, _G2_DEVICE)),
+        ("dataclass_from_dict/SensorData", lambda: dataclass_from_dict(SensorData, _SENSOR)),
+    ]
+
+def ForwardingBenchmarks(codec = None, listeners = (1, 10, 100)) -> list:
+    message = WeArtMessageSerializer(codec).Deserialize(FRAMES[WeArtMessages.TrackingMessage.ID])
+    benchmarks = []
+    for n in listeners:
+        client = WeArtClient(WeArtCommon.DEFAULT_IP_ADDRESS, WeArtCommon.DEFAULT_TCP_PORT, log_level=logging.WARNING, json_codec=codec)
+        for _ in range(n):
+            client.AddMessageListener(_CountingListener([WeArtMessages.TrackingMessage.ID]))
+        # Listeners of other messages must not slow down the forwarding
+        client.AddMessageListener(_CountingListener([WeArtMessages.RawDataTDPro.ID]))
+        benchmarks.append((f"ForwardingMessages/{ n } listeners", lambda client=client: client._WeArtClient__ForwardingMessages([message])))
+    return benchmarks
+
+def UpdateEffectsBenchmarks(codec = None) -> list:
+    # A client with reconnect enabled records the haptic commands while disconnected, so that the
+    # commands are serialized as when connected, without measuring the socket
+    client = WeArtClient(WeArtCommon.DEFAULT_IP_ADDRESS, WeArtCommon.DEFAULT_TCP_PORT, log_level=logging.WARNING, json_codec=codec, reconnect=True)
+    hapticObject = WeArtHapticObject(client)
+    hapticObject.handSideFlag = HandSide.Right.value
+    hapticObject.actuationPointFlag = ActuationPoint.Index
+    effect = TouchEffect(WeArtTemperature(), WeArtForce(), WeArtTexture())
+    hapticObject.AddEffect(effect)
+    temperature = WeArtTemperature()
+    temperature.active = True
+    texture = WeArtTexture()
+    texture.active = True
+    forces = [WeArtForce(active = True, force = 0.25), WeArtForce(active = True, force = 0.75)]
+    state = {"i": 0}
+
+    def update():
+        # Alternate the force, so that each update sends a command
+        i = state["i"] = state["i"] ^ 1
+        effect.Set(temperature, forces[i], texture)
+        hapticObject.UpdateEffects()
+    return [("UpdateEffects", update)]
+
+BENCHMARKS = [DeserializeBenchmarks, SerializeBenchmarks, DataclassBenchmarks, ForwardingBenchmarks, UpdateEffectsBenchmarks]
+
+def MeasureSpeed(func, repeat: int = 5) -> float:
+    """
+    Returns the operations per second of a function, the best of several timeit repeats.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return number / best
+
+def MeasureAllocations(func, number: int = 200) -> tuple:
+    """
+    Returns the median peak of the memory allocated by one call of a function, in bytes, and the number of
+    memory blocks still allocated after each call.
+    """
+    func()
+    gc.collect()
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(number):
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.clear_traces()
+            before = tracemalloc.get_traced_memory()[0]
+            func()
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    for _ in range(number):
+        func()
+    gc.collect()
+    retained = (sys.getallocatedblocks() - blocks) / number
+    peaks.sort()
+    return peaks[len(peaks) // 2], retained
+
+def Run(filter: str = None, repeat: int = 5, codec = None) -> dict:
+    """
+    Runs the benchmarks.
+
+    Parameters:
+        filter (str): Runs only the benchmarks whose name contains this string.
+        repeat (int): The number of timeit repeats of each benchmark.
+        codec (str): The JSON codec, see WeArtClient (default is the fastest installed codec).
+
+    Returns:
+        dict: The results, with the environment and a "benchmarks" list.
+    """
+    results = []
+    for build in BENCHMARKS:
+        for name, func in build(codec):
+            if filter and filter not in name:
+                continue
+            opsPerSec = MeasureSpeed(func, repeat)
+            peakBytes, retainedBlocks = MeasureAllocations(func)
+            results.append({
+                "name": name,
+                "ops_per_sec": round(opsPerSec, 1),
+                "ns_per_op": round(1e9 / opsPerSec, 1),
+                "peak_bytes_per_op": peakBytes,
+                "retained_blocks_per_op": round(retainedBlocks, 3),
+            })
+            print(f"{ name:<45} { opsPerSec:>14,.0f} ops/s { peakBytes:>8} B/op", file=sys.stderr)
+    return {
+        "sdk_version": WeArtCommon.WEART_SDK_VERSION,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "codec": WeArtMessageSerializer(codec).codec().name,
+        "benchmarks": results,
+    }
+
+def Compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Returns the benchmarks slower than in the baseline by more than a threshold.
+
+    Parameters:
+        results (dict): The results, as returned by Run.
+        baseline (dict): The baseline results, e.g. of the previous release.
+        threshold (float): The tolerated slowdown, e.g. 0.1 for 10%.
+
+    Returns:
+        list[tuple[str, float]]: The names and the slowdowns of the regressed benchmarks.
+    """
+    baselineOps = {b["name"]: b["ops_per_sec"] for b in baseline["benchmarks"]}
+    regressions = []
+    for b in results["benchmarks"]:
+        old = baselineOps.get(b["name"])
+        if old:
+            slowdown = 1.0 - b["ops_per_sec"] / old
+            if slowdown > threshold:
+                regressions.append((b["name"], slowdown))
+    return regressions
+
+def _Main(argv = None) -> int:
+    parser = argparse.ArgumentParser(description = "Runs the SDK microbenchmarks and prints the results as JSON.")
+    parser.add_argument("--output", help = "file written with the JSON results, instead of the standard output")
+    parser.add_argument("--filter", help = "runs only the benchmarks whose name contains this string")
+    parser.add_argument("--repeat", type = int, default = 5, help = "timeit repeats of each benchmark")
+    parser.add_argument("--codec", help = "JSON codec (json, orjson, msgspec, ujson)")
+    parser.add_argument("--compare", help = "baseline JSON results; exits with status 1 if a benchmark regressed")
+    parser.add_argument("--threshold", type = float, default = 0.1, help = "tolerated slowdown when comparing (default 0.1)")
+    args = parser.parse_args(argv)
+
+    results = Run(args.filter, args.repeat, args.codec)
+    output = json.dumps(results, indent = 2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = Compare(results, json.load(f), args.threshold)
+        for name, slowdown in regressions:
+            print(f"REGRESSION { name }: { slowdown:.0%} slower", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(_Main())
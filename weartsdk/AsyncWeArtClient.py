@@ -0,0 +1,420 @@
+import asyncio
+import inspect
+from contextlib import contextmanager
+import logging
+
+from .WeArtCommon import TrackingType
+from . import WeArtMessages as WeArtMessages
+from .WeArtClient import WeArtClient
+from .WeArtMessageSerializer import WeArtMessageSerializer
+from .WeArtMessageFramer import WeArtMessageFramer
+from .WeArtThimbleTrackingObject import WeArtThimbleTrackingObject
+from .WeArtTrackingRouter import WeArtTrackingRouter
+from .WeArtMessageListener import WeArtMessageListener
+from .WeArtMessageDispatcher import WeArtMessageDispatcher, WeArtCallbackDispatcher
+
+class AsyncWeArtClient:
+    """
+    A client communicating with the Middleware or WeArtApp through asyncio streams.
+
+    The client runs entirely on the event loop: messages are received by a task and forwarded to the
+    listeners and to the messages() iterators, and callbacks are called on the loop, so many clients
+    can share a single thread.
+    All the methods must be called from the event loop thread.
+
+    Usage:
+        client = AsyncWeArtClient(WeArtCommon.DEFAULT_IP_ADDRESS, WeArtCommon.DEFAULT_TCP_PORT)
+        await client.Run()
+        await client.Start()
+        async for msg in client.messages(ids=[TrackingMessage.ID]):
+            ...
+
+    Attributes:
+        messagesSeparator (str): The separator used to delimit messages.
+        readSize (int): The maximum number of bytes read from the stream at once.
+    """
+    messagesSeparator = WeArtClient.messagesSeparator
+    readSize = 4096
+    ErrorType = WeArtClient.ErrorType
+
+    def __init__(self, ip_address, port, log_level = logging.DEBUG, json_codec = None):
+        """
+        Initializes an AsyncWeArtClient instance.
+
+        :param ip_address: The IP address of the server to connect to.
+        :param port: The port number to use for the connection.
+        :param log_level: The logging level (default is logging.DEBUG).
+        :param json_codec: The JSON codec, or its name ("json", "orjson", "msgspec", "ujson"), used for JSON messages
+            (default is the fastest installed codec).
+        """
+        self.__logger = logging.getLogger("WeArtClient")
+        self.__logger.setLevel(log_level)
+        self._messageSerializer = WeArtMessageSerializer(json_codec)
+        self._messageSeparator = self.messagesSeparator.encode()
+        self._messageFramer = WeArtMessageFramer(self._messageSeparator)
+        self.__Connected = False
+        self.__Closing = False
+        self.__reader = None
+        self.__writer = None
+        self.__receiveTask = None
+        self.__batchBuffer = None
+        self.__thimbleTrackingObjects = []
+        self.__messageDispatcher = WeArtMessageDispatcher(self.__logger)
+        self.__trackingRouter = WeArtTrackingRouter()
+        self.__subscriptions = []
+        self.__callbacks = WeArtCallbackDispatcher(self.__logger, self.__RunCallbacks)
+        self.__pendingCallbacks = set()
+        self.__IP_ADDRESS = ip_address
+        self.__PORT = port
+        self.AddMessageListener(self.__trackingRouter)
+
+    async def __aenter__(self):
+        await self.Run()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.Close()
+
+    async def Run(self):
+        """
+        Establishes a connection with the Middleware or WeArtApp and starts receiving messages.
+
+        :raises OSError: If the connection cannot be established.
+        """
+        server_addr = (self.__IP_ADDRESS, self.__PORT)
+        try:
+            self.__reader, self.__writer = await asyncio.open_connection(self.__IP_ADDRESS, self.__PORT)
+        except OSError as e:
+            self.__logger.error(f"Unable to connect to server { server_addr }... \n{e}")
+            self.__Connected = False
+            self.__NotifyError(self.ErrorType.ConnectionError)
+            raise
+        self._messageFramer.reset()
+        self.__Closing = False
+        self.__logger.info(f"Connection to server: { server_addr } established.")
+        self.__Connected = True
+        self.__NotifyConnectionStatus(True)
+        self.__receiveTask = asyncio.get_running_loop().create_task(self._OnReceive())
+
+    def IsConnected(self):
+        """
+        Checks if the Middleware or the WeArtApp is connected.
+
+        :return: True if connected, False otherwise.
+        """
+        return self.__Connected
+
+    async def Close(self):
+        """
+        Closes the connection with the Middleware or WeArtApp and ends the messages() iterators.
+        """
+        self.__Closing = True
+        if self.__receiveTask is not None:
+            self.__receiveTask.cancel()
+            try:
+                await self.__receiveTask
+            except asyncio.CancelledError:
+                pass
+            self.__receiveTask = None
+        if self.__writer is not None:
+            self.__writer.close()
+            try:
+                await self.__writer.wait_closed()
+            except OSError:
+                pass
+        wasConnected = self.__Connected
+        self.__Connected = False
+        self.__EndSubscriptions()
+        if wasConnected:
+            self.__NotifyConnectionStatus(False)
+
+    async def Start(self, tracking_type = TrackingType.WEART_HAND):
+        """
+        Sends a start message to connected device(s) based on the tracking type.
+
+        :param tracking_type: The tracking type to use (default is WEART_HAND).
+        """
+        if tracking_type != None:
+            start_msg = WeArtMessages.StartFromClientMessage(trackType=tracking_type)
+        else:
+            start_msg = WeArtMessages.StartFromClientMessage()
+        await self.SendMessage(start_msg)
+
+    async def Stop(self):
+        """
+        Sends a stop message to connected device(s).
+        """
+        await self.SendMessage(WeArtMessages.StopFromClientMessage())
+
+    async def StartCalibration(self):
+        """
+        Starts the calibration process.
+        """
+        await self.SendMessage(WeArtMessages.StartCalibrationMessage())
+
+    async def StopCalibration(self):
+        """
+        Stops the calibration process.
+        """
+        await self.SendMessage(WeArtMessages.StopCalibrationMessage())
+
+    async def StartRawData(self):
+        """
+        Starts the raw data collection from the device(s).
+        """
+        await self.SendMessage(WeArtMessages.RawDataOn())
+
+    async def StopRawData(self):
+        """
+        Stops the raw data collection from the device(s).
+        """
+        await self.SendMessage(WeArtMessages.RawDataOff())
+
+    async def SendMessage(self, msg: WeArtMessages.WeArtMessage):
+        """
+        Sends a message and waits until the stream is ready to accept more data.
+
+        :param msg: The message to be sent.
+        """
+        self._sendMessage(msg)
+        await self.Drain()
+
+    async def Drain(self):
+        """
+        Waits until the data written so far has been handed over to the socket.
+        """
+        if not self.__Connected:
+            return
+        try:
+            await self.__writer.drain()
+        except OSError as e:
+            self.__OnSendError(e)
+
+    def messages(self, ids = None, max_queue = 256):
+        """
+        Returns an asynchronous iterator over the received messages.
+        The iterator ends when the connection is closed, or immediately if the client is not connected.
+
+        Usage:
+            async for msg in client.messages(ids=[TrackingMessage.ID]):
+                ...
+
+        :param ids: The IDs of the messages to return (default is all messages).
+        :param max_queue: The maximum number of messages waiting to be consumed; when the consumer falls behind,
+            the oldest messages are discarded (default is 256).
+        :return: An asynchronous iterator of WeArtMessage.
+        """
+        queue = asyncio.Queue(max_queue)
+        subscription = (frozenset(ids) if ids is not None else None, queue)
+        if self.__Connected:
+            self.__subscriptions.append(subscription)
+        else:
+            queue.put_nowait(None)
+        return self.__Iterate(subscription)
+
+    async def __Iterate(self, subscription):
+        queue = subscription[1]
+        try:
+            while True:
+                msg = await queue.get()
+                if msg is None:
+                    return
+                yield msg
+        finally:
+            if subscription in self.__subscriptions:
+                self.__subscriptions.remove(subscription)
+
+    def AddThimbleTracking(self, trackingObject: WeArtThimbleTrackingObject):
+        """
+        Adds a thimble tracking object to the list of tracked thimbles.
+
+        :param trackingObject: The WeArtThimbleTrackingObject to add.
+        """
+        self.__trackingRouter.AddThimbleTracking(trackingObject)
+        self.__thimbleTrackingObjects.append(trackingObject)
+
+    def RemoveThimbleTracking(self, trackingObject: WeArtThimbleTrackingObject):
+        """
+        Removes a thimble tracking object from the list of tracked thimbles.
+
+        :param trackingObject: The WeArtThimbleTrackingObject to remove.
+        """
+        if trackingObject in self.__thimbleTrackingObjects:
+            self.__thimbleTrackingObjects.remove(trackingObject)
+            self.__trackingRouter.RemoveThimbleTracking(trackingObject)
+
+    def ThimbleTrackingObjectsSize(self):
+        """
+        Returns the number of thimble tracking objects currently being tracked.
+
+        :return: The number of thimble tracking objects.
+        """
+        return len(self.__thimbleTrackingObjects)
+
+    def AddMessageListener(self, listener: WeArtMessageListener):
+        """
+        Adds a message listener to the list of message listeners.
+        Listeners are called on the event loop, so they should not block.
+
+        :param listener: The WeArtMessageListener to add.
+        """
+        self.__messageDispatcher.AddListener(listener)
+
+    def RemoveMessageListener(self, listener: WeArtMessageListener):
+        """
+        Removes a message listener from the list of message listeners.
+
+        :param listener: The WeArtMessageListener to remove.
+        """
+        self.__messageDispatcher.RemoveListener(listener)
+
+    def AddConnectionStatusCallback(self, callback):
+        """
+        Adds a callback function to be called when the connection status changes.
+        The callback takes a boolean parameter, True if connected, False otherwise. It can be a coroutine function.
+
+        :param callback: The callback function to be called.
+        """
+        self.__callbacks.AddConnectionStatusCallback(callback)
+
+    def AddErrorCallback(self, callback):
+        """
+        Adds a callback function to be called when an error occurs.
+        The callback takes a :class:`ErrorType` parameter. It can be a coroutine function.
+
+        :param callback: The callback function to be called.
+        """
+        self.__callbacks.AddErrorCallback(callback)
+
+    @contextmanager
+    def Batch(self):
+        """
+        Groups the messages sent inside the block into a single write, see WeArtClient.Batch.
+        """
+        outermost = self.__batchBuffer is None
+        if outermost:
+            self.__batchBuffer = []
+        try:
+            yield
+        finally:
+            if outermost:
+                buffer = self.__batchBuffer
+                self.__batchBuffer = None
+                if buffer and self.__Connected:
+                    self.__write(b''.join(buffer))
+
+    def _sendMessage(self, msg: WeArtMessages.WeArtMessage):
+        """
+        Writes a serialized message to the stream without waiting, so that it can be used by haptic objects.
+        Inside a Batch block, the message is appended to the batch and sent when the block exits.
+
+        :param msg: The message to be sent.
+        """
+        if not self.__Connected:
+            return
+        if msg == None:
+            return
+
+        data = self._messageSerializer.Serialize(msg) + self._messageSeparator
+
+        if self.__logger.isEnabledFor(logging.DEBUG):
+            self.__logger.debug(f"Message to be sent: { data.decode() }")
+
+        if self.__batchBuffer is not None:
+            self.__batchBuffer.append(data)
+            return
+        self.__write(data)
+
+    def __write(self, data: bytes):
+        try:
+            self.__writer.write(data)
+        except OSError as e:
+            self.__logger.error(f"Send message '{ data.decode() }' failed: { e }")
+            self.__OnSendError(e)
+
+    def __OnSendError(self, error: OSError):
+        """
+        Handles a failed write, closing the connection.
+        """
+        if not self.__Connected:
+            return
+        self.__Connected = False
+        self.__writer.close()
+        self.__EndSubscriptions()
+        self.__NotifyError(self.ErrorType.SendMessageError)
+        self.__NotifyConnectionStatus(False)
+
+    async def _OnReceive(self):
+        """
+        Handles incoming messages from the server.
+        """
+        try:
+            while True:
+                data = await self.__reader.read(self.readSize)
+                if not data:
+                    break
+                messages = []
+                for frame in self._messageFramer.feed(data):
+                    if self.__logger.isEnabledFor(logging.DEBUG):
+                        self.__logger.debug(f"Received: { frame.decode() }")
+                    messages.append(self._messageSerializer.Deserialize(frame))
+                self.__ForwardingMessages(messages)
+        except Exception as e:
+            if self.__Closing:
+                return
+            self.__logger.exception(f"Receive failed: { e }")
+            self.__NotifyError(self.ErrorType.ReceiveMessageError)
+
+        if not self.__Closing and self.__Connected:
+            self.__logger.error("Connection closed by the server")
+            self.__Connected = False
+            self.__writer.close()
+            self.__EndSubscriptions()
+            self.__NotifyConnectionStatus(False)
+
+    def __ForwardingMessages(self, messages: list):
+        """
+        Forwards messages to the message listener(s) and to the messages() iterators.
+        A failing listener is logged and does not stop the reception.
+        """
+        self.__messageDispatcher.Forward(messages)
+        subscriptions = self.__subscriptions
+        if not subscriptions:
+            return
+        for msg in messages:
+            if msg == None:
+                continue
+            id = msg.getID()
+            for ids, queue in subscriptions:
+                if ids is None or id in ids:
+                    if queue.full():
+                        queue.get_nowait()
+                    queue.put_nowait(msg)
+
+    def __EndSubscriptions(self):
+        # Iterators not started yet are ended too, and no queue keeps receiving messages
+        subscriptions = self.__subscriptions
+        self.__subscriptions = []
+        for _, queue in subscriptions:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(None)
+
+    def __NotifyConnectionStatus(self, connected: bool):
+        self.__callbacks.NotifyConnectionStatus(connected)
+
+    def __NotifyError(self, errorType):
+        self.__callbacks.NotifyError(errorType)
+
+    def __RunCallbacks(self, callbacks: list, arg):
+        """
+        Calls the callbacks on the event loop; coroutines are run as tasks, kept until they complete.
+        """
+        for callback in callbacks:
+            result = self.__callbacks.Call(callback, arg)
+            if inspect.isawaitable(result):
+                task = asyncio.ensure_future(result)
+                self.__pendingCallbacks.add(task)
+                task.add_done_callback(self.__pendingCallbacks.discard)
+
+__all__ = ['AsyncWeArtClient']
@@ -0,0 +1,188 @@
+from dataclasses import dataclass
+from array import array
+import time
+from .WeArtMessageListener import WeArtMessageListener
+from .WeArtMessages import WeArtMessage, TrackingMessage, TrackingBendingG2Message
+from . import WeArtCommon
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+@dataclass
+class HandStateSnapshot:
+    """
+    Represents a copy of the state of both hands.
+
+    Arrays are indexed by [hand, actuation point] (or [hand, component] for the wrist), following the order
+    of WeArtCommon.HAND_SIDES and WeArtCommon.ACTUATION_POINTS. They are NumPy arrays when NumPy is installed,
+    nested lists otherwise.
+
+    Attributes:
+        frame (int): The number of tracking messages applied to the buffer when the snapshot was taken.
+        closures: The closure values (2x6).
+        abductions: The abduction values (2x6).
+        wrists: The wrist quaternions as X, Y, Z, W (2x4).
+    """
+    frame: int
+    closures: object
+    abductions: object
+    wrists: object
+
+class HandStateBuffer(WeArtMessageListener):
+    """
+    Keeps the closures, abductions and wrist orientations of both hands in preallocated arrays,
+    updated in place for every tracking message.
+
+    The arrays are NumPy arrays when NumPy is installed, otherwise array.array buffers exposed through
+    2-dimensional memoryviews. Views returned by Closures, Abductions and Wrists share memory with the buffer
+    and may be updated while being read; Snapshot returns a copy consistent with a single frame.
+
+    Updates are published with a sequence lock: the sequence number is odd while a message is being applied,
+    and readers retry the copy when the sequence changed meanwhile, so the receive thread never waits.
+
+    Attributes:
+        __frame (int): Monotonic counter of the tracking messages applied to the buffer.
+        __sequence (int): Sequence number, odd while an update is in progress.
+        __closures: The closure values, indexed by [hand, actuation point].
+        __abductions: The abduction values, indexed by [hand, actuation point].
+        __wrists: The wrist quaternions, indexed by [hand, component].
+    """
+    NUM_HANDS = len(WeArtCommon.HAND_SIDES)
+    NUM_ACTUATION_POINTS = len(WeArtCommon.ACTUATION_POINTS)
+    NUM_WRIST_COMPONENTS = 4
+
+    def __init__(self):
+        """
+        Initializes the HandStateBuffer, listening for tracking and bending messages.
+        """
+        super().__init__([TrackingMessage.ID, TrackingBendingG2Message.ID])
+        self.__frame = 0
+        self.__sequence = 0
+        self.__handIndex = {handSide: i for i, handSide in enumerate(WeArtCommon.HAND_SIDES)}
+        self.__closures = self.__allocate(self.NUM_ACTUATION_POINTS, WeArtCommon.defaultClosure)
+        self.__abductions = self.__allocate(self.NUM_ACTUATION_POINTS, WeArtCommon.defaultAbduction)
+        self.__wrists = self.__allocate(self.NUM_WRIST_COMPONENTS, 0.0)
+
+    @classmethod
+    def __allocate(cls, columns: int, value: float):
+        if numpy is not None:
+            return numpy.full((cls.NUM_HANDS, columns), value, dtype=numpy.float64)
+        buffer = array('d', [value] * (cls.NUM_HANDS * columns))
+        return memoryview(buffer).cast('B').cast('d', [cls.NUM_HANDS, columns])
+
+    def FrameCount(self) -> int:
+        """
+        Returns the number of tracking messages applied to the buffer.
+
+        Returns:
+            int: The frame counter.
+        """
+        return self.__frame
+
+    def Closures(self):
+        """
+        Returns a view of the closure values, indexed by [hand, actuation point].
+
+        Returns:
+            numpy.ndarray | memoryview: The closures (2x6), sharing memory with the buffer.
+        """
+        return self.__closures
+
+    def Abductions(self):
+        """
+        Returns a view of the abduction values, indexed by [hand, actuation point].
+
+        Returns:
+            numpy.ndarray | memoryview: The abductions (2x6), sharing memory with the buffer.
+        """
+        return self.__abductions
+
+    def Wrists(self):
+        """
+        Returns a view of the wrist quaternions, indexed by [hand, component] with components X, Y, Z, W.
+        Wrist orientation is only available for TouchDiver Pro.
+
+        Returns:
+            numpy.ndarray | memoryview: The wrist quaternions (2x4), sharing memory with the buffer.
+        """
+        return self.__wrists
+
+    def Snapshot(self) -> HandStateSnapshot:
+        """
+        Returns a copy of the state of both hands, with all values taken from the same frame.
+
+        Returns:
+            HandStateSnapshot: The copied state.
+        """
+        while True:
+            sequence = self.__sequence
+            if sequence & 1:
+                # An update is in progress, let the receive thread complete it
+                time.sleep(0)
+                continue
+            frame = self.__frame
+            if numpy is not None:
+                snapshot = HandStateSnapshot(frame, self.__closures.copy(), self.__abductions.copy(), self.__wrists.copy())
+            else:
+                snapshot = HandStateSnapshot(frame, self.__closures.tolist(), self.__abductions.tolist(), self.__wrists.tolist())
+            if self.__sequence == sequence:
+                return snapshot
+
+    def OnMessageReceived(self, message: WeArtMessage):
+        """
+        Updates the state of the hand(s) carried by the tracking or bending message.
+        Messages carrying values that are not numbers are ignored.
+
+        Parameters:
+            message (WeArtMessage): The message containing tracking or bending data.
+        """
+        # All the values are converted before the update starts, so that a malformed message cannot interrupt it
+        try:
+            if message.getID() == TrackingMessage.ID:
+                tracking = [(hand, self.__convert(message.GetHandTracking(handSide))) for handSide, hand in self.__handIndex.items()]
+                wrist = None
+            elif message.getID() == TrackingBendingG2Message.ID:
+                hand = self.__handIndex.get(message.GetHandSide())
+                if hand is None:
+                    return
+                tracking = [(hand, self.__convert(message.GetHandTracking()))]
+                wrist = message.GetWrist()
+                wrist = (float(wrist["X"]), float(wrist["Y"]), float(wrist["Z"]), float(wrist["W"]))
+            else:
+                return
+        except (ValueError, TypeError, KeyError):
+            return
+
+        self.__sequence += 1
+        try:
+            for hand, handTracking in tracking:
+                self.__setHand(hand, handTracking)
+            if wrist is not None:
+                wrists = self.__wrists
+                for i in range(self.NUM_WRIST_COMPONENTS):
+                    wrists[hand, i] = wrist[i]
+            self.__frame += 1
+        finally:
+            # Never leave the sequence odd, readers would wait forever
+            self.__sequence += 1
+
+    @staticmethod
+    def __convert(tracking: tuple) -> tuple:
+        closures, abductions = tracking
+        return tuple(map(float, closures)), tuple(map(float, abductions))
+
+    def __setHand(self, hand: int, tracking: tuple):
+        closures, abductions = tracking
+        if numpy is not None:
+            self.__closures[hand] = closures
+            self.__abductions[hand] = abductions
+            return
+        closuresView = self.__closures
+        abductionsView = self.__abductions
+        for i in range(self.NUM_ACTUATION_POINTS):
+            closuresView[hand, i] = closures[i]
+            abductionsView[hand, i] = abductions[i]
+
+__all__ = ['HandStateBuffer', 'HandStateSnapshot']
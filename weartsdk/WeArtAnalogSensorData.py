@@ -50,6 +50,8 @@ class WeArtAnalogSensorData(WeArtMessageListener):
     def GetLastSample(self) -> Sample:
         """
         Retrieves the last received analog sensor data sample.
+        Samples are replaced as a whole and never modified once published, so the returned sample
+        is consistent even while new data arrives.
 
         Returns:
             Sample: The most recent analog sensor data sample.
@@ -1,18 +1,40 @@
 import socket
-import sys
-from threading import Thread
+import random
+from threading import Thread, local, Lock, Event
+from concurrent.futures import ThreadPoolExecutor, wait
 from enum import Enum
+from contextlib import contextmanager
 import logging
 
 from .WeArtCommon import TrackingType
 from . import WeArtMessages as WeArtMessages
 from .WeArtMessageSerializer import WeArtMessageSerializer
+from .WeArtMessageFramer import WeArtMessageFramer
+from .WeArtMessageSender import WeArtMessageSender, SendPolicy, HapticTarget
 from  .WeArtThimbleTrackingObject import WeArtThimbleTrackingObject
+from .WeArtTrackingRouter import WeArtTrackingRouter
 from .WeArtMessageListener import WeArtMessageListener
+from .WeArtMessageDispatcher import WeArtMessageDispatcher, WeArtCallbackDispatcher
+from .WeArtSelectorLoop import WeArtSelectorLoop, EVENT_READ, EVENT_WRITE
+from .WeArtSocketOptions import WeArtSocketOptions
+from .WeArtSessionRecorder import RecordDirection
 
 
 logging.basicConfig()
 
+# Executor shared by the clients to run their callbacks, created on first use
+_sharedCallbackExecutor = None
+_sharedCallbackExecutorLock = Lock()
+# Marks the threads running a callback, whatever the executor
+_callbackThread = local()
+
+def _SharedCallbackExecutor() -> ThreadPoolExecutor:
+    global _sharedCallbackExecutor
+    with _sharedCallbackExecutorLock:
+        if _sharedCallbackExecutor is None:
+            _sharedCallbackExecutor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="WeArtCallback")
+        return _sharedCallbackExecutor
+
 class WeArtClient:
     """
     A client class to communicate with a server using socket connections. 
@@ -22,28 +44,87 @@ class WeArtClient:
         messagesSeparator (str): The separator used to delimit messages.
     """
     messagesSeparator = '~'
+    SendPolicy = SendPolicy
+    SocketOptions = WeArtSocketOptions
 
-    def __init__(self, ip_address, port, log_level = logging.DEBUG):
+    def __init__(self, ip_address, port, log_level = logging.DEBUG, json_codec = None, async_send = False, send_queue_size = 1024, send_policy = SendPolicy.BLOCK, callback_executor = None,
+                 reconnect = False, reconnect_delay = 0.5, reconnect_max_delay = 30.0,
+                 io_engine = None, io_loop = None, recv_buffer_size = 4096, socket_options = None, recorder = None):
         """
         Initializes a WeArtClient instance.
 
         :param ip_address: The IP address of the server to connect to.
         :param port: The port number to use for the connection.
         :param log_level: The logging level (default is logging.DEBUG).
+        :param json_codec: The JSON codec, or its name ("json", "orjson", "msgspec", "ujson"), used for JSON messages
+            (default is the fastest installed codec).
+        :param async_send: If True, messages are queued and written by a dedicated thread, so senders never wait
+            for the socket (default is False).
+        :param send_queue_size: The maximum number of queued messages when async_send is True (default is 1024).
+        :param send_policy: The :class:`SendPolicy` applied when the queue is full (default is SendPolicy.BLOCK).
+        :param callback_executor: The executor running the connection status and error callbacks: None for a thread pool
+            shared by all the clients, "inline" to run them in the notifying thread, or any object with a
+            concurrent.futures.Executor submit method (default is None).
+        :param reconnect: If True, the client reconnects when the connection is lost or cannot be established, then
+            sends again the start message, the raw data request and the active haptic effects (default is False).
+        :param reconnect_delay: The delay before the first reconnection attempt, in seconds, doubled at each failed
+            attempt and randomized to avoid reconnecting all the clients at the same time (default is 0.5).
+        :param reconnect_max_delay: The maximum delay between two reconnection attempts, in seconds (default is 30.0).
+        :param io_engine: The I/O engine: "thread" to receive on a dedicated thread and send from the calling threads,
+            or "selector" to multiplex reads and writes of a non-blocking socket on a selector loop (epoll on Linux),
+            so that senders never wait for the socket. Default is "selector" if io_loop is given, "thread" otherwise.
+            The selector engine cannot be combined with async_send.
+        :param io_loop: A :class:`WeArtSelectorLoop` shared with other clients, used by the selector engine instead of
+            a loop owned by this client (default is None). The loop must be started by the caller.
+        :param recv_buffer_size: The size of the buffer the socket is read into (default is 4096).
+        :param socket_options: The :class:`WeArtSocketOptions` applied to the socket, e.g. TCP_NODELAY, kernel buffer sizes,
+            keepalive and connect timeout (default is WeArtSocketOptions(), tuned for low latency).
+        :param recorder: A :class:`WeArtSessionRecorder` recording every frame received and sent, for later analysis or
+            replay (default is None). The recorder is not closed by the client.
         """
-        self._messageSerializer = WeArtMessageSerializer()
+        self.__logger = logging.getLogger("WeArtClient")
+        self.__logger.setLevel(log_level)
+        self._messageSerializer = WeArtMessageSerializer(json_codec)
+        self._messageSeparator = self.messagesSeparator.encode()
+        self._messageFramer = WeArtMessageFramer(self._messageSeparator, recv_buffer_size)
         self.__Connected = False
         self.__Closing = False
         self.__s = None #socket
         self.__thimbleTrackingObjects = []
-        self.__messageListeners = []
-        self.__connectionStatusCallbacks = []
-        self.__errorCallbacks = []
-        self.__pendingCallbacks = []
+        self.__messageDispatcher = WeArtMessageDispatcher(self.__logger)
+        self.__trackingRouter = WeArtTrackingRouter()
+        self.__batchState = local()
+        self.__sender = WeArtMessageSender(send_queue_size, send_policy, self.__OnSendError) if async_send else None
+        self.__callbacks = WeArtCallbackDispatcher(self.__logger, self.__RunCallbacks)
+        self.__callbackExecutor = self.__ResolveCallbackExecutor(callback_executor)
+        self.__connectionLock = Lock()
+        self.__reconnect = reconnect
+        self.__reconnectDelay = reconnect_delay
+        self.__reconnectMaxDelay = reconnect_max_delay
+        self.__closed = Event()
+        self.__reconnectThread = None
+        self.__startMessage = None
+        self.__rawDataOn = False
+        self.__activeEffects = {} if reconnect else None
+        if io_engine is None:
+            io_engine = "selector" if io_loop is not None else "thread"
+        if io_engine not in ("thread", "selector"):
+            raise ValueError(f"Unknown I/O engine '{ io_engine }', expected \"thread\" or \"selector\"")
+        if io_engine == "thread" and io_loop is not None:
+            raise ValueError("io_loop requires the \"selector\" I/O engine")
+        if io_engine == "selector" and async_send:
+            raise ValueError("async_send cannot be combined with the \"selector\" I/O engine, whose writes never block")
+        self.__ownsIoLoop = io_engine == "selector" and io_loop is None
+        self.__ioLoop = WeArtSelectorLoop() if self.__ownsIoLoop else io_loop
+        self.__socketOptions = socket_options if socket_options is not None else WeArtSocketOptions()
+        self.__output = bytearray()
+        self.__outputLock = Lock()
+        # Serializes the writes of the thread engine, so that messages sent by several threads are never interleaved
+        self.__sendLock = Lock()
+        self.__recorder = recorder
         self.__IP_ADDRESS = ip_address
         self.__PORT = port
-        self.__logger = logging.getLogger("WeArtClient")
-        self.__logger.setLevel(log_level)
+        self.AddMessageListener(self.__trackingRouter)
 
     class ErrorType(Enum):
         ConnectionError = 0
@@ -61,6 +142,7 @@ class WeArtClient:
             start_msg = WeArtMessages.StartFromClientMessage(trackType=tracking_type)
         else:
             start_msg = WeArtMessages.StartFromClientMessage()
+        self.__startMessage = start_msg
         self._sendMessage(start_msg)
         
     def Stop(self):
@@ -68,30 +150,112 @@ class WeArtClient:
         Sends a stop message to connected device(s).
         """
         stop_msg = WeArtMessages.StopFromClientMessage()
+        self.__startMessage = None
         self._sendMessage(stop_msg)
     
     def Run(self):
         """
         Establishes a socket connection with the Middleware or WeArtApp.
+        If reconnect is enabled and the connection cannot be established, the client keeps trying in the background.
+
+        :raises OSError: If the connection cannot be established and reconnect is disabled.
         """
+        self.__Closing = False
+        self.__closed.clear()
+        if self.__ownsIoLoop:
+            self.__ioLoop.Start()
         try:
-            self.__s = socket.socket()
-            server_addr = (self.__IP_ADDRESS, self.__PORT)
-            self.__s.connect(server_addr)
-            self.__logger.info(f"Connection to server: { server_addr } established.")
-            self.__Connected = True
-            self.__NotifyConnectionStatus(True)
-            t = Thread(target=self._OnReceive, args = [], daemon=True)
-            t.start()
-
-        except socket.error as e:
-            self.__logger.error(f"Unable to connect to server { server_addr }... \n{e}")
+            self.__Connect()
+        except OSError as e:
+            self.__logger.error(f"Unable to connect to server { (self.__IP_ADDRESS, self.__PORT) }... \n{e}")
             self.__Connected = False
             self.__NotifyError(self.ErrorType.ConnectionError)
-            sys.exit()
-        
-        return
-    
+            if not self.__reconnect:
+                if self.__ownsIoLoop:
+                    # Nothing will be registered on the loop, do not leave its thread running
+                    self.__ioLoop.Stop()
+                raise
+            self.__StartReconnecting()
+
+    def __Connect(self):
+        """
+        Connects the socket and starts receiving messages.
+        """
+        s = socket.socket()
+        server_addr = (self.__IP_ADDRESS, self.__PORT)
+        try:
+            self.__socketOptions.apply(s)
+            s.connect(server_addr)
+        except OSError:
+            s.close()
+            raise
+        # The connect timeout must not apply to reads and writes
+        s.settimeout(None)
+        if self.__ioLoop is not None:
+            s.setblocking(False)
+            with self.__outputLock:
+                self.__output.clear()
+        self.__s = s
+        self._messageFramer.reset()
+        self.__logger.info(f"Connection to server: { server_addr } established.")
+        self.__Connected = True
+        if self.__sender is not None:
+            self.__sender.Start(s)
+        self.__NotifyConnectionStatus(True)
+        if self.__ioLoop is not None:
+            self.__ioLoop.Register(s, lambda events: self.__OnReady(s, events))
+            return
+        t = Thread(target=self._OnReceive, args = [s], daemon=True)
+        t.start()
+
+    def __StartReconnecting(self):
+        """
+        Starts the thread reconnecting to the server, unless it is already running.
+        """
+        with self.__connectionLock:
+            if self.__reconnectThread is not None and self.__reconnectThread.is_alive():
+                return
+            self.__reconnectThread = Thread(target=self.__Reconnect, daemon=True)
+            self.__reconnectThread.start()
+
+    def __Reconnect(self):
+        """
+        Tries to reconnect with jittered exponential backoff, then replays the session.
+        """
+        delay = self.__reconnectDelay
+        while True:
+            # Wait between half and the whole delay, so that clients do not retry all at once
+            if self.__closed.wait(delay * random.uniform(0.5, 1.0)):
+                return
+            try:
+                self.__Connect()
+            except OSError as e:
+                self.__logger.debug(f"Reconnection failed: {e}")
+                delay = min(delay * 2, self.__reconnectMaxDelay)
+                continue
+            if self.__closed.is_set():
+                # Closed while connecting
+                self.__Connected = False
+                if self.__ioLoop is not None:
+                    self.__ioLoop.Unregister(self.__s)
+                self.__s.close()
+                return
+            self.__ReplaySession()
+            return
+
+    def __ReplaySession(self):
+        """
+        Sends again the start message, the raw data request and the active haptic effects after a reconnection.
+        """
+        with self.Batch():
+            if self.__startMessage is not None:
+                self._sendMessage(self.__startMessage)
+            if self.__rawDataOn:
+                self._sendMessage(WeArtMessages.RawDataOn())
+            effects = list(self.__activeEffects.values())
+            if effects:
+                self.__batchState.buffer.extend(effects)
+
     def IsConnected(self):
         """
         Checks if the Middleware or the WeArtApp is connected.
@@ -105,7 +269,20 @@ class WeArtClient:
         Closes the socket connection with the Middleware or WeArtApp.
         """
         self.__Closing = True
-        self.__s.close()
+        self.__closed.set()
+        if self.__sender is not None:
+            self.__sender.Stop()
+        if self.__s is not None:
+            if self.__ioLoop is not None:
+                self.__ioLoop.Unregister(self.__s)
+                self.__FlushBeforeClosing()
+            try:
+                self.__s.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self.__s.close()
+        if self.__ownsIoLoop:
+            self.__ioLoop.Stop()
         self.__Connected = False
         self.__NotifyConnectionStatus(False)
 
@@ -128,6 +305,7 @@ class WeArtClient:
         Starts the raw data collection from the device(s).
         """
         message = WeArtMessages.RawDataOn()
+        self.__rawDataOn = True
         self._sendMessage(message)
 
     def StopRawData(self):
@@ -135,6 +313,7 @@ class WeArtClient:
         Stops the raw data collection from the device(s).
         """
         message = WeArtMessages.RawDataOff()
+        self.__rawDataOn = False
         self._sendMessage(message)
     
     def AddThimbleTracking(self, trackingObject: WeArtThimbleTrackingObject):
@@ -144,8 +323,8 @@ class WeArtClient:
         
         :param trackingObjects: The WeArtThimbleTrackingObject to add.
         """
+        self.__trackingRouter.AddThimbleTracking(trackingObject)
         self.__thimbleTrackingObjects.append(trackingObject)
-        self.AddMessageListener(trackingObject)
 
     def RemoveThimbleTracking(self, trackingObject: WeArtThimbleTrackingObject):
         """
@@ -156,6 +335,7 @@ class WeArtClient:
         """
         if trackingObject in self.__thimbleTrackingObjects:
             self.__thimbleTrackingObjects.remove(trackingObject)
+            self.__trackingRouter.RemoveThimbleTracking(trackingObject)
 
     def ThimbleTrackingObjectsSize(self):
         """
@@ -178,7 +358,7 @@ class WeArtClient:
 
         :param listener: The WeArtMessageListener to add.
         """
-        self.__messageListeners.append(listener)
+        self.__messageDispatcher.AddListener(listener)
 
     def RemoveMessageListener(self, listener: WeArtMessageListener):
         '''
@@ -186,8 +366,7 @@ class WeArtClient:
 
         :param listener: The WeArtMessageListener to remove.
         '''
-        if listener in self.__messageListeners:
-            self.__messageListeners.remove(listener)
+        self.__messageDispatcher.RemoveListener(listener)
 
     def AddConnectionStatusCallback(self, callback):
         '''
@@ -196,7 +375,7 @@ class WeArtClient:
 
         :param callback: The callback function to be called.
         '''
-        self.__connectionStatusCallbacks.append(callback)
+        self.__callbacks.AddConnectionStatusCallback(callback)
 
     def AddErrorCallback(self, callback):
         '''
@@ -205,87 +384,307 @@ class WeArtClient:
 
         :param callback: The callback function to be called.
         '''
-        self.__errorCallbacks.append(callback)
+        self.__callbacks.AddErrorCallback(callback)
+    
+    @contextmanager
+    def Batch(self):
+        """
+        Groups the messages sent by the calling thread into a single write.
+        Messages sent inside the block are serialized into one buffer, sent when the outermost block exits.
+        Messages sent by other threads are not affected.
+
+        Usage:
+            with client.Batch():
+                hapticObject1.AddEffect(effect)
+                hapticObject2.AddEffect(effect)
+        """
+        state = self.__batchState
+        depth = getattr(state, "depth", 0)
+        if depth == 0:
+            state.buffer = []
+        state.depth = depth + 1
+        try:
+            yield
+        finally:
+            state.depth = depth
+            if depth == 0:
+                buffer = state.buffer
+                state.buffer = None
+                if buffer and self.__Connected:
+                    self.__write(buffer)
     
     def _sendMessage(self, msg: WeArtMessages.WeArtMessage):
         """
         Sends a serialized message to the server.
+        Inside a Batch block, the message is appended to the batch and sent when the block exits.
+        When reconnect is enabled, haptic commands are recorded even while disconnected, to be sent on reconnection.
 
         :param msg: The message to be sent.
         """
-        if not self.__Connected:
-            return
         if msg == None:
             return
+        activeEffects = self.__activeEffects
+        if not self.__Connected and activeEffects is None:
+            return
         
-        text = msg.serialize()
-        text+= self.messagesSeparator
+        data = self._messageSerializer.Serialize(msg) + self._messageSeparator
+
+        target = HapticTarget(msg) if self.__sender is not None or activeEffects is not None else None
+        if activeEffects is not None and target is not None:
+            # The effect group of a target is the ID of its set message, see HapticTarget
+            if msg.getID() == target[0]:
+                activeEffects[target] = (target, data)
+            else:
+                activeEffects.pop(target, None)
+        if not self.__Connected:
+            return
 
-        self.__logger.debug(f"Message to be sent: { text }")
+        if self.__logger.isEnabledFor(logging.DEBUG):
+            self.__logger.debug(f"Message to be sent: { data.decode() }")
 
-        bytes = self.__s.send(text.encode())
-        if bytes == 0:
-            self.__Connected = False
-            self.__logger.error(f"Send message '{ text }' failed")
-            self.__s.close()
-            self.__NotifyError(self.ErrorType.SendMessageError)
-            self.__NotifyConnectionStatus(False)
+        item = (target, data)
+        buffer = getattr(self.__batchState, "buffer", None)
+        if buffer is not None:
+            buffer.append(item)
+            return
+        self.__write([item])
+
+    def __write(self, items: list):
+        """
+        Writes serialized messages to the socket, or queues them for the writer thread when async_send is enabled.
+        Safe to call from several threads: each call is written as a whole.
+
+        :param items: The (haptic target, serialized message) pairs, each message including the messages separator.
+        """
+        if self.__recorder is not None:
+            separatorSize = len(self._messageSeparator)
+            self.__recorder.Record(RecordDirection.SENT, [data[:-separatorSize] for _, data in items])
+        if self.__sender is not None:
+            self.__sender.Put(items)
             return
+        data = b''.join(data for _, data in items)
+        if self.__ioLoop is not None:
+            self.__Enqueue(data)
+            return
+        try:
+            with self.__sendLock:
+                self.__s.sendall(data)
+        except OSError as e:
+            self.__logger.error(f"Send message '{ data.decode() }' failed: { e }")
+            self.__OnSendError(e)
+
+    def __Enqueue(self, data: bytes):
+        """
+        Writes data to the non-blocking socket of the selector engine.
+        The data the socket cannot accept immediately is buffered and written by the loop when the socket becomes writable.
+
+        :param data: The serialized messages.
+        """
+        sock = self.__s
+        with self.__outputLock:
+            output = self.__output
+            if output:
+                # Written after the data already waiting, when the socket becomes writable
+                output += data
+                return
+            error = None
+            try:
+                n = sock.send(data)
+            except BlockingIOError:
+                # The socket buffer is full, all the data waits for the socket to become writable
+                n = 0
+            except OSError as e:
+                error = e
+            if error is None:
+                if n < len(data):
+                    output += memoryview(data)[n:]
+                    self.__ioLoop.Register(sock, lambda events: self.__OnReady(sock, events), EVENT_READ | EVENT_WRITE)
+                return
+        self.__logger.error(f"Send message '{ data.decode() }' failed: { error }")
+        self.__OnSendError(error)
+
+    def __OnReady(self, sock, events: int):
+        """
+        Handles the readiness of the socket of the selector engine, called from the loop thread.
+        """
+        if events & EVENT_WRITE:
+            self.__Flush(sock)
+        if events & EVENT_READ:
+            self.__Receive(sock)
 
-    def _OnReceive(self):
+    def __Flush(self, sock):
+        """
+        Writes the buffered data the socket can accept, and stops waiting for writability once everything has been written.
+        """
+        with self.__outputLock:
+            if sock is not self.__s:
+                return
+            output = self.__output
+            try:
+                n = sock.send(output)
+            except BlockingIOError:
+                return
+            except OSError as e:
+                error = e
+            else:
+                del output[:n]
+                if not output:
+                    self.__ioLoop.Register(sock, lambda events: self.__OnReady(sock, events), EVENT_READ)
+                return
+        self.__logger.error(f"Send failed: { error }")
+        self.__OnSendError(error)
+
+    def __FlushBeforeClosing(self, timeout: float = 1.0):
+        """
+        Writes the buffered data before the socket of the selector engine is closed.
+        """
+        with self.__outputLock:
+            if not self.__output:
+                return
+            try:
+                self.__s.settimeout(timeout)
+                self.__s.sendall(self.__output)
+            except OSError:
+                pass
+            self.__output.clear()
+
+    def __OnSendError(self, error: OSError):
+        """
+        Handles a failed write, closing the connection.
+        """
+        self.__OnConnectionLost(self.ErrorType.SendMessageError)
+
+    def __OnConnectionLost(self, errorType = None):
+        """
+        Closes a connection lost because of an error or closed by the server, then reconnects if enabled.
+        Only the first call for a connection has effect.
+
+        :param errorType: The :class:`ErrorType` to notify, if any.
+        """
+        with self.__connectionLock:
+            if not self.__Connected or self.__Closing:
+                return
+            self.__Connected = False
+        if self.__ioLoop is not None:
+            self.__ioLoop.Unregister(self.__s)
+        try:
+            # Wakes up the receive thread, if it is still waiting for data
+            self.__s.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.__s.close()
+        if self.__sender is not None:
+            self.__sender.Stop(0)
+        if errorType is not None:
+            self.__NotifyError(errorType)
+        self.__NotifyConnectionStatus(False)
+        if self.__reconnect:
+            self.__StartReconnecting()
+
+    def _OnReceive(self, sock = None):
         '''
         Handles incoming messages from the server.
+        Messages split across several reads are reassembled before being deserialized.
+
+        :param sock: The socket to read from (default is the current socket). The connection is only closed on errors
+            if the socket is still the current one, so a receive thread outliving its connection has no effect.
+        '''
+        if sock is None:
+            sock = self.__s
+        while self.__Receive(sock):
+            pass
+
+    def __Receive(self, sock) -> bool:
+        '''
+        Reads the available data once and forwards the messages completed by it.
+
+        :param sock: The socket to read from.
+        :return: False when the connection has been closed, True otherwise.
         '''
         try:
-            while True:
-                data = self.__s.recv(4096)
-                str_data = data.decode()
-                self.__logger.debug(f"Received: { str_data }")
-                strings = str_data.split(WeArtClient.messagesSeparator)
+            frames = self._messageFramer.readFrom(sock)
+            if frames is not None:
+                if frames and self.__recorder is not None:
+                    self.__recorder.Record(RecordDirection.RECEIVED, frames)
                 messages = []
-                for string in strings:
-                    messages.append(self._messageSerializer.Deserialize(string))
+                for frame in frames:
+                    if self.__logger.isEnabledFor(logging.DEBUG):
+                        self.__logger.debug(f"Received: { frame.decode() }")
+                    messages.append(self._messageSerializer.Deserialize(frame))
                 self.__ForwardingMessages(messages)
+                return True
+        except BlockingIOError:
+            # Spurious readiness of the non-blocking socket of the selector engine
+            return True
+        except OSError as e:
+            if not self.__Closing and sock is self.__s:
+                self.__logger.error(f"Receive failed: { e }")
+                self.__OnConnectionLost(self.ErrorType.ReceiveMessageError)
+            return False
         except Exception:
-            if not self.__Closing:
-                raise
+            # An unexpected error leaves the stream in an unknown state: close the connection, so that both engines
+            # report it and reconnect if enabled. Listener errors are handled by the message dispatcher.
+            if not self.__Closing and sock is self.__s:
+                self.__logger.exception("Receive failed")
+                self.__OnConnectionLost(self.ErrorType.ReceiveMessageError)
+            return False
+        
+        if not self.__Closing and sock is self.__s:
+            self.__logger.error("Connection closed by the server")
+            self.__OnConnectionLost()
+        return False
     
     def __ForwardingMessages(self, messages: list[WeArtMessages.WeArtMessage]):
         '''
-        Forwards messages to the message listener(s).
+        Forwards messages to the message listener(s). A failing listener is logged and does not stop the reception.
         '''
-        for msg in messages:
-            if msg == None:
-                continue
-            for listener in self.__messageListeners:
-                if (listener.accept(msg.getID())):
-                    listener.OnMessageReceived(msg)
+        self.__messageDispatcher.Forward(messages)
     
+    @staticmethod
+    def __ResolveCallbackExecutor(callback_executor):
+        '''
+        Returns the executor running the callbacks, None to run them inline.
+        '''
+        if callback_executor is None:
+            return _SharedCallbackExecutor()
+        if callback_executor == "inline":
+            return None
+        if not callable(getattr(callback_executor, "submit", None)):
+            raise ValueError(f"callback_executor must be None, \"inline\" or an executor, got { callback_executor !r}")
+        return callback_executor
+
     def __NotifyConnectionStatus(self, connected: bool):
         '''
         Notifies the connection status to the connection status callback(s).
         '''
-        for callback in self.__connectionStatusCallbacks:
-            t = Thread(target=callback, args = [connected])
-            t.start()
-            self.__pendingCallbacks.append(t)
-        self.__ClearProcessedCallbacks()
+        self.__callbacks.NotifyConnectionStatus(connected)
     
     def __NotifyError(self, errorType: ErrorType):
         '''
         Notifies the error to the error callback(s).
         '''
-        for callback in self.__errorCallbacks:
-            t = Thread(target=callback, args = [errorType])
-            t.start()
-            self.__pendingCallbacks.append(t)
-        self.__ClearProcessedCallbacks()
-    
-    def __ClearProcessedCallbacks(self):
-        ''''
-        Clears the processed callbacks.
+        self.__callbacks.NotifyError(errorType)
+
+    def __RunCallbacks(self, callbacks: list, arg):
+        '''
+        Runs the callbacks on the callback executor and waits for them to complete, so that notifications are delivered in order.
+        Notifications raised from inside a callback, e.g. a callback closing the client, are run inline,
+        so a callback never waits for the executor running it.
         '''
-        for t in self.__pendingCallbacks:
-            t.join()
+        executor = self.__callbackExecutor
+        if executor is None or getattr(_callbackThread, "active", False):
+            for callback in callbacks:
+                self.__RunCallback(callback, arg)
+            return
+        pendingCallbacks = [executor.submit(self.__RunCallback, callback, arg) for callback in callbacks]
+        wait(pendingCallbacks)
+
+    def __RunCallback(self, callback, arg):
+        active = getattr(_callbackThread, "active", False)
+        _callbackThread.active = True
+        try:
+            self.__callbacks.Call(callback, arg)
+        finally:
+            _callbackThread.active = active
 
 __all__ = ['WeArtClient']
\ No newline at end of file
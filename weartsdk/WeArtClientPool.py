@@ -0,0 +1,179 @@
+import logging
+
+from .WeArtClient import WeArtClient
+from .WeArtJsonCodec import GetJsonCodec
+from .WeArtMessageListener import WeArtMessageListener
+from .WeArtSelectorLoop import WeArtSelectorLoop
+
+class WeArtClientPool:
+    """
+    Manages the connections to many Middleware or WeArtApp endpoints from a single process.
+
+    The clients use the selector I/O engine with a single loop: one I/O thread reads and writes the
+    sockets of all the clients, instead of a receive thread per client, and all the clients share the
+    same JSON codec.
+    Each client is a regular WeArtClient, so listeners, tracking objects and haptic objects are
+    registered on the client of the endpoint they belong to.
+
+    Usage:
+        pool = WeArtClientPool(reconnect = True)
+        rig1 = pool.AddClient("192.168.1.10", WeArtCommon.DEFAULT_TCP_PORT)
+        rig2 = pool.AddClient("192.168.1.11", WeArtCommon.DEFAULT_TCP_PORT)
+        rig1.AddMessageListener(MiddlewareStatusListener())
+        pool.Run()
+        pool.Start()
+
+    Attributes:
+        __clients (dict): The clients, by (ip address, port) endpoint.
+        __ioLoop (WeArtSelectorLoop): The I/O loop receiving the messages of all the clients.
+    """
+    def __init__(self, log_level = logging.DEBUG, json_codec = None, **client_options):
+        """
+        Initializes a WeArtClientPool.
+
+        Parameters:
+            log_level (int): The logging level of the clients (default is logging.DEBUG).
+            json_codec (str | WeArtJsonCodec): The JSON codec shared by the clients, see WeArtClient (default is the fastest installed codec).
+            **client_options: Options given to each WeArtClient, e.g. reconnect or recv_buffer_size.
+        """
+        self.__logLevel = log_level
+        self.__codec = GetJsonCodec(json_codec)
+        self.__clientOptions = client_options
+        self.__clients = {}
+        self.__ioLoop = WeArtSelectorLoop()
+        self.__running = False
+
+    def AddClient(self, ip_address, port, **client_options) -> WeArtClient:
+        """
+        Creates the client of an endpoint. The client is connected by Run, or immediately if the pool is already running.
+
+        Parameters:
+            ip_address (str): The IP address of the endpoint.
+            port (int): The port of the endpoint.
+            **client_options: Options given to this client, overriding the options of the pool.
+
+        Returns:
+            WeArtClient: The client of the endpoint.
+
+        Raises:
+            ValueError: If the pool already has a client for the endpoint.
+            OSError: If the pool is running and the client cannot connect, unless reconnect is enabled.
+        """
+        endpoint = (ip_address, port)
+        if endpoint in self.__clients:
+            raise ValueError(f"The pool already has a client for { endpoint }")
+        options = dict(self.__clientOptions, **client_options)
+        client = WeArtClient(ip_address, port, log_level = self.__logLevel, json_codec = self.__codec, io_loop = self.__ioLoop, **options)
+        self.__clients[endpoint] = client
+        if self.__running:
+            client.Run()
+        return client
+
+    def RemoveClient(self, client: WeArtClient):
+        """
+        Closes the client of an endpoint and removes it from the pool.
+
+        Parameters:
+            client (WeArtClient): The client to remove.
+        """
+        for endpoint, c in list(self.__clients.items()):
+            if c is client:
+                del self.__clients[endpoint]
+                client.Close()
+                return
+
+    def GetClient(self, ip_address, port) -> WeArtClient:
+        """
+        Returns the client of an endpoint.
+
+        Parameters:
+            ip_address (str): The IP address of the endpoint.
+            port (int): The port of the endpoint.
+
+        Returns:
+            WeArtClient: The client of the endpoint, or None if the pool has no client for it.
+        """
+        return self.__clients.get((ip_address, port))
+
+    def Clients(self) -> list:
+        """
+        Returns the clients of the pool.
+
+        Returns:
+            list[WeArtClient]: The clients, in the order they were added.
+        """
+        return list(self.__clients.values())
+
+    def AddMessageListener(self, listener: WeArtMessageListener, ip_address = None, port = None):
+        """
+        Adds a message listener to the client of an endpoint, or to all the clients if no endpoint is given.
+
+        Parameters:
+            listener (WeArtMessageListener): The listener to add.
+            ip_address (str): The IP address of the endpoint.
+            port (int): The port of the endpoint.
+        """
+        for client in self.__Select(ip_address, port):
+            client.AddMessageListener(listener)
+
+    def RemoveMessageListener(self, listener: WeArtMessageListener, ip_address = None, port = None):
+        """
+        Removes a message listener from the client of an endpoint, or from all the clients if no endpoint is given.
+
+        Parameters:
+            listener (WeArtMessageListener): The listener to remove.
+            ip_address (str): The IP address of the endpoint.
+            port (int): The port of the endpoint.
+        """
+        for client in self.__Select(ip_address, port):
+            client.RemoveMessageListener(listener)
+
+    def Run(self) -> list:
+        """
+        Starts the I/O thread and connects all the clients.
+
+        Returns:
+            list[WeArtClient]: The clients that could not connect. Clients with reconnect enabled keep trying in the background.
+        """
+        self.__ioLoop.Start()
+        self.__running = True
+        failed = []
+        for client in self.Clients():
+            try:
+                client.Run()
+            except OSError:
+                failed.append(client)
+        return failed
+
+    def Start(self, **start_options):
+        """
+        Starts the device(s) of all the connected endpoints, see WeArtClient.Start.
+        """
+        for client in self.Clients():
+            client.Start(**start_options)
+
+    def Stop(self):
+        """
+        Stops the device(s) of all the connected endpoints.
+        """
+        for client in self.Clients():
+            client.Stop()
+
+    def Close(self):
+        """
+        Closes all the clients and stops the I/O thread.
+        """
+        self.__running = False
+        for client in self.Clients():
+            client.Close()
+        self.__ioLoop.Stop()
+
+    def __Select(self, ip_address, port) -> list:
+        if ip_address is None and port is None:
+            return self.Clients()
+        client = self.__clients.get((ip_address, port))
+        if client is None:
+            raise ValueError(f"The pool has no client for { (ip_address, port) }")
+        return [client]
+
+__all__ = ['WeArtClientPool']
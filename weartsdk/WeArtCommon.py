@@ -1,6 +1,7 @@
 from enum import IntFlag
 from dataclasses import dataclass, field
 import dataclasses
+import typing
 from typing import List
 from datetime import datetime
 
@@ -481,14 +482,13 @@ def dataclass_from_list(klass, l):
     Returns:
         list: A list of dataclass instances created from the dictionaries.
     """
-	ret = []
-	for elem in l:
-		ret.append(dataclass_from_dict(klass, elem))
-	return ret
+	decoder = dataclass_decoder(klass)
+	return [decoder(elem) for elem in l]
 
 def dataclass_from_dict(klass, d):
 	"""
     Converts a dictionary into a dataclass instance of the specified class.
+	Fields missing from the dictionary are set to None.
 
     Args:
         klass (type): The class type to convert the dictionary into.
@@ -497,58 +497,98 @@ def dataclass_from_dict(klass, d):
     Returns:
         object: An instance of the specified class populated with data from the dictionary.
     """
-	# If type of class is a dataclass, proceed with deserialization
+	return dataclass_decoder(klass)(d)
+
+# Decoders built by dataclass_decoder, by class
+_decoders = {}
+
+def dataclass_decoder(klass):
+	"""
+    Returns the decoder converting deserialized JSON values into instances of the specified class.
+
+	The decoder is built on first use and cached, so that field types are inspected once per class
+	instead of once per decoded object.
+
+    Args:
+        klass (type): The class type to decode (dataclass, enum, datetime, List[...] or plain type).
+
+    Returns:
+        Callable[[object], object]: A function converting a deserialized JSON value into an instance of klass.
+    """
+	decoder = _decoders.get(klass)
+	if decoder is None:
+		decoder = _build_decoder(klass)
+		_decoders[klass] = decoder
+	return decoder
+
+def _decode_identity(value):
+	return value
+
+def _decode_datetime(value):
+	if value is None:
+		return None
+	# Expect ISO 8601 string (C# DateTime style)
+	return datetime.fromisoformat(value.replace("Z", "+00:00") if isinstance(value, str) else value)
+
+def _build_enum_decoder(klass, capitalize: bool):
+	# Lookup table with the wire forms used by the Middleware and the WeArtApp (e.g. "THUMB", "Thumb", "thumb")
+	table = {}
+	for member in klass:
+		for name in (member.name, member.name.upper(), member.name.lower(), member.name.capitalize()):
+			table[name] = member
+
+	def decode(value):
+		member = table.get(value)
+		if member is not None or value is None:
+			return member
+		return klass[str(value).capitalize() if capitalize else value]
+	return decode
+
+def _build_list_decoder(klass):
+	decodeItem = dataclass_decoder(typing.get_args(klass)[0])
+
+	def decode(value):
+		if isinstance(value, list):
+			return [decodeItem(elem) for elem in value]
+		return value
+	return decode
+
+def _build_dataclass_decoder(klass):
+	# Generate a function passing each known key straight to the constructor, e.g.
+	#   def decode(d):
+	#       return klass(macAddress=d.get('macAddress'), handSide=_decode_1(d['handSide']) if 'handSide' in d else None, ...)
+	namespace = {"klass": klass}
+	args = []
+	for i, f in enumerate(dataclasses.fields(klass)):
+		if not f.init:
+			continue
+		fieldDecoder = dataclass_decoder(f.type)
+		if fieldDecoder is _decode_identity:
+			args.append(f"{f.name}=d.get({f.name!r})")
+		else:
+			namespace[f"_decode_{i}"] = fieldDecoder
+			args.append(f"{f.name}=_decode_{i}(d[{f.name!r}]) if {f.name!r} in d else None")
+	source = "def decode(d):\n"
+	source += "\tif d is None:\n\t\treturn None\n"
+	source += f"\treturn klass({', '.join(args)})\n"
+	exec(source, namespace)
+	decode = namespace["decode"]
+	decode.__qualname__ = f"dataclass_decoder.<{klass.__name__}>"
+	return decode
+
+def _build_decoder(klass):
 	if dataclasses.is_dataclass(klass):
-		# Get the field types for the dataclass
-		fieldtypes = {f.name: f.type for f in dataclasses.fields(klass)}
-		data = {}
-        
-		for f in fieldtypes:
-			# If the field exists in the dictionary, proceed with deserialization
-			if f in d:
-				if isinstance(d[f], list):
-					# If the field is a list, recursively deserialize its elements
-					data[f] = dataclass_from_list(fieldtypes[f].__args__[0], d[f])
-				else:
-					# Recursively deserialize fields that are not "special" types
-					data[f] = dataclass_from_dict(fieldtypes[f], d[f])
-			else:
-				# If the field does not exist in the dictionary, assign a default value
-				if klass == MiddlewareStatus:
-					if f == 'connectionType':
-						data[f] = 'BLE'
-					elif f == 'autoconnection':
-						data[f] = False
-					elif f == 'trackingPlayback':
-						data[f] = False
-					elif f == 'rawDataLog':
-						data[f] = False
-					elif f == 'sensorOnMask':
-						data[f] = False
-					else:
-						data[f] = None
-				else:
-					data[f] = None
-
-		# Create the dataclass instance with the deserialized data
-		k = klass(**data)
-		return k
-	else:
-		# If the type of class is a dataclass, proceed with deserialization
-		if klass == MiddlewareStatus:
-			return MiddlewareStatus[d]
-		if klass == ActuationPoint:
-			return ActuationPoint[str(d).capitalize()]
-		if klass == HandSide:
-			return HandSide[str(d).capitalize()]
-		if klass == List[ThimbleStatus]:
-			return dataclass_from_list(ThimbleStatus, d)
-		if klass is datetime:
-			# Expect ISO 8601 string (C# DateTime style)
-			return datetime.fromisoformat(d.replace("Z", "+00:00") if isinstance(d, str) else d)
-		
-		# If the type of class is not a dataclass, return the dictionary
-		return d
+		return _build_dataclass_decoder(klass)
+	if typing.get_origin(klass) is list:
+		return _build_list_decoder(klass)
+	if klass is MiddlewareStatus:
+		return _build_enum_decoder(klass, capitalize = False)
+	if klass is ActuationPoint or klass is HandSide:
+		return _build_enum_decoder(klass, capitalize = True)
+	if klass is datetime:
+		return _decode_datetime
+	# If the type of class is not a special type, return the value as it is
+	return _decode_identity
 
 def dict_from_dataclass(k):
 	"""
@@ -573,6 +613,10 @@ def dict_from_dataclass(k):
 
 
 
+# Hand sides and actuation points, in the order used by per-thimble tables
+HAND_SIDES = (HandSide.Left, HandSide.Right)
+ACTUATION_POINTS = (ActuationPoint.Thumb, ActuationPoint.Index, ActuationPoint.Middle, ActuationPoint.Annular, ActuationPoint.Pinky, ActuationPoint.Palm)
+
 DEFAULT_IP_ADDRESS = "127.0.0.1"
 DEFAULT_TCP_PORT = 13031
 
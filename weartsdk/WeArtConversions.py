@@ -0,0 +1,127 @@
+from .WeArtCommon import TrackingType, HandSide, ActuationPoint
+
+# Wire strings of the enums, in both directions. The string tables also accept the lower case and
+# capitalized forms (e.g. "INDEX", "index", "Index") used by the JSON payloads.
+
+_TRACKING_TYPE_STRINGS = {
+    TrackingType.DEFAULT:       "",
+    TrackingType.WEART_HAND:    "TrackType1",
+}
+
+_HAND_SIDE_STRINGS = {
+    HandSide.Left:  "LEFT",
+    HandSide.Right: "RIGHT",
+}
+
+_ACTUATION_POINT_STRINGS = {
+    ActuationPoint.Thumb:   "THUMB",
+    ActuationPoint.Index:   "INDEX",
+    ActuationPoint.Middle:  "MIDDLE",
+    ActuationPoint.Annular: "ANNULAR",
+    ActuationPoint.Pinky:   "PINKY",
+    ActuationPoint.Palm:    "PALM",
+}
+
+_CALIBRATION_HAND_SIDE_STRINGS = {
+    HandSide.Left:  "0",
+    HandSide.Right: "1",
+}
+
+def _Reverse(strings: dict) -> dict:
+    table = {}
+    for member, string in strings.items():
+        for form in (string, string.lower(), string.capitalize()):
+            table[form] = member
+    return table
+
+_STRING_TRACKING_TYPES = _Reverse(_TRACKING_TYPE_STRINGS)
+_STRING_HAND_SIDES = _Reverse(_HAND_SIDE_STRINGS)
+_STRING_ACTUATION_POINTS = _Reverse(_ACTUATION_POINT_STRINGS)
+_STRING_CALIBRATION_HAND_SIDES = _Reverse(_CALIBRATION_HAND_SIDE_STRINGS)
+
+def StringToTrackingType(string: str) -> TrackingType:
+    """
+    Returns the tracking type of a wire string, TrackingType.DEFAULT if the string is unknown.
+    """
+    return _STRING_TRACKING_TYPES.get(string, TrackingType.DEFAULT)
+
+def TrackingTypeToString(trackType: TrackingType) -> str:
+    """
+    Returns the wire string of a tracking type, an empty string for the default or unknown tracking types.
+    """
+    return _TRACKING_TYPE_STRINGS.get(trackType, "")
+
+def StringToHandside(string: str) -> HandSide:
+    """
+    Returns the hand side of a wire string ("LEFT", "RIGHT", in upper, lower or capitalized form).
+
+    Raises:
+        ValueError: If the string is not a hand side.
+    """
+    try:
+        return _STRING_HAND_SIDES[string]
+    except (KeyError, TypeError):
+        raise ValueError(f"Unknown hand side '{ string }'") from None
+
+def HandsideToString(hs: HandSide) -> str:
+    """
+    Returns the wire string of a hand side.
+
+    Raises:
+        ValueError: If the value is not a single hand side.
+    """
+    try:
+        return _HAND_SIDE_STRINGS[hs]
+    except (KeyError, TypeError):
+        raise ValueError(f"Invalid hand side { hs !r}") from None
+
+def StringToActuationPoint(string: str) -> ActuationPoint:
+    """
+    Returns the actuation point of a wire string ("THUMB", "INDEX", ..., in upper, lower or capitalized form).
+
+    Raises:
+        ValueError: If the string is not an actuation point.
+    """
+    try:
+        return _STRING_ACTUATION_POINTS[string]
+    except (KeyError, TypeError):
+        raise ValueError(f"Unknown actuation point '{ string }'") from None
+
+def ActuationPointToString(ap: ActuationPoint) -> str:
+    """
+    Returns the wire string of an actuation point.
+
+    Raises:
+        ValueError: If the value is not a single actuation point.
+    """
+    try:
+        return _ACTUATION_POINT_STRINGS[ap]
+    except (KeyError, TypeError):
+        raise ValueError(f"Invalid actuation point { ap !r}") from None
+
+def CalibrationHandSideToString(hs: HandSide) -> str:
+    """
+    Returns the wire string of a hand side in calibration messages ("0" for left, "1" for right).
+
+    Raises:
+        ValueError: If the value is not a single hand side.
+    """
+    try:
+        return _CALIBRATION_HAND_SIDE_STRINGS[hs]
+    except (KeyError, TypeError):
+        raise ValueError(f"Invalid hand side { hs !r}") from None
+
+def StringToCalibrationHandSide(string: str) -> HandSide:
+    """
+    Returns the hand side of a wire string in calibration messages.
+
+    Raises:
+        ValueError: If the string is not "0" or "1".
+    """
+    try:
+        return _STRING_CALIBRATION_HAND_SIDES[string]
+    except (KeyError, TypeError):
+        raise ValueError(f"Unknown calibration hand side '{ string }'") from None
+
+__all__ = ['StringToTrackingType', 'TrackingTypeToString', 'StringToHandside', 'HandsideToString', 'StringToActuationPoint',
+           'ActuationPointToString', 'CalibrationHandSideToString', 'StringToCalibrationHandSide']
@@ -0,0 +1,137 @@
+from threading import Thread, Condition, Lock
+import copy
+import time
+
+from .WeArtClient import WeArtClient
+from .WeArtMessages import WeArtMessage
+from .WeArtMessageSender import HapticTarget
+
+class WeArtHapticCoalescer:
+    """
+    Sits between haptic objects and a client, keeping only the newest pending temperature, force and texture
+    command for each thimble and sending the pending commands at most max_rate times per second.
+
+    A command replaces the pending command of the same effect and thimble, including the stop command
+    of that effect (e.g. a stopForce replaces a pending force). Commands are sent at most one flush interval
+    after being received. Messages that are not haptic commands are sent immediately.
+
+    Pending commands are sent from a background thread while the application keeps sending from its own threads.
+    This is safe with every I/O engine, since the client writes each message or batch as a whole.
+
+    The coalescer can be given to WeArtHapticObject in place of the client:
+        coalescer = WeArtHapticCoalescer(client, max_rate = 100)
+        hapticObject = WeArtHapticObject(coalescer)
+
+    Attributes:
+        __client (WeArtClient): The client used to send the commands.
+        __interval (float): The minimum time between two flushes, in seconds.
+        __pending (dict): The pending commands, by haptic target.
+    """
+    def __init__(self, client: WeArtClient, max_rate: float = 100.0):
+        """
+        Initializes a WeArtHapticCoalescer.
+
+        Parameters:
+            client (WeArtClient): The client used to send the commands.
+            max_rate (float): The maximum number of flushes per second (default is 100).
+        """
+        if max_rate <= 0:
+            raise ValueError(f"max_rate must be positive, got { max_rate }")
+        self.__client = client
+        self.__interval = 1.0 / max_rate
+        self.__pending = {}
+        self.__condition = Condition()
+        # Held from taking the pending commands until they are sent, so batches are sent in the order they are taken
+        self.__sendLock = Lock()
+        self.__lastFlush = 0.0
+        self.__running = False
+        self.__thread = None
+
+    def Batch(self):
+        """
+        Groups the messages that are not haptic commands into a single write, see WeArtClient.Batch.
+        Haptic commands are always grouped by the coalescer.
+        """
+        return self.__client.Batch()
+
+    def _sendMessage(self, msg: WeArtMessage):
+        """
+        Queues a haptic command, replacing the pending command for the same effect and thimble,
+        or sends the message immediately if it is not a haptic command.
+
+        Parameters:
+            msg (WeArtMessage): The message to send.
+        """
+        if msg == None:
+            return
+        target = HapticTarget(msg)
+        if target is None:
+            self.__client._sendMessage(msg)
+            return
+        # Haptic objects reuse the same message for all their thimbles, so keep a copy
+        msg = copy.copy(msg)
+        with self.__condition:
+            self.__pending[target] = msg
+            if not self.__running:
+                self.__running = True
+                self.__thread = Thread(target=self.__Run, daemon=True)
+                self.__thread.start()
+            self.__condition.notify()
+
+    def Flush(self):
+        """
+        Sends the pending commands immediately.
+        """
+        with self.__sendLock:
+            with self.__condition:
+                pending = self.__TakePending()
+            self.__Send(pending)
+
+    def Close(self):
+        """
+        Sends the pending commands and stops the flushing thread.
+        """
+        with self.__condition:
+            self.__running = False
+            self.__condition.notify()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+        self.Flush()
+
+    def PendingCommands(self) -> int:
+        """
+        Returns the number of commands waiting to be sent.
+
+        Returns:
+            int: The number of pending commands.
+        """
+        return len(self.__pending)
+
+    def __TakePending(self) -> list:
+        pending = list(self.__pending.values())
+        self.__pending.clear()
+        self.__lastFlush = time.monotonic()
+        return pending
+
+    def __Send(self, pending: list):
+        if not pending:
+            return
+        with self.__client.Batch():
+            for msg in pending:
+                self.__client._sendMessage(msg)
+
+    def __Run(self):
+        while True:
+            with self.__condition:
+                while not self.__pending and self.__running:
+                    self.__condition.wait()
+                if not self.__running:
+                    return
+                delay = self.__lastFlush + self.__interval - time.monotonic()
+                if delay > 0:
+                    self.__condition.wait(delay)
+                    continue
+            self.Flush()
+
+__all__ = ["WeArtHapticCoalescer"]
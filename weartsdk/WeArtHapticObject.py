@@ -42,6 +42,9 @@ class WeArtHapticObject:
         SendMessage(self, msg: WeArtMessage):
             Sends the specified message to the client, associating it with the correct hand side and actuation point 
             based on the flags.
+
+    All the messages produced by a single UpdateEffects or SendMessage call are sent with a single write,
+    using WeArtClient.Batch.
     """
     def __init__(self, client: WeArtClient):
         """
@@ -101,6 +104,10 @@ class WeArtHapticObject:
         (SetTemperatureMessage, SetForceMessage, SetTextureMessage) to update the haptic object, or stops the effect 
         if there are no active effects.
         """
+        with self.__client.Batch():
+            self.__UpdateEffects()
+
+    def __UpdateEffects(self):
         if len(self.activeEffects) == 0:
             self.weArtForce = WeArtForce(active = False, force = WeArtCommon.defaultForce)
             self.weArtTemperature = WeArtTemperature()
@@ -184,14 +191,13 @@ class WeArtHapticObject:
         Parameters:
             msg (WeArtMessage): The message to be sent to the client.
         """
-        hand_sides = [HandSide.Left, HandSide.Right]
-        actuation_points = [ActuationPoint.Thumb, ActuationPoint.Index, ActuationPoint.Middle, ActuationPoint.Annular, ActuationPoint.Pinky, ActuationPoint.Palm]
-        for hs in hand_sides:
-            if hs & self.handSideFlag:
-                for ap in actuation_points:
-                    if ap & self.actuationPointFlag:
-                        msg.setHandSide(hs)
-                        msg.setActuationPoint(ap)
-                        self.__client._sendMessage(msg)
+        with self.__client.Batch():
+            for hs in WeArtCommon.HAND_SIDES:
+                if hs & self.handSideFlag:
+                    for ap in WeArtCommon.ACTUATION_POINTS:
+                        if ap & self.actuationPointFlag:
+                            msg.setHandSide(hs)
+                            msg.setActuationPoint(ap)
+                            self.__client._sendMessage(msg)
 
 __all__ = ['WeArtHapticObject']
@@ -0,0 +1,139 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+class WeArtJsonCodec:
+    """
+    Base class for the JSON codecs used to encode and decode JSON messages.
+
+    Codecs work on bytes, so that messages can be decoded straight from the socket buffer
+    and encoded straight to it, without intermediate str conversions.
+
+    Attributes:
+        name (str): The name of the codec.
+        decodeErrors (tuple): The exceptions raised by loads on malformed input.
+    """
+    name = "json"
+    decodeErrors = (ValueError,)
+
+    def loads(self, data):
+        """
+        Decodes a JSON document.
+
+        Parameters:
+            data (bytes | str): The JSON document.
+
+        Returns:
+            object: The decoded document.
+        """
+        return json.loads(data)
+
+    def dumps(self, obj) -> bytes:
+        """
+        Encodes an object as a JSON document.
+
+        Parameters:
+            obj (object): The object to encode.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON document.
+        """
+        return json.dumps(obj).encode()
+
+class OrjsonCodec(WeArtJsonCodec):
+    """
+    JSON codec based on orjson.
+    """
+    name = "orjson"
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+    def dumps(self, obj) -> bytes:
+        return orjson.dumps(obj)
+
+class MsgspecCodec(WeArtJsonCodec):
+    """
+    JSON codec based on msgspec.
+    """
+    name = "msgspec"
+
+    def __init__(self):
+        self.decodeErrors = (msgspec.DecodeError, ValueError)
+        self.__decoder = msgspec.json.Decoder()
+        self.__encoder = msgspec.json.Encoder()
+
+    def loads(self, data):
+        return self.__decoder.decode(data)
+
+    def dumps(self, obj) -> bytes:
+        return self.__encoder.encode(obj)
+
+class UjsonCodec(WeArtJsonCodec):
+    """
+    JSON codec based on ujson.
+    """
+    name = "ujson"
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+    def dumps(self, obj) -> bytes:
+        return ujson.dumps(obj).encode()
+
+_CODECS = {
+    WeArtJsonCodec.name:    (WeArtJsonCodec, json),
+    OrjsonCodec.name:       (OrjsonCodec, orjson),
+    MsgspecCodec.name:      (MsgspecCodec, msgspec),
+    UjsonCodec.name:        (UjsonCodec, ujson),
+}
+
+# Codecs tried, in order, when no codec is explicitly requested
+_PREFERRED_CODECS = [OrjsonCodec.name, MsgspecCodec.name, UjsonCodec.name, WeArtJsonCodec.name]
+
+def AvailableJsonCodecs() -> list:
+    """
+    Returns the names of the JSON codecs whose backend is installed.
+
+    Returns:
+        list[str]: The available codec names, from the fastest to the slowest.
+    """
+    return [name for name in _PREFERRED_CODECS if _CODECS[name][1] is not None]
+
+def GetJsonCodec(codec = None) -> WeArtJsonCodec:
+    """
+    Returns a JSON codec.
+
+    Parameters:
+        codec (str | WeArtJsonCodec): The codec instance or the name of the codec ("json", "orjson", "msgspec", "ujson").
+            If None or "auto", the fastest installed codec is used.
+
+    Returns:
+        WeArtJsonCodec: The requested codec.
+
+    Raises:
+        ValueError: If the codec is unknown or its backend is not installed.
+    """
+    if isinstance(codec, WeArtJsonCodec):
+        return codec
+    if codec is None or codec == "auto":
+        codec = AvailableJsonCodecs()[0]
+    if codec not in _CODECS:
+        raise ValueError(f"Unknown JSON codec '{ codec }', expected one of { list(_CODECS) }")
+    codecClass, backend = _CODECS[codec]
+    if backend is None:
+        raise ValueError(f"JSON codec '{ codec }' is not installed")
+    return codecClass()
@@ -0,0 +1,158 @@
+from .WeArtMessageListener import WeArtMessageListener
+
+class WeArtMessageDispatcher:
+    """
+    Keeps the message listeners of a client and forwards the received messages to them.
+
+    Listeners are indexed by accepted message ID, so each message only reaches the listeners accepting it.
+    A listener raising an exception is logged; the other listeners and the following messages are not affected.
+
+    Attributes:
+        __listeners (list): The listeners, in the order they were added.
+        __listenersById (dict): For each message ID, a tuple of the listeners accepting it.
+    """
+    def __init__(self, logger):
+        """
+        Initializes a WeArtMessageDispatcher.
+
+        Parameters:
+            logger (logging.Logger): The logger reporting the listener errors.
+        """
+        self.__listeners = []
+        self.__listenersById = {}
+        self.__logger = logger
+
+    def AddListener(self, listener: WeArtMessageListener):
+        """
+        Adds a message listener.
+
+        Parameters:
+            listener (WeArtMessageListener): The listener to add.
+        """
+        self.__listeners.append(listener)
+        self.__UpdateIndex()
+
+    def RemoveListener(self, listener: WeArtMessageListener):
+        """
+        Removes a message listener, if present.
+
+        Parameters:
+            listener (WeArtMessageListener): The listener to remove.
+        """
+        if listener in self.__listeners:
+            self.__listeners.remove(listener)
+            self.__UpdateIndex()
+
+    def Forward(self, messages: list):
+        """
+        Forwards messages to the listeners accepting them.
+
+        Parameters:
+            messages (list[WeArtMessage]): The messages, None for the frames that could not be deserialized.
+        """
+        listenersById = self.__listenersById
+        for msg in messages:
+            if msg is None:
+                continue
+            for listener in listenersById.get(msg.getID(), ()):
+                try:
+                    listener.OnMessageReceived(msg)
+                except Exception:
+                    self.__logger.exception(f"Listener { type(listener).__name__ } failed")
+
+    def __UpdateIndex(self):
+        # Rebuilt when listeners change, read without locking by the receiving thread
+        index = {}
+        for listener in self.__listeners:
+            for id in listener.acceptedIds():
+                index.setdefault(id, []).append(listener)
+        self.__listenersById = {id: tuple(listeners) for id, listeners in index.items()}
+
+class WeArtCallbackDispatcher:
+    """
+    Keeps the connection status and error callbacks of a client and notifies them.
+
+    Callbacks are run inline by default. Clients running them elsewhere, e.g. on an executor or as asyncio tasks,
+    give a function running a list of callbacks, which calls each of them through Call.
+
+    Attributes:
+        __connectionStatusCallbacks (list): The callbacks called with the connection status.
+        __errorCallbacks (list): The callbacks called with the error type.
+    """
+    def __init__(self, logger, runCallbacks = None):
+        """
+        Initializes a WeArtCallbackDispatcher.
+
+        Parameters:
+            logger (logging.Logger): The logger reporting the callback errors.
+            runCallbacks (Callable[[list, object], None]): Function running the given callbacks with an argument
+                (default runs them inline, in order).
+        """
+        self.__connectionStatusCallbacks = []
+        self.__errorCallbacks = []
+        self.__logger = logger
+        self.__runCallbacks = runCallbacks if runCallbacks is not None else self.RunInline
+
+    def AddConnectionStatusCallback(self, callback):
+        """
+        Adds a callback called with True when connected, False when disconnected.
+
+        Parameters:
+            callback (Callable[[bool], None]): The callback to add.
+        """
+        self.__connectionStatusCallbacks.append(callback)
+
+    def AddErrorCallback(self, callback):
+        """
+        Adds a callback called with the type of the errors.
+
+        Parameters:
+            callback (Callable[[WeArtClient.ErrorType], None]): The callback to add.
+        """
+        self.__errorCallbacks.append(callback)
+
+    def NotifyConnectionStatus(self, connected: bool):
+        """
+        Notifies the connection status to the connection status callbacks.
+
+        Parameters:
+            connected (bool): True if connected, False otherwise.
+        """
+        self.__runCallbacks(self.__connectionStatusCallbacks, connected)
+
+    def NotifyError(self, errorType):
+        """
+        Notifies an error to the error callbacks.
+
+        Parameters:
+            errorType (WeArtClient.ErrorType): The type of the error.
+        """
+        self.__runCallbacks(self.__errorCallbacks, errorType)
+
+    def RunInline(self, callbacks: list, arg):
+        """
+        Runs callbacks in the calling thread, in order.
+
+        Parameters:
+            callbacks (list): The callbacks to run.
+            arg: The argument of the callbacks.
+        """
+        for callback in callbacks:
+            self.Call(callback, arg)
+
+    def Call(self, callback, arg):
+        """
+        Calls a callback, logging the exception it raises.
+
+        Parameters:
+            callback (Callable): The callback to call.
+            arg: The argument of the callback.
+
+        Returns:
+            The result of the callback, None if it raised an exception.
+        """
+        try:
+            return callback(arg)
+        except Exception:
+            self.__logger.exception("Callback failed")
+            return None
@@ -0,0 +1,119 @@
+class WeArtMessageFramer:
+    """
+    Incremental framer for the '~' delimited stream sent by the Middleware or WeArtApp.
+
+    TCP does not preserve message boundaries, so a single read can end in the middle of a message.
+    The framer keeps the incomplete tail of the stream in a carry-over buffer and only returns
+    frames that have been fully received.
+
+    A frame growing past the maximum frame size without being completed, e.g. because the peer never sends
+    the separator, is dropped up to the next separator, so the carry-over buffer stays bounded.
+
+    Attributes:
+        _separator (bytes): The byte sequence delimiting two messages.
+        _pending (bytearray): The bytes received after the last complete frame.
+        _maxFrameSize (int): The size above which an incomplete frame is dropped.
+        _discarding (bool): Whether the bytes up to the next separator belong to a dropped frame.
+        _droppedFrames (int): The number of frames dropped for being too large.
+        _readBuffer (bytearray): Preallocated buffer used to read from the socket.
+        _readView (memoryview): View over the read buffer, used to avoid per-read allocations.
+    """
+    def __init__(self, separator: bytes = b'~', bufferSize: int = 4096, maxFrameSize: int = 1024 * 1024):
+        """
+        Initializes a WeArtMessageFramer.
+
+        Parameters:
+            separator (bytes): The byte sequence delimiting two messages.
+            bufferSize (int): The size of the buffer used to read from the socket.
+            maxFrameSize (int): The size above which an incomplete frame is dropped.
+
+        Raises:
+            ValueError: If maxFrameSize is not positive.
+        """
+        if maxFrameSize <= 0:
+            raise ValueError("maxFrameSize must be positive")
+        self._separator = separator
+        self._pending = bytearray()
+        self._maxFrameSize = maxFrameSize
+        self._discarding = False
+        self._droppedFrames = 0
+        self._readBuffer = bytearray(bufferSize)
+        self._readView = memoryview(self._readBuffer)
+
+    def readFrom(self, sock) -> list:
+        """
+        Reads the available bytes from the socket and returns the frames completed by them.
+
+        Parameters:
+            sock (socket.socket): The socket to read from.
+
+        Returns:
+            list[bytes]: The complete frames, or None if the connection has been closed by the peer.
+        """
+        n = sock.recv_into(self._readView)
+        if n == 0:
+            return None
+        return self.feed(self._readView[:n])
+
+    def feed(self, data) -> list:
+        """
+        Appends received bytes to the stream and returns the frames completed by them.
+
+        Parameters:
+            data (bytes | bytearray | memoryview): The received bytes.
+
+        Returns:
+            list[bytes]: The complete frames, in order of arrival. Empty frames and dropped frames are skipped.
+        """
+        pending = self._pending
+        separator = self._separator
+        # The bytes received before contain no separator, except one split across the two reads
+        start = max(len(pending) - len(separator) + 1, 0)
+        pending += data
+        end = pending.rfind(separator, start)
+        if end < 0:
+            if len(pending) > self._maxFrameSize:
+                self.__DropPending()
+            return []
+        complete = bytes(pending[:end])
+        del pending[:end + len(separator)]
+        frames = complete.split(separator)
+        if self._discarding:
+            # The first frame is the end of the dropped frame
+            self._discarding = False
+            del frames[0]
+        if len(pending) > self._maxFrameSize:
+            self.__DropPending()
+        return [frame for frame in frames if frame]
+
+    def __DropPending(self):
+        if not self._discarding:
+            self._discarding = True
+            self._droppedFrames += 1
+        # Keep the bytes that may start a separator split across two reads
+        del self._pending[:len(self._pending) - len(self._separator) + 1]
+
+    def reset(self) -> None:
+        """
+        Discards any partially received frame, e.g. when the connection is reestablished.
+        """
+        self._pending.clear()
+        self._discarding = False
+
+    def pendingSize(self) -> int:
+        """
+        Returns the number of bytes belonging to a frame not yet completed.
+
+        Returns:
+            int: The size of the carry-over buffer.
+        """
+        return len(self._pending)
+
+    def droppedFrames(self) -> int:
+        """
+        Returns the number of frames dropped for exceeding the maximum frame size.
+
+        Returns:
+            int: The number of dropped frames.
+        """
+        return self._droppedFrames
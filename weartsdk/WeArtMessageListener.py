@@ -11,7 +11,16 @@ class WeArtMessageListener:
         Parameters:
             ids (list[str]): A list of message IDs that this listener will accept.
         """
-        self._acceptedIds = ids
+        self._acceptedIds = frozenset(ids)
+
+    def acceptedIds(self) -> frozenset:
+        """
+        Returns the message IDs accepted by this listener.
+
+        Returns:
+            frozenset[str]: The accepted message IDs.
+        """
+        return self._acceptedIds
 
     def accept(self, id: str):
         """
@@ -23,10 +32,7 @@ class WeArtMessageListener:
         Returns:
             bool: True if the ID is accepted, False otherwise.
         """
-        if id in self._acceptedIds:
-            return True
-        else:
-            return False
+        return id in self._acceptedIds
     
     def OnMessageReceived(message: WeArtMessages.WeArtMessage):
         """
@@ -0,0 +1,201 @@
+from threading import Thread, Condition, current_thread
+from collections import OrderedDict
+from enum import Enum
+import itertools
+import logging
+
+from . import WeArtMessages as WeArtMessages
+
+class SendPolicy(Enum):
+    """
+    Policy applied by WeArtMessageSender when messages are produced faster than they can be written.
+
+    Attributes:
+        BLOCK: Messages are sent in order; senders wait while the queue is full.
+        DROP_OLDEST: Messages are sent in order; the oldest queued message is discarded when the queue is full.
+        COALESCE: A queued haptic command is replaced by a newer command for the same effect and thimble,
+            so that only the latest value is sent; other messages wait while the queue is full.
+    """
+    BLOCK = 0
+    DROP_OLDEST = 1
+    COALESCE = 2
+
+# Haptic commands replacing each other when coalesced, e.g. a stopForce replaces a pending force
+_EFFECT_GROUPS = {
+    WeArtMessages.SetTemperatureMessage.ID:     WeArtMessages.SetTemperatureMessage.ID,
+    WeArtMessages.StopTemperatureMessage.ID:    WeArtMessages.SetTemperatureMessage.ID,
+    WeArtMessages.SetForceMessage.ID:           WeArtMessages.SetForceMessage.ID,
+    WeArtMessages.StopForceMessage.ID:          WeArtMessages.SetForceMessage.ID,
+    WeArtMessages.SetTextureMessage.ID:         WeArtMessages.SetTextureMessage.ID,
+    WeArtMessages.StopTextureMessage.ID:        WeArtMessages.SetTextureMessage.ID,
+}
+
+def HapticTarget(msg: WeArtMessages.WeArtMessage):
+    """
+    Returns the haptic target of a message, i.e. the effect and the thimble it controls.
+
+    Parameters:
+        msg (WeArtMessage): The message.
+
+    Returns:
+        tuple: (effect, hand side, actuation point) for haptic commands, None for the other messages.
+    """
+    group = _EFFECT_GROUPS.get(msg.getID())
+    if group is None:
+        return None
+    return (group, msg.getHandSide(), msg.getActuationPoint())
+
+class WeArtMessageSender:
+    """
+    Writes serialized messages to a socket from a dedicated thread.
+
+    Messages are queued by the caller threads and the writer thread sends everything queued so far with a
+    single sendall. The queue is bounded; what happens when it is full depends on the SendPolicy.
+
+    Attributes:
+        __queue (OrderedDict): The queued messages, by key, in sending order.
+        __maxSize (int): The maximum number of queued messages.
+        __policy (SendPolicy): The policy applied when the queue is full.
+        __condition (Condition): Protects the queue and wakes up the writer and the waiting senders.
+    """
+    def __init__(self, maxSize: int = 1024, policy: SendPolicy = SendPolicy.BLOCK, onError = None):
+        """
+        Initializes a WeArtMessageSender.
+
+        Parameters:
+            maxSize (int): The maximum number of queued messages.
+            policy (SendPolicy): The policy applied when the queue is full.
+            onError (Callable[[OSError], None]): Function called, from the writer thread, when a write fails.
+        """
+        if maxSize < 1:
+            raise ValueError(f"maxSize must be at least 1, got { maxSize }")
+        self.__maxSize = maxSize
+        self.__policy = policy
+        self.__onError = onError
+        self.__queue = OrderedDict()
+        self.__condition = Condition()
+        self.__sequence = itertools.count()
+        self.__generation = 0
+        self.__session = 0
+        self.__thread = None
+        self.__running = False
+        self.__dropped = 0
+        self.__logger = logging.getLogger("WeArtClient")
+
+    def Start(self, sock):
+        """
+        Starts the writer thread on the given socket, discarding messages queued for a previous connection.
+        A writer thread still running on a previous socket exits without writing anything else.
+
+        Parameters:
+            sock (socket.socket): The connected socket.
+        """
+        with self.__condition:
+            self.__queue.clear()
+            self.__running = True
+            self.__session += 1
+            session = self.__session
+            self.__condition.notify_all()
+        self.__thread = Thread(target=self.__Run, args=(sock, session), daemon=True)
+        self.__thread.start()
+
+    def Stop(self, timeout: float = 1.0):
+        """
+        Stops the writer thread after the queued messages have been written.
+
+        Parameters:
+            timeout (float): The maximum time to wait for the queued messages to be written, in seconds.
+        """
+        with self.__condition:
+            self.__running = False
+            self.__condition.notify_all()
+        thread = self.__thread
+        if thread is not None and thread is not current_thread():
+            thread.join(timeout)
+
+    def Put(self, items: list):
+        """
+        Queues serialized messages. The messages are queued together, so they are written with a single
+        sendall unless the queue fills up while they are being queued.
+        Messages put while the writer thread is stopped, e.g. after Stop, are discarded.
+
+        Parameters:
+            items (list[tuple]): (haptic target, serialized message) pairs. The target is None for messages
+                that are not haptic commands.
+        """
+        coalesce = self.__policy == SendPolicy.COALESCE
+        with self.__condition:
+            for target, data in items:
+                if not self.__running:
+                    # Nothing would write the message, and the queue must stay bounded
+                    self.__dropped += 1
+                    continue
+                if coalesce and target is not None:
+                    # Only commands queued after the last non-haptic message can be replaced,
+                    # so haptic commands are never moved across e.g. a start or stop message
+                    key = (self.__generation, target)
+                    if key in self.__queue:
+                        self.__queue[key] = data
+                        continue
+                else:
+                    key = next(self.__sequence)
+                    if target is None:
+                        self.__generation += 1
+                self.__WaitForRoom()
+                if not self.__running:
+                    # Stopped while waiting for room
+                    self.__dropped += 1
+                    continue
+                self.__queue[key] = data
+            self.__condition.notify_all()
+
+    def DroppedMessages(self) -> int:
+        """
+        Returns the number of messages discarded by the DROP_OLDEST policy or because the writer thread was stopped.
+
+        Returns:
+            int: The number of discarded messages.
+        """
+        return self.__dropped
+
+    def PendingMessages(self) -> int:
+        """
+        Returns the number of queued messages not yet written.
+
+        Returns:
+            int: The number of queued messages.
+        """
+        return len(self.__queue)
+
+    def __WaitForRoom(self):
+        if self.__policy == SendPolicy.DROP_OLDEST:
+            while len(self.__queue) >= self.__maxSize:
+                self.__queue.popitem(last=False)
+                self.__dropped += 1
+            return
+        while len(self.__queue) >= self.__maxSize and self.__running:
+            self.__condition.wait()
+
+    def __Run(self, sock, session: int):
+        while True:
+            with self.__condition:
+                while not self.__queue and self.__running and self.__session == session:
+                    self.__condition.wait()
+                if not self.__queue or self.__session != session:
+                    return
+                data = b''.join(self.__queue.values())
+                self.__queue.clear()
+                self.__condition.notify_all()
+            try:
+                sock.sendall(data)
+            except OSError as e:
+                with self.__condition:
+                    if self.__session != session:
+                        return
+                    self.__running = False
+                    self.__queue.clear()
+                    self.__condition.notify_all()
+                self.__logger.error(f"Send message '{ data.decode() }' failed: { e }")
+                if self.__onError is not None:
+                    self.__onError(e)
+                return
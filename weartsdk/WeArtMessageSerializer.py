@@ -1,5 +1,8 @@
 from . import WeArtMessages as WeArtMessages
-import json
+from .WeArtJsonCodec import WeArtJsonCodec, GetJsonCodec
+
+# Errors raised by messages built from malformed data (missing or invalid fields, invalid UTF-8)
+_MALFORMED_MESSAGE_ERRORS = (ValueError, KeyError, TypeError, IndexError, AttributeError)
 
 class WeArtMessageSerializer:
     separator = ':'
@@ -28,6 +31,25 @@ class WeArtMessageSerializer:
         WeArtMessages.AnalogSensorsData.ID:         WeArtMessages.AnalogSensorsData,
     }
         
+    def __init__(self, codec: WeArtJsonCodec = None):
+        """
+        Initializes a WeArtMessageSerializer.
+
+        Parameters:
+            codec (str | WeArtJsonCodec): The JSON codec, or its name, used for JSON messages.
+                If None, the fastest installed codec is used.
+        """
+        self._codec = GetJsonCodec(codec)
+
+    def codec(self) -> WeArtJsonCodec:
+        """
+        Returns the JSON codec used for JSON messages.
+
+        Returns:
+            WeArtJsonCodec: The JSON codec.
+        """
+        return self._codec
+
     @staticmethod
     def __createMessage(id: str):
         message_class = WeArtMessageSerializer.__MESSAGE_CLASSES.get(id)
@@ -36,18 +58,75 @@ class WeArtMessageSerializer:
         else:
             return None
 
-    def Deserialize(self, data: str) -> WeArtMessages.WeArtMessage:
-        id = self.__extractID(data)
-        msg = self.__createMessage(id)
-        if msg != None:
-            msg.deserialize(data)
+    def Deserialize(self, data) -> WeArtMessages.WeArtMessage:
+        """
+        Deserializes a single message, without the messages separator.
+
+        The first character tells JSON messages (starting with '{') from CSV ones, so that
+        JSON messages are parsed exactly once and CSV messages are split exactly once.
+        JSON messages received as bytes are handed to the codec without being decoded to str.
+
+        Parameters:
+            data (str | bytes): The serialized message.
+
+        Returns:
+            WeArtMessage: The deserialized message, or None if the message is unknown or malformed.
+        """
+        if isinstance(data, str):
+            first = data[:1]
+            if first.isspace():
+                data = data.strip()
+                first = data[:1]
+            if first == '{':
+                return self.__deserializeJson(data)
+            return self.__deserializeCsv(data)
+
+        first = data[:1]
+        if first.isspace():
+            data = bytes(data).strip()
+            first = data[:1]
+        if first == b'{':
+            return self.__deserializeJson(data)
+        return self.__deserializeCsv(data)
+
+    def Serialize(self, msg: WeArtMessages.WeArtMessage) -> bytes:
+        """
+        Serializes a single message, without the messages separator.
+
+        Parameters:
+            msg (WeArtMessage): The message to serialize.
+
+        Returns:
+            bytes: The serialized message.
+        """
+        return msg.serializeBytes(self._codec)
+
+    def __deserializeJson(self, data) -> WeArtMessages.WeArtMessage:
+        try:
+            j = self._codec.loads(data)
+        except self._codec.decodeErrors:
+            return None
+        if not isinstance(j, dict):
+            return None
+        try:
+            msg = self.__createMessage(j.get("type"))
+            if not isinstance(msg, WeArtMessages.WeArtJsonMessage):
+                return None
+            msg.deserializeDict(j)
+        except _MALFORMED_MESSAGE_ERRORS:
+            # A malformed message is dropped, it must not stop the reception of the following ones
+            return None
         return msg
 
-    def __extractID(self, data:str) -> str:
+    def __deserializeCsv(self, data) -> WeArtMessages.WeArtMessage:
         try:
-            # if it is a JSON message
-            d = json.loads(data)
-            return d["type"]
-        except:
-            # if it is a CSV message
-            return data.split(":")[0]
\ No newline at end of file
+            if not isinstance(data, str):
+                data = bytes(data).decode()
+            fields = data.split(self.separator)
+            msg = self.__createMessage(fields[0])
+            if not isinstance(msg, WeArtMessages.WeArtCsvMessage):
+                return None
+            msg.setValues(fields[1:])
+        except _MALFORMED_MESSAGE_ERRORS:
+            return None
+        return msg
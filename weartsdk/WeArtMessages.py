@@ -1,84 +1,33 @@
 from .WeArtCommon import TrackingType, HandSide, ActuationPoint, CalibrationStatus, SensorData, AnalogSensorRawData, MiddlewareStatusData, WeArtAppStatusData, ConnectedDeviceStatus, G2DeviceStatus
 from .WeArtCommon import dataclass_from_dict, dict_from_dataclass, dataclass_from_list
 from . import WeArtCommon
+from .WeArtJsonCodec import WeArtJsonCodec, GetJsonCodec
+from .WeArtConversions import StringToTrackingType, TrackingTypeToString, StringToHandside, HandsideToString, StringToActuationPoint, ActuationPointToString, CalibrationHandSideToString, StringToCalibrationHandSide
 import json
 import time
 
-def StringToTrackingType(string: str):
-	if (string == "TrackType1"):
-		return TrackingType.WEART_HAND
-	return TrackingType.DEFAULT
-
-def TrackingTypeToString(trackType: TrackingType):
-    if trackType == TrackingType.DEFAULT:
-        return ""
-    elif trackType == TrackingType.WEART_HAND:
-        return "TrackType1"
-    else:
-	    return ""
-    
-def StringToHandside(string: str):
-    if (string == "LEFT"):
-        return HandSide.Left
-    elif (string == "RIGHT"):
-        return HandSide.Right
-    else:
-        assert(False)
-        return HandSide.Left
-
-def HandsideToString(hs: HandSide):
-    if (hs == HandSide.Left):
-        return "LEFT"
-    elif (hs == HandSide.Right):
-        return "RIGHT"
-    else:
-        assert(False)
-        return ""
-
-def StringToActuationPoint(string: str):
-    if string == "THUMB":
-        return ActuationPoint.Thumb
-    elif string == "INDEX":
-        return ActuationPoint.Index
-    elif string == "MIDDLE":
-        return ActuationPoint.Middle
-    elif string == "ANNULAR":
-        return ActuationPoint.Annular
-    elif string == "PINKY":
-        return ActuationPoint.Pinky
-    elif string == "PALM":
-        return ActuationPoint.Palm
-    else:
-        assert(False)
-        return ActuationPoint.Thumb
-
-def ActuationPointToString(ap: ActuationPoint):
-    if ap == ActuationPoint.Thumb:
-        return "THUMB"
-    elif ap == ActuationPoint.Index:
-        return "INDEX"
-    elif ap == ActuationPoint.Middle:
-        return "MIDDLE"
-    elif ap == ActuationPoint.Annular:
-        return "ANNULAR"
-    elif ap == ActuationPoint.Pinky:
-        return "PINKY"
-    elif ap == ActuationPoint.Palm:
-        return "PALM"
-    else:
-        assert(False)
-        return ""
-    
-def CalibrationHandSideToString(hs: HandSide):
-    return "0" if hs == HandSide.Left else "1"
-    
-def StringToCalibrationHandSide(string: str):
-    if (string == "0"):
-        return HandSide.Left
-    elif (string == "1"):
-        return HandSide.Right
-    assert(False)
-    return HandSide.Left
+# Serialized ":HAND:ACTUATION_POINT" suffixes of the haptic commands, by (hand side, actuation point)
+_targetSuffixes = {}
+
+def _TargetSuffix(hs: HandSide, ap: ActuationPoint) -> str:
+    suffix = _targetSuffixes.get((hs, ap))
+    if suffix is None:
+        suffix = ":" + HandsideToString(hs) + ":" + ActuationPointToString(ap)
+        _targetSuffixes[(hs, ap)] = suffix
+    return suffix
+
+# Serialized stop commands, by (message ID, hand side, actuation point)
+_stopCommands = {}
+
+def _SerializedStopCommand(id: str, hs: HandSide, ap: ActuationPoint) -> bytes:
+    data = _stopCommands.get((id, hs, ap))
+    if data is None:
+        data = (id + _TargetSuffix(hs, ap)).encode()
+        _stopCommands[(id, hs, ap)] = data
+    return data
+
+# Codec used by JSON messages when no codec is explicitly given
+_defaultJsonCodec = GetJsonCodec()
 
 class WeArtMessage:
     """
@@ -136,6 +85,18 @@ class WeArtCsvMessage(WeArtMessage):
             ss += serializedValues[i]
 
         return ss
+
+    def serializeBytes(self, codec: WeArtJsonCodec = None) -> bytes:
+        """
+        Serializes the message to UTF-8 encoded bytes in CSV format.
+
+        Parameters:
+            codec (WeArtJsonCodec): Unused, CSV messages do not need a JSON codec.
+
+        Returns:
+            bytes: The serialized message.
+        """
+        return self.serialize().encode()
     
     def deserialize(self, message:str)->None:
         """
@@ -167,23 +128,41 @@ class WeArtJsonMessage(WeArtMessage):
         Returns:
             str: The serialized message as a JSON string.
         """
-        j = {}
-        j["type"] = self.getID()
-        j["ts"] = self._timestamp
-        payload = self._serializePayload()
-        if payload != None:
-            j["data"] = payload
-        
-        return json.dumps(j)
+        return json.dumps(self._toDict())
+
+    def serializeBytes(self, codec: WeArtJsonCodec = None) -> bytes:
+        """
+        Serializes the message to UTF-8 encoded JSON bytes.
+
+        Parameters:
+            codec (WeArtJsonCodec): The JSON codec to use. If None, the default codec is used.
+
+        Returns:
+            bytes: The serialized message.
+        """
+        if codec is None:
+            codec = _defaultJsonCodec
+        return codec.dumps(self._toDict())
     
-    def deserialize(self, message: str) -> None:
+    def deserialize(self, message, codec: WeArtJsonCodec = None) -> None:
+        """
+        Deserializes a JSON message into the message object.
+
+        Parameters:
+            message (str | bytes): The JSON message to deserialize.
+            codec (WeArtJsonCodec): The JSON codec to use. If None, the default codec is used.
+        """
+        if codec is None:
+            codec = _defaultJsonCodec
+        self.deserializeDict(codec.loads(message))
+
+    def deserializeDict(self, j: dict) -> None:
         """
-        Deserializes a JSON message string into the message object.
+        Deserializes an already parsed JSON message into the message object.
 
         Parameters:
-            message (str): The JSON message string to deserialize.
+            j (dict): The parsed JSON message, including the "type" and "ts" fields.
         """
-        j = json.loads(message)
         self._timestamp = int(j["ts"])
         if "data" in j:
             self._deserializePayload(j["data"])
@@ -194,6 +173,15 @@ class WeArtJsonMessage(WeArtMessage):
     def setActuationPoint(self, actuation_point: ActuationPoint) -> None:
         return 
 
+    def _toDict(self) -> dict:
+        j = {}
+        j["type"] = self.getID()
+        j["ts"] = self._timestamp
+        payload = self._serializePayload()
+        if payload != None:
+            j["data"] = payload
+        return j
+
     def _serializePayload(self):
         return
     
@@ -215,6 +203,9 @@ class WeArtMessageObjectSpecific(WeArtCsvMessage):
         self._handSide = None
         self._actuationPoint = None
     
+    def getHandSide(self):
+        return self._handSide
+
     def setHandSide(self, handside: HandSide):
         self._handSide = handside
     
@@ -434,6 +425,29 @@ class TrackingMessage(WeArtMessageNoParams):
         closure = float(byteValue) / float(255)
         return closure
 
+    def GetHandTracking(self, handSide: HandSide):
+        """
+        Returns the closures and abductions of all the actuation points of a hand.
+
+        Parameters:
+            handSide (HandSide): The hand side.
+
+        Returns:
+            tuple[tuple, tuple]: The closures and the abductions, ordered as WeArtCommon.ACTUATION_POINTS.
+        """
+        maxValue = 255.0
+        defaultAbduction = WeArtCommon.defaultAbduction
+        if handSide == HandSide.Left:
+            closures = (self.__LeftThumbClosure / maxValue, self.__LeftIndexClosure / maxValue, self.__LeftMiddleClosure / maxValue, 0.0, 0.0, self.__LeftPalmClosure / maxValue)
+            abductions = (self.__LeftThumbAbduction / maxValue, defaultAbduction, defaultAbduction, defaultAbduction, defaultAbduction, defaultAbduction)
+        elif handSide == HandSide.Right:
+            closures = (self.__RightThumbClosure / maxValue, self.__RightIndexClosure / maxValue, self.__RightMiddleClosure / maxValue, 0.0, 0.0, self.__RightPalmClosure / maxValue)
+            abductions = (self.__RightThumbAbduction / maxValue, defaultAbduction, defaultAbduction, defaultAbduction, defaultAbduction, defaultAbduction)
+        else:
+            closures = (0.0,) * len(WeArtCommon.ACTUATION_POINTS)
+            abductions = (defaultAbduction,) * len(WeArtCommon.ACTUATION_POINTS)
+        return closures, abductions
+
 class TrackingBendingG2Message(WeArtJsonMessage):
     ID = "TRACKING_BENDING_G2"
 
@@ -493,9 +507,30 @@ class TrackingBendingG2Message(WeArtJsonMessage):
         else:
             return None
 
+    def GetWrist(self) -> dict:
+        """
+        Returns the wrist orientation as a quaternion.
+
+        Returns:
+            dict: The quaternion components, with keys "X", "Y", "Z" and "W".
+        """
+        return self.__wrist
+
+    def GetHandTracking(self):
+        """
+        Returns the closures and abductions of all the actuation points of the hand given by GetHandSide.
+
+        Returns:
+            tuple[tuple, tuple]: The closures and the abductions, ordered as WeArtCommon.ACTUATION_POINTS.
+        """
+        closures = (self.__ThumbClosure, self.__IndexClosure, self.__MiddleClosure, self.__AnnularClosure, self.__PinkyClosure, self.__PalmClosure)
+        abductions = (self.__ThumbAbduction, self.__IndexAbduction, self.__MiddleAbduction, self.__AnnularAbduction, self.__PinkyAbduction, self.__PalmAbduction)
+        return closures, abductions
+
     def _deserializePayload(self, payload: dict) -> None:
         # Hand side
-        self.__handSide = HandSide.Right if payload.get("handSide") == "RIGHT" else HandSide.Left
+        handSide = payload.get("handSide")
+        self.__handSide = StringToHandside(handSide) if handSide is not None else HandSide.Left
         # Wrist quaternion
         wrist_data = payload.get("wrist", {}).get("quaternion", {})
         self.__wrist = {
@@ -538,6 +573,10 @@ class SetTemperatureMessage(WeArtMessageObjectSpecific):
         ret.append(HandsideToString(self._handSide))
         ret.append(ActuationPointToString(self._actuationPoint))
         return ret
+
+    def serialize(self) -> str:
+        # Only the temperature is formatted, the rest of the message is cached per thimble
+        return f"{self.ID}:{self._temperature!s}{_TargetSuffix(self._handSide, self._actuationPoint)}"
     
     def setValues(self, values: list[str]):
         assert(len(values)==3)
@@ -557,6 +596,12 @@ class StopTemperatureMessage(WeArtMessageObjectSpecific):
     def getValues(self):
         ret = [HandsideToString(self._handSide), ActuationPointToString(self._actuationPoint)]
         return ret
+
+    def serialize(self) -> str:
+        return self.ID + _TargetSuffix(self._handSide, self._actuationPoint)
+
+    def serializeBytes(self, codec: WeArtJsonCodec = None) -> bytes:
+        return _SerializedStopCommand(self.ID, self._handSide, self._actuationPoint)
     
     def setValues(self, values: list[str]):
         assert(len(values) == 2)
@@ -581,6 +626,10 @@ class SetForceMessage(WeArtMessageObjectSpecific):
         ret.append(HandsideToString(self._handSide))
         ret.append(ActuationPointToString(self._actuationPoint))
         return ret
+
+    def serialize(self) -> str:
+        force = self._force
+        return f"{self.ID}:{force[0]!s}:{force[1]!s}:{force[2]!s}{_TargetSuffix(self._handSide, self._actuationPoint)}"
     
     def setValues(self, values:list[str]):
         assert(len(values) == 5)
@@ -602,6 +651,12 @@ class StopForceMessage(WeArtMessageObjectSpecific):
     def getValues(self):
         ret = [HandsideToString(self._handSide), ActuationPointToString(self._actuationPoint)]
         return ret
+
+    def serialize(self) -> str:
+        return self.ID + _TargetSuffix(self._handSide, self._actuationPoint)
+
+    def serializeBytes(self, codec: WeArtJsonCodec = None) -> bytes:
+        return _SerializedStopCommand(self.ID, self._handSide, self._actuationPoint)
     
     def setValues(self, values: list[str]):
         assert(len(values) == 2)
@@ -633,6 +688,12 @@ class SetTextureMessage(WeArtMessageObjectSpecific):
         ret.append(ActuationPointToString(self._actuationPoint))
         return ret
 
+    def serialize(self) -> str:
+        if (self._index < WeArtCommon.minTextureIndex or self._index > WeArtCommon.maxTextureIndex):
+            self._index = WeArtCommon.nullTextureIndex
+        velocity = self._velocity
+        return f"{self.ID}:{self._index!s}:{velocity[0]!s}:{velocity[1]!s}:{velocity[2]!s}:{self._volume!s}{_TargetSuffix(self._handSide, self._actuationPoint)}"
+
     def setValues(self, values: list[str]):
         assert(len(values) == 6)
         self._index = int(values[0])
@@ -656,6 +717,12 @@ class StopTextureMessage(WeArtMessageObjectSpecific):
     def getValues(self):
         ret = [HandsideToString(self._handSide), ActuationPointToString(self._actuationPoint)]
         return ret
+
+    def serialize(self) -> str:
+        return self.ID + _TargetSuffix(self._handSide, self._actuationPoint)
+
+    def serializeBytes(self, codec: WeArtJsonCodec = None) -> bytes:
+        return _SerializedStopCommand(self.ID, self._handSide, self._actuationPoint)
     
     def setValues(self, values: list[str]):
         assert(len(values) == 2)
@@ -0,0 +1,595 @@
+import argparse
+import asyncio
+from collections import Counter
+from enum import Enum
+import logging
+import math
+from threading import Thread, Event
+import time
+
+from .WeArtCommon import HandSide, ActuationPoint, MiddlewareStatus, CalibrationStatus, HAND_SIDES, ACTUATION_POINTS
+from . import WeArtCommon
+from . import WeArtMessages as WeArtMessages
+from .WeArtConversions import HandsideToString, ActuationPointToString, CalibrationHandSideToString
+from .WeArtJsonCodec import GetJsonCodec
+from .WeArtMessageFramer import WeArtMessageFramer
+
+class SimulatedDevice(Enum):
+    """
+    Device simulated by WeArtMiddlewareSimulator.
+
+    Attributes:
+        TOUCH_DIVER: TouchDiver connected to the Middleware: Tracking, RAW_DATA and RAW_SENSOR_ON_MASK messages,
+            MW_STATUS and DEVICES_STATUS status messages.
+        TOUCH_DIVER_PRO: TouchDiver Pro connected to the WeArtApp: TRACKING_BENDING_G2 and RAW_DATA_TD_PRO messages,
+            WA_STATUS and WEART_TD_PRO_STATUS status messages.
+    """
+    TOUCH_DIVER = 0
+    TOUCH_DIVER_PRO = 1
+
+# Sensors reported by the raw data messages of each device
+_RAW_SENSORS = {
+    SimulatedDevice.TOUCH_DIVER:        (ActuationPoint.Thumb, ActuationPoint.Index, ActuationPoint.Middle, ActuationPoint.Palm),
+    SimulatedDevice.TOUCH_DIVER_PRO:    ACTUATION_POINTS,
+}
+
+# Phase of the synthetic motion of each actuation point, so that the fingers do not move together
+_PHASES = {ap: i * math.pi / 6 for i, ap in enumerate(ACTUATION_POINTS)}
+
+class WeArtMiddlewareSimulator:
+    """
+    Local server simulating the Middleware or the WeArtApp, to test and benchmark clients without devices.
+
+    The simulator speaks the same '~' delimited CSV/JSON protocol: it answers the start, stop, status,
+    calibration and raw data requests, and streams tracking, raw data and status messages with synthetic
+    hand motion at the configured rates. Each connected client has its own session.
+    Haptic commands are accepted and counted, see ReceivedMessages.
+
+    The simulator runs on an asyncio event loop: await Listen and Shutdown from a running loop, or call
+    Run and Close to serve from a background thread.
+
+    Usage:
+        with WeArtMiddlewareSimulator(port = 0, tracking_rate = 500.0) as simulator:
+            client = WeArtClient(WeArtCommon.DEFAULT_IP_ADDRESS, simulator.Port())
+            client.Run()
+            client.Start()
+
+    From the command line:
+        python -m weartsdk.WeArtMiddlewareSimulator --device TOUCH_DIVER_PRO --tracking-rate 200
+
+    Attributes:
+        messagesSeparator (str): The separator used to delimit messages.
+        readSize (int): The maximum number of bytes read from a client at once.
+        maxBurst (float): The maximum delay, in seconds, caught up by sending the late messages of a stream at once.
+            Messages later than that are skipped.
+    """
+    messagesSeparator = '~'
+    readSize = 4096
+    maxBurst = 0.1
+    Device = SimulatedDevice
+
+    def __init__(self, ip_address = WeArtCommon.DEFAULT_IP_ADDRESS, port = WeArtCommon.DEFAULT_TCP_PORT, device = SimulatedDevice.TOUCH_DIVER,
+                 hands = HAND_SIDES, tracking_rate = 90.0, raw_data_rate = 100.0, status_rate = 1.0, motion_frequency = 0.5,
+                 calibration_time = 1.0, json_codec = None, log_level = logging.INFO):
+        """
+        Initializes a WeArtMiddlewareSimulator.
+
+        Parameters:
+            ip_address (str): The address to listen on.
+            port (int): The port to listen on, 0 to use any free port (see Port).
+            device (SimulatedDevice): The simulated device.
+            hands (tuple[HandSide]): The hands with a connected device.
+            tracking_rate (float): The tracking messages sent per second, after a start message.
+            raw_data_rate (float): The raw data messages sent per second and per hand, after a raw data request.
+            status_rate (float): The status messages sent per second, 0 to send them only when requested or changed.
+            motion_frequency (float): The frequency of the synthetic hand motion, in Hz.
+            calibration_time (float): The duration of the simulated calibration, in seconds.
+            json_codec (str | WeArtJsonCodec): The JSON codec used for JSON messages (default is the fastest installed codec).
+            log_level (int): The logging level (default is logging.INFO).
+
+        Raises:
+            ValueError: If a rate is negative, or the tracking or raw data rate is 0.
+        """
+        if tracking_rate <= 0 or raw_data_rate <= 0:
+            raise ValueError("The tracking and raw data rates must be positive")
+        if status_rate < 0:
+            raise ValueError("The status rate must not be negative")
+        self.__ipAddress = ip_address
+        self.__port = port
+        self.__device = SimulatedDevice(device)
+        self.__hands = tuple(hands)
+        self.__trackingRate = tracking_rate
+        self.__rawDataRate = raw_data_rate
+        self.__statusRate = status_rate
+        self.__motionFrequency = motion_frequency
+        self.__calibrationTime = calibration_time
+        self.__codec = GetJsonCodec(json_codec)
+        self.__separator = self.messagesSeparator.encode()
+        self.__server = None
+        self.__sessions = {}
+        self.__closing = False
+        self.__received = Counter()
+        self.__loop = None
+        self.__thread = None
+        self.__logger = logging.getLogger("WeArtMiddlewareSimulator")
+        self.__logger.setLevel(log_level)
+
+    def __enter__(self):
+        self.Run()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.Close()
+
+    def Port(self) -> int:
+        """
+        Returns the port the simulator listens on, once listening.
+
+        Returns:
+            int: The port, also when any free port was requested.
+        """
+        return self.__port
+
+    def ClientsCount(self) -> int:
+        """
+        Returns the number of connected clients.
+
+        Returns:
+            int: The number of connected clients.
+        """
+        return len(self.__sessions)
+
+    def ReceivedMessages(self) -> dict:
+        """
+        Returns the number of messages received from all the clients, by message ID.
+
+        Returns:
+            dict[str, int]: The number of received messages, by message ID.
+        """
+        return dict(self.__received)
+
+    async def Listen(self):
+        """
+        Starts listening for clients on the running event loop.
+        """
+        self.__closing = False
+        self.__server = await asyncio.start_server(self.__Serve, self.__ipAddress, self.__port)
+        self.__port = self.__server.sockets[0].getsockname()[1]
+        self.__logger.info(f"Simulating { self.__device.name } on { (self.__ipAddress, self.__port) }")
+
+    async def Shutdown(self):
+        """
+        Stops listening and disconnects all the clients.
+        """
+        if self.__server is None:
+            return
+        self.__closing = True
+        self.__server.close()
+        # Closing the connections ends the sessions, cancelling their tasks would make asyncio log an error
+        for session in self.__sessions:
+            session.Close()
+        await asyncio.gather(*self.__sessions.values(), return_exceptions = True)
+        await self.__server.wait_closed()
+        self.__server = None
+
+    def Run(self):
+        """
+        Starts listening for clients from a background thread running its own event loop.
+        Returns once the simulator is listening.
+
+        Raises:
+            OSError: If the simulator cannot listen on the address and port.
+        """
+        listening = Event()
+        result = {}
+
+        def run():
+            loop = asyncio.new_event_loop()
+            self.__loop = loop
+            try:
+                loop.run_until_complete(self.Listen())
+            except OSError as e:
+                result["error"] = e
+                loop.close()
+                return
+            finally:
+                listening.set()
+            loop.run_forever()
+            loop.run_until_complete(self.Shutdown())
+            loop.run_until_complete(self.__Drain())
+            loop.close()
+
+        self.__thread = Thread(target=run, name="WeArtMiddlewareSimulator", daemon=True)
+        self.__thread.start()
+        listening.wait()
+        if "error" in result:
+            self.__thread = None
+            raise result["error"]
+
+    def Close(self, timeout: float = 1.0):
+        """
+        Stops the background thread started by Run, disconnecting all the clients.
+
+        Parameters:
+            timeout (float): The maximum time to wait for the thread to exit, in seconds.
+        """
+        if self.__thread is None:
+            return
+        self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.__thread.join(timeout)
+        self.__thread = None
+
+    @staticmethod
+    async def __Drain():
+        # Connections accepted just before the server closed complete their handshake afterwards:
+        # wait for them to be closed by __Serve, so that no task is pending when the loop is closed
+        current = asyncio.current_task()
+        while True:
+            tasks = asyncio.all_tasks() - {current}
+            if not tasks:
+                return
+            await asyncio.gather(*tasks, return_exceptions = True)
+
+    async def __Serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        if self.__closing:
+            writer.close()
+            return
+        session = _SimulatorSession(self, reader, writer)
+        self.__sessions[session] = asyncio.current_task()
+        self.__logger.info(f"Client connected from { writer.get_extra_info('peername') }")
+        try:
+            await session.Serve()
+        finally:
+            self.__sessions.pop(session, None)
+            self.__logger.info(f"Client disconnected from { writer.get_extra_info('peername') }")
+
+    # Accessors used by the sessions
+
+    def _config(self):
+        return self.__device, self.__hands, self.__trackingRate, self.__rawDataRate, self.__statusRate, self.__motionFrequency, self.__calibrationTime
+
+    def _codec(self):
+        return self.__codec
+
+    def _separator(self) -> bytes:
+        return self.__separator
+
+    def _logger(self) -> logging.Logger:
+        return self.__logger
+
+    def _countReceived(self, id: str):
+        self.__received[id] += 1
+
+class _SimulatorSession:
+    """
+    Connection of a client to the simulator, with its own streams, status and calibration.
+    """
+    def __init__(self, simulator: WeArtMiddlewareSimulator, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.__simulator = simulator
+        (self.__device, self.__hands, self.__trackingRate, self.__rawDataRate, self.__statusRate,
+         self.__motionFrequency, self.__calibrationTime) = simulator._config()
+        self.__codec = simulator._codec()
+        self.__separator = simulator._separator()
+        self.__logger = simulator._logger()
+        self.__reader = reader
+        self.__writer = writer
+        self.__framer = WeArtMessageFramer(self.__separator)
+        self.__running = False
+        self.__lastStatus = MiddlewareStatus.IDLE
+        self.__startTime = time.monotonic()
+        self.__trackingTask = None
+        self.__rawDataTask = None
+        self.__statusTask = None
+        self.__calibrationTask = None
+        self.__handlers = {
+            WeArtMessages.StartFromClientMessage.ID:    self.__OnStart,
+            WeArtMessages.StopFromClientMessage.ID:     self.__OnStop,
+            WeArtMessages.GetMiddlewareStatus.ID:       self.__OnGetStatus,
+            WeArtMessages.GetDevicesStatusMessage.ID:   self.__OnGetDevicesStatus,
+            WeArtMessages.StartCalibrationMessage.ID:   self.__OnStartCalibration,
+            WeArtMessages.StopCalibrationMessage.ID:    self.__OnStopCalibration,
+            WeArtMessages.RawDataOn.ID:                 self.__OnRawDataOn,
+            WeArtMessages.RawDataOff.ID:                self.__OnRawDataOff,
+        }
+
+    async def Serve(self):
+        if self.__statusRate > 0:
+            self.__statusTask = asyncio.ensure_future(self.__Stream(self.__statusRate, self.__StatusFrames))
+        try:
+            while True:
+                data = await self.__reader.read(self.__simulator.readSize)
+                if not data:
+                    break
+                for frame in self.__framer.feed(data):
+                    self.__OnFrame(bytes(frame))
+        except ConnectionError:
+            pass
+        finally:
+            self.__writer.close()
+            tasks = [task for task in (self.__trackingTask, self.__rawDataTask, self.__statusTask, self.__calibrationTask) if task is not None]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions = True)
+
+    def Close(self):
+        self.__writer.close()
+
+    def __OnFrame(self, frame: bytes):
+        frame = frame.strip()
+        if not frame:
+            return
+        if frame[:1] == b'{':
+            try:
+                id = self.__codec.loads(frame).get("type")
+            except (self.__codec.decodeErrors + (AttributeError,)):
+                self.__logger.warning(f"Malformed message { frame !r}")
+                return
+        else:
+            id = frame.split(b':', 1)[0].decode(errors="replace")
+        self.__simulator._countReceived(id)
+        handler = self.__handlers.get(id)
+        if handler is not None:
+            handler()
+
+    # Requests
+
+    def __OnStart(self):
+        if self.__trackingTask is None:
+            self.__trackingTask = asyncio.ensure_future(self.__Stream(self.__trackingRate, self.__TrackingFrames))
+        self.__running = True
+        self.__StatusChanged()
+
+    def __OnStop(self):
+        self.__trackingTask = self.__Cancel(self.__trackingTask)
+        self.__rawDataTask = self.__Cancel(self.__rawDataTask)
+        self.__running = False
+        self.__StatusChanged()
+
+    def __OnGetStatus(self):
+        self.__Write([self.__StatusFrame()])
+
+    def __OnGetDevicesStatus(self):
+        self.__Write([self.__DevicesStatusFrame()])
+
+    def __OnStartCalibration(self):
+        if self.__calibrationTask is None:
+            self.__calibrationTask = asyncio.ensure_future(self.__Calibrate())
+
+    def __OnStopCalibration(self):
+        self.__calibrationTask = self.__Cancel(self.__calibrationTask)
+        self.__StatusChanged()
+
+    def __OnRawDataOn(self):
+        if self.__rawDataTask is None:
+            self.__rawDataTask = asyncio.ensure_future(self.__Stream(self.__rawDataRate, self.__RawDataFrames))
+
+    def __OnRawDataOff(self):
+        self.__rawDataTask = self.__Cancel(self.__rawDataTask)
+
+    @staticmethod
+    def __Cancel(task):
+        if task is not None:
+            task.cancel()
+        return None
+
+    def __Status(self) -> MiddlewareStatus:
+        if self.__calibrationTask is not None:
+            return MiddlewareStatus.CALIBRATION
+        return MiddlewareStatus.RUNNING if self.__running else MiddlewareStatus.IDLE
+
+    def __StatusChanged(self):
+        # Like the Middleware, status changes are notified without waiting for a request
+        if self.__Status() != self.__lastStatus:
+            self.__Write([self.__StatusFrame()])
+
+    async def __Calibrate(self):
+        try:
+            self.__StatusChanged()
+            for status in (CalibrationStatus.IDLE, CalibrationStatus.Calibrating):
+                self.__Write([self.__CalibrationFrame(WeArtMessages.CalibrationStatusMessage.ID, hand, str(int(status))) for hand in self.__hands])
+            await asyncio.sleep(self.__calibrationTime)
+            frames = []
+            for hand in self.__hands:
+                frames.append(self.__CalibrationFrame(WeArtMessages.CalibrationResultMessage.ID, hand, "0"))
+                frames.append(self.__CalibrationFrame(WeArtMessages.CalibrationStatusMessage.ID, hand, str(int(CalibrationStatus.Running))))
+            self.__Write(frames)
+        finally:
+            self.__calibrationTask = None
+        self.__StatusChanged()
+
+    # Streams
+
+    async def __Stream(self, rate: float, buildFrames):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        maxLate = max(1, int(rate * self.__simulator.maxBurst))
+        sent = 0
+        while not self.__writer.is_closing():
+            due = int((loop.time() - start) * rate) + 1 - sent
+            if due > maxLate:
+                # The client is too slow, skip the messages that are too late
+                sent += due - maxLate
+                due = maxLate
+            frames = []
+            for _ in range(due):
+                frames.extend(buildFrames())
+            sent += due
+            self.__Write(frames)
+            try:
+                await self.__writer.drain()
+            except ConnectionError:
+                return
+            await asyncio.sleep(max(0.0, start + sent / rate - loop.time()))
+
+    def __Write(self, frames: list):
+        if frames and not self.__writer.is_closing():
+            self.__writer.write(b''.join(frame + self.__separator for frame in frames))
+
+    # Synthetic motion
+
+    def __Phase(self, hand: HandSide, ap: ActuationPoint) -> float:
+        t = time.monotonic() - self.__startTime
+        handPhase = math.pi / 2 if hand == HandSide.Right else 0.0
+        return 2 * math.pi * self.__motionFrequency * t + _PHASES[ap] + handPhase
+
+    def __Closure(self, hand: HandSide, ap: ActuationPoint) -> float:
+        return 0.5 - 0.5 * math.cos(self.__Phase(hand, ap))
+
+    def __Abduction(self, hand: HandSide, ap: ActuationPoint) -> float:
+        return 0.5 + 0.25 * math.sin(self.__Phase(hand, ap))
+
+    # Frames
+
+    def __JsonFrame(self, id: str, data: dict) -> bytes:
+        return self.__codec.dumps({"type": id, "ts": int(time.time() * 1000), "data": data})
+
+    def __TrackingFrames(self) -> list:
+        if self.__device == SimulatedDevice.TOUCH_DIVER_PRO:
+            return [self.__JsonFrame(WeArtMessages.TrackingBendingG2Message.ID, self.__G2Payload(hand)) for hand in self.__hands]
+        # Right hand then left hand: index closure, thumb closure, thumb abduction, middle closure
+        values = []
+        for hand in (HandSide.Right, HandSide.Left):
+            if hand in self.__hands:
+                values.extend((self.__Closure(hand, ActuationPoint.Index), self.__Closure(hand, ActuationPoint.Thumb),
+                               self.__Abduction(hand, ActuationPoint.Thumb), self.__Closure(hand, ActuationPoint.Middle)))
+            else:
+                values.extend((0.0, 0.0, 0.0, 0.0))
+        fields = [WeArtMessages.TrackingMessage.ID, "TrackType1"] + [str(int(value * 255)) for value in values]
+        return [':'.join(fields).encode()]
+
+    def __G2Payload(self, hand: HandSide) -> dict:
+        payload = {"handSide": HandsideToString(hand)}
+        angle = 0.5 * math.sin(self.__Phase(hand, ActuationPoint.Palm))
+        payload["wrist"] = {"quaternion": {"x": 0.0, "y": math.sin(angle / 2), "z": 0.0, "w": math.cos(angle / 2)}}
+        for ap in ACTUATION_POINTS:
+            payload[ActuationPointToString(ap).lower()] = {"closure": self.__Closure(hand, ap), "abduction": self.__Abduction(hand, ap)}
+        return payload
+
+    def __RawDataFrames(self) -> list:
+        frames = []
+        for hand in self.__hands:
+            if self.__device == SimulatedDevice.TOUCH_DIVER_PRO:
+                frames.append(self.__JsonFrame(WeArtMessages.RawDataTDPro.ID, self.__RawPayload(hand)))
+            else:
+                frames.append(self.__JsonFrame(WeArtMessages.RawSensorsData.ID, self.__RawPayload(hand)))
+                frames.append(self.__JsonFrame(WeArtMessages.AnalogSensorsData.ID, self.__AnalogPayload(hand)))
+        return frames
+
+    def __RawPayload(self, hand: HandSide) -> dict:
+        payload = {"handSide": HandsideToString(hand)}
+        for ap in _RAW_SENSORS[self.__device]:
+            phase = self.__Phase(hand, ap)
+            payload[ActuationPointToString(ap).lower()] = {
+                "accelerometer":    {"x": 0.1 * math.sin(phase), "y": 0.1 * math.cos(phase), "z": 1.0},
+                "gyroscope":        {"x": 10.0 * math.cos(phase), "y": -10.0 * math.sin(phase), "z": 0.0},
+                "timeOfFlight":     {"distance": int(50 + 30 * math.sin(phase))},
+            }
+        return payload
+
+    def __AnalogPayload(self, hand: HandSide) -> dict:
+        payload = {"handSide": HandsideToString(hand)}
+        for ap in _RAW_SENSORS[SimulatedDevice.TOUCH_DIVER]:
+            force = self.__Closure(hand, ap)
+            payload[ActuationPointToString(ap).lower()] = {
+                "ntcTemperatureRaw":        2048.0,
+                "ntcTemperatureConverted":  30.0 + math.sin(self.__Phase(hand, ap)),
+                "forceSensingRaw":          force * 4095,
+                "forceSensingConverted":    force,
+            }
+        return payload
+
+    def __CalibrationFrame(self, id: str, hand: HandSide, value: str) -> bytes:
+        return ':'.join((id, CalibrationHandSideToString(hand), value)).encode()
+
+    def __StatusFrames(self) -> list:
+        return [self.__StatusFrame(), self.__DevicesStatusFrame()]
+
+    def __StatusFrame(self) -> bytes:
+        self.__lastStatus = self.__Status()
+        payload = {
+            "status": self.__lastStatus.name,
+            "version": WeArtCommon.WEART_SDK_VERSION,
+            "statusCode": 0,
+            "errorDesc": "",
+            "actuationsEnabled": True,
+            "connectedDevices": [{"macAddress": self.__MacAddress(hand), "handSide": HandsideToString(hand)} for hand in self.__hands],
+        }
+        if self.__device == SimulatedDevice.TOUCH_DIVER:
+            return self.__JsonFrame(WeArtMessages.MiddlewareStatusMessage.ID, payload)
+        payload.update({
+            "warningCode": 0,
+            "warningDesc": "",
+            "connectionType": "BLE",
+            "autoconnection": False,
+            "trackingPlayback": False,
+            "rawDataLog": False,
+            "sensorOnMask": False,
+        })
+        return self.__JsonFrame(WeArtMessages.WeArtAppStatusMessage.ID, payload)
+
+    def __DevicesStatusFrame(self) -> bytes:
+        if self.__device == SimulatedDevice.TOUCH_DIVER:
+            devices = [{
+                "macAddress": self.__MacAddress(hand),
+                "handSide": HandsideToString(hand),
+                "batteryLevel": 100,
+                "charging": False,
+                "thimbles": [{"id": ActuationPointToString(ap), "connected": True, "statusCode": 0, "errorDesc": ""}
+                             for ap in (ActuationPoint.Thumb, ActuationPoint.Index, ActuationPoint.Middle)],
+            } for hand in self.__hands]
+            return self.__JsonFrame(WeArtMessages.DevicesStatusMessage.ID, {"devices": devices})
+        devices = [{
+            "macAddress": self.__MacAddress(hand),
+            "handSide": HandsideToString(hand),
+            "signalStrength": -50.0,
+            "sensorsCalibDate": "2024-01-01T00:00:00",
+            "master": {
+                "batteryLevel": 100,
+                "charging": False,
+                "chargeCompleted": False,
+                "connection": {"bluetoothOn": True, "bluetoothConnected": True, "wifiOn": False, "wifiConnected": False, "usbConnected": False},
+                "imuFault": False,
+                "adcFault": False,
+                "buttonPushed": False,
+            },
+            "nodes": [{"id": ActuationPointToString(ap), "connected": True, "imuFault": False, "adcFault": False, "tofFault": True}
+                      for ap in ACTUATION_POINTS if ap != ActuationPoint.Palm],
+        } for hand in self.__hands]
+        return self.__JsonFrame(WeArtMessages.TDProStatusMessage.ID, {"devices": devices})
+
+    @staticmethod
+    def __MacAddress(hand: HandSide) -> str:
+        return f"00:00:00:00:00:0{ int(hand) }"
+
+def _Main(argv = None):
+    parser = argparse.ArgumentParser(description = "Simulates the Middleware or the WeArtApp for testing and benchmarking clients.")
+    parser.add_argument("--ip", default = WeArtCommon.DEFAULT_IP_ADDRESS, help = "address to listen on")
+    parser.add_argument("--port", type = int, default = WeArtCommon.DEFAULT_TCP_PORT, help = "port to listen on")
+    parser.add_argument("--device", choices = [d.name for d in SimulatedDevice], default = SimulatedDevice.TOUCH_DIVER.name)
+    parser.add_argument("--hands", choices = ["left", "right", "both"], default = "both")
+    parser.add_argument("--tracking-rate", type = float, default = 90.0, help = "tracking messages per second")
+    parser.add_argument("--raw-data-rate", type = float, default = 100.0, help = "raw data messages per second and hand")
+    parser.add_argument("--status-rate", type = float, default = 1.0, help = "status messages per second, 0 to disable")
+    args = parser.parse_args(argv)
+
+    hands = {"left": (HandSide.Left,), "right": (HandSide.Right,), "both": HAND_SIDES}[args.hands]
+    simulator = WeArtMiddlewareSimulator(args.ip, args.port, SimulatedDevice[args.device], hands,
+                                         args.tracking_rate, args.raw_data_rate, args.status_rate)
+
+    async def serve():
+        await simulator.Listen()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await simulator.Shutdown()
+
+    logging.basicConfig()
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+__all__ = ['WeArtMiddlewareSimulator', 'SimulatedDevice']
+
+if __name__ == '__main__':
+    _Main()
@@ -0,0 +1,304 @@
+import logging
+import os
+import struct
+from threading import Lock
+
+from .WeArtMessageListener import WeArtMessageListener
+from .WeArtMessages import WeArtMessage, RawSensorsData, RawDataTDPro, AnalogSensorsData
+from .WeArtConversions import HandsideToString, ActuationPointToString
+from . import WeArtCommon
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+except ImportError:
+    pyarrow = None
+
+# Columns of the streams, with their NumPy type. Values missing from a message (e.g. Time-of-Flight on Touch Diver Pro) are NaN
+_IMU_COLUMNS = (("timestamp", "int64"), ("accelX", "float32"), ("accelY", "float32"), ("accelZ", "float32"),
+                ("gyroX", "float32"), ("gyroY", "float32"), ("gyroZ", "float32"), ("tofDistance", "float32"))
+_ANALOG_COLUMNS = (("timestamp", "int64"), ("ntcTemperatureRaw", "float32"), ("ntcTemperatureConverted", "float32"),
+                   ("forceSensingRaw", "float32"), ("forceSensingConverted", "float32"))
+
+# Size of the .npy headers, large enough for any number of rows, so that the header can be rewritten in place
+_NPY_HEADER_SIZE = 128
+
+def _NpyHeader(dtype, rows: int) -> bytes:
+    header = "{'descr': %r, 'fortran_order': False, 'shape': (%d,), }" % (numpy.lib.format.dtype_to_descr(dtype), rows)
+    header = header.ljust(_NPY_HEADER_SIZE - 11) + "\n"
+    return b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header.encode("latin1")
+
+class _NpyWriter:
+    # One .npy file per column, growing with each chunk
+    def __init__(self, basePath: str, columns: dict):
+        self.files = [f"{ basePath }_{ name }.npy" for name in columns]
+        self.__handles = []
+        self.__rows = 0
+        for path, column in zip(self.files, columns.values()):
+            f = open(path, "xb")
+            f.write(_NpyHeader(column.dtype, 0))
+            self.__handles.append(f)
+
+    def write(self, columns: dict, rows: int):
+        self.__rows += rows
+        for f, column in zip(self.__handles, columns.values()):
+            f.write(column[:rows].tobytes())
+            # Keep the file readable while recording by updating the number of rows after each chunk
+            f.seek(0)
+            f.write(_NpyHeader(column.dtype, self.__rows))
+            f.seek(0, os.SEEK_END)
+            f.flush()
+
+    def close(self):
+        for f in self.__handles:
+            f.close()
+
+class _NpzWriter:
+    # One .npz file per chunk, holding one array per column
+    def __init__(self, basePath: str, columns: dict):
+        self.files = []
+        self.__basePath = basePath
+
+    def write(self, columns: dict, rows: int):
+        path = f"{ self.__basePath }_{ len(self.files):06d}.npz"
+        with open(path, "xb") as f:
+            numpy.savez(f, **{name: column[:rows] for name, column in columns.items()})
+        self.files.append(path)
+
+    def close(self):
+        pass
+
+class _ArrowWriter:
+    # One Arrow IPC file per stream, holding one record batch per chunk
+    def __init__(self, basePath: str, columns: dict):
+        self.files = [f"{ basePath }.arrow"]
+        self.__names = list(columns)
+        schema = pyarrow.schema([(name, pyarrow.from_numpy_dtype(column.dtype)) for name, column in columns.items()])
+        self.__file = open(self.files[0], "xb")
+        self.__writer = pyarrow.ipc.new_file(self.__file, schema)
+
+    def write(self, columns: dict, rows: int):
+        arrays = [pyarrow.array(column[:rows]) for column in columns.values()]
+        self.__writer.write_batch(pyarrow.record_batch(arrays, names=self.__names))
+
+    def close(self):
+        self.__writer.close()
+        self.__file.close()
+
+_WRITERS = {"npy": _NpyWriter, "npz": _NpzWriter, "arrow": _ArrowWriter}
+
+class _ExportStream:
+    # Chunk of a sensor stream, converted to columns and written when full.
+    # Rows are buffered as tuples: a single conversion per chunk is much faster than storing each value into NumPy arrays
+    def __init__(self, basePath: str, columns: tuple, chunkSize: int, writerClass):
+        self.columns = columns
+        self.rows = []
+        self.totalRows = 0
+        self.chunkSize = chunkSize
+        self.writer = writerClass(basePath, {name: numpy.empty(0, dtype=dtype) for name, dtype in columns})
+
+    def append(self, values: tuple):
+        rows = self.rows
+        rows.append(values)
+        if len(rows) == self.chunkSize:
+            self.flush()
+
+    def flush(self):
+        rows = self.rows
+        if not rows:
+            return
+        # Taken before converting and writing, so that a failure never leaves the chunk in the buffer
+        self.rows = []
+        try:
+            # Millisecond timestamps are exactly represented by float64
+            table = numpy.array(rows, dtype=numpy.float64)
+        except (ValueError, TypeError):
+            table = self.__validRows(rows)
+        columns = {name: table[:, i].astype(dtype) for i, (name, dtype) in enumerate(self.columns)}
+        self.writer.write(columns, len(table))
+        self.totalRows += len(table)
+
+    def __validRows(self, rows: list):
+        # Slow path, only taken for a chunk holding values that are not numbers: the rows holding them are dropped
+        valid = []
+        for row in rows:
+            try:
+                valid.append(tuple(map(float, row)))
+            except (ValueError, TypeError):
+                pass
+        return numpy.array(valid, dtype=numpy.float64).reshape(len(valid), len(self.columns))
+
+class WeArtRawDataExporter(WeArtMessageListener):
+    """
+    Exports the raw sensor data of the devices to columnar files, for offline analysis or training.
+
+    The exporter listens for RawSensorsData, RawDataTDPro and AnalogSensorsData messages and appends each
+    sensor sample to the stream of its hand and actuation point, as one row of the following columns:
+        * IMU streams: timestamp, accelX, accelY, accelZ, gyroX, gyroY, gyroZ, tofDistance
+        * analog streams: timestamp, ntcTemperatureRaw, ntcTemperatureConverted, forceSensingRaw, forceSensingConverted
+    Timestamps are the message timestamps in milliseconds (int64), sensor values are float32, NaN when missing.
+
+    Rows are converted to NumPy columns and written to disk by chunks of chunk_size rows, so memory is bounded
+    by chunk_size rows per stream, whatever the length of the recording. The supported formats are:
+        * "npy": one .npy file per stream and column, e.g. raw_imu_RIGHT_INDEX_accelX.npy, which can be memory-mapped
+        * "npz": one .npz file per stream and chunk, e.g. raw_imu_RIGHT_INDEX_000000.npz, with one array per column
+        * "arrow": one Arrow IPC file per stream, e.g. raw_imu_RIGHT_INDEX.arrow, with one record batch per chunk (requires pyarrow)
+
+    Files are readable once the exporter is closed; .npy and .npz files are also readable while exporting.
+    Existing files are never overwritten: if a file cannot be created or written, the error is logged and
+    the export stops, without disturbing the client. Messages and rows holding invalid values are logged and dropped. Recorded sessions can be exported by adding the exporter to a WeArtReplayClient.
+
+    Usage:
+        exporter = WeArtRawDataExporter("capture", format="npy")
+        client.AddMessageListener(exporter)
+        client.StartRawData()
+        ...
+        exporter.Close()
+
+    Requires NumPy.
+    """
+    FORMATS = tuple(_WRITERS)
+
+    def __init__(self, directory, format: str = "npy", chunk_size: int = 16384, prefix: str = "raw"):
+        """
+        Initializes the exporter, creating the directory if needed.
+
+        Parameters:
+            directory (str | os.PathLike): The directory the files are written to.
+            format (str): The file format, "npy", "npz" or "arrow".
+            chunk_size (int): The number of rows of each stream kept in memory before being written.
+            prefix (str): The prefix of the file names.
+
+        Raises:
+            ImportError: If NumPy, or pyarrow for the "arrow" format, is not installed.
+            ValueError: If the format is unknown or chunk_size is not positive.
+        """
+        super().__init__([RawSensorsData.ID, RawDataTDPro.ID, AnalogSensorsData.ID])
+        if numpy is None:
+            raise ImportError("WeArtRawDataExporter requires NumPy, install it with 'pip install numpy'")
+        if format not in _WRITERS:
+            raise ValueError(f"Unknown format '{ format }', expected one of { self.FORMATS }")
+        if format == "arrow" and pyarrow is None:
+            raise ImportError("The arrow format requires pyarrow, install it with 'pip install pyarrow'")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        os.makedirs(directory, exist_ok=True)
+        self.__directory = os.fspath(directory)
+        self.__writerClass = _WRITERS[format]
+        self.__chunkSize = chunk_size
+        self.__prefix = prefix
+        self.__streams = {}
+        self.__closed = False
+        self.__lock = Lock()
+        self.__logger = logging.getLogger("WeArtClient")
+
+    def OnMessageReceived(self, message: WeArtMessage):
+        """
+        Appends the sensor samples of a raw data message to their streams.
+
+        Parameters:
+            message (WeArtMessage): The received message.
+        """
+        with self.__lock:
+            if self.__closed:
+                return
+            try:
+                self.__Append(message.getID() == AnalogSensorsData.ID, message.getHand(), message.timestamp(), message)
+            except OSError as e:
+                self.__logger.error(f"Raw data export failed, export stopped: { e }")
+                self.__CloseStreams()
+            except (ValueError, TypeError) as e:
+                # Export must never disturb the client: only this message is dropped
+                self.__logger.error(f"Raw data message could not be exported: { e }")
+
+    def __Append(self, isAnalog: bool, hand, timestamp: int, message: WeArtMessage):
+        nan = float("nan")
+        for ap in WeArtCommon.ACTUATION_POINTS:
+            if not message.hasSensor(ap):
+                continue
+            data = message.getSensor(ap)
+            if isAnalog:
+                self.__Stream("analog", hand, ap).append((timestamp, data.ntcTemperatureRaw, data.ntcTemperatureConverted,
+                                                           data.forceSensingRaw, data.forceSensingConverted))
+                continue
+            accelerometer, gyroscope, timeOfFlight = data.accelerometer, data.gyroscope, data.timeOfFlight
+            self.__Stream("imu", hand, ap).append((
+                timestamp,
+                *((accelerometer.x, accelerometer.y, accelerometer.z) if accelerometer is not None else (nan, nan, nan)),
+                *((gyroscope.x, gyroscope.y, gyroscope.z) if gyroscope is not None else (nan, nan, nan)),
+                timeOfFlight.distance if timeOfFlight is not None else nan,
+            ))
+
+    def Flush(self):
+        """
+        Writes the rows kept in memory to the files.
+        """
+        with self.__lock:
+            if self.__closed:
+                return
+            try:
+                for stream in self.__streams.values():
+                    stream.flush()
+            except (OSError, ValueError, TypeError) as e:
+                self.__logger.error(f"Raw data export failed, export stopped: { e }")
+                self.__CloseStreams()
+
+    def Close(self):
+        """
+        Writes the rows kept in memory and closes the files. Messages received afterwards are ignored.
+        """
+        with self.__lock:
+            if self.__closed:
+                return
+            try:
+                for stream in self.__streams.values():
+                    stream.flush()
+            except (OSError, ValueError, TypeError) as e:
+                self.__logger.error(f"Raw data export failed, export stopped: { e }")
+            self.__CloseStreams()
+
+    def Files(self) -> list:
+        """
+        Returns the files written so far.
+
+        Returns:
+            list[str]: The paths of the files.
+        """
+        with self.__lock:
+            return [path for stream in self.__streams.values() for path in stream.writer.files]
+
+    def Rows(self) -> dict:
+        """
+        Returns the number of rows exported for each stream, including the rows not yet written.
+
+        Returns:
+            dict[tuple[str, HandSide, ActuationPoint], int]: The number of rows, by ("imu" or "analog", hand side, actuation point).
+        """
+        with self.__lock:
+            return {key: stream.totalRows + len(stream.rows) for key, stream in self.__streams.items()}
+
+    def __CloseStreams(self):
+        # Export must never disturb the client: the rows not yet written are discarded
+        self.__closed = True
+        for stream in self.__streams.values():
+            try:
+                stream.writer.close()
+            except OSError:
+                pass
+
+    def __Stream(self, kind: str, hand, ap) -> _ExportStream:
+        key = (kind, hand, ap)
+        stream = self.__streams.get(key)
+        if stream is None:
+            name = f"{ self.__prefix }_{ kind }_{ HandsideToString(hand) }_{ ActuationPointToString(ap) }"
+            columns = _ANALOG_COLUMNS if kind == "analog" else _IMU_COLUMNS
+            stream = _ExportStream(os.path.join(self.__directory, name), columns, self.__chunkSize, self.__writerClass)
+            self.__streams[key] = stream
+        return stream
+
+__all__ = ['WeArtRawDataExporter']
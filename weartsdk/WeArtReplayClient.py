@@ -0,0 +1,266 @@
+from contextlib import contextmanager
+from threading import Thread, Event, current_thread
+import logging
+import time
+
+from . import WeArtMessages as WeArtMessages
+from .WeArtCommon import TrackingType
+from .WeArtClient import WeArtClient
+from .WeArtMessageSerializer import WeArtMessageSerializer
+from .WeArtThimbleTrackingObject import WeArtThimbleTrackingObject
+from .WeArtTrackingRouter import WeArtTrackingRouter
+from .WeArtMessageListener import WeArtMessageListener
+from .WeArtMessageDispatcher import WeArtMessageDispatcher, WeArtCallbackDispatcher
+from .WeArtSessionRecorder import ReadSessionLog, RecordDirection
+
+class WeArtReplayClient:
+    """
+    A client feeding its listeners and thimble tracking objects with the messages of a session recorded by
+    WeArtSessionRecorder, instead of the messages received from the Middleware or WeArtApp.
+
+    The received frames of the log are deserialized and forwarded as by WeArtClient, in real time, at a speed
+    factor, or as fast as possible. The messages sent by the application, e.g. haptic commands or start
+    messages, are discarded, so code written for WeArtClient can run unchanged on recorded sessions.
+
+    Usage:
+        client = WeArtReplayClient("session.weartlog", speed = None)
+        client.AddThimbleTracking(thumbThimbleTracking)
+        client.AddMessageListener(WeArtTrackingRawData(HandSide.Right, ActuationPoint.Index))
+        replayed = client.Replay()
+
+    Attributes:
+        messagesSeparator (str): The separator used to delimit messages.
+    """
+    messagesSeparator = WeArtClient.messagesSeparator
+    ErrorType = WeArtClient.ErrorType
+
+    def __init__(self, path, speed = 1.0, log_level = logging.DEBUG, json_codec = None):
+        """
+        Initializes a WeArtReplayClient instance.
+
+        :param path: The path of the first file of the recorded session.
+        :param speed: The speed factor of the replay: 1.0 replays the session in real time, 10.0 ten times faster,
+            None as fast as possible (default is 1.0).
+        :param log_level: The logging level (default is logging.DEBUG).
+        :param json_codec: The JSON codec, or its name ("json", "orjson", "msgspec", "ujson"), used for JSON messages
+            (default is the fastest installed codec).
+        :raises ValueError: If speed is not positive.
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive, or None to replay as fast as possible")
+        self.__logger = logging.getLogger("WeArtClient")
+        self.__logger.setLevel(log_level)
+        self._messageSerializer = WeArtMessageSerializer(json_codec)
+        self.__path = path
+        self.__speed = speed
+        self.__Connected = False
+        self.__thread = None
+        self.__stop = Event()
+        self.__replayedFrames = 0
+        self.__thimbleTrackingObjects = []
+        self.__messageDispatcher = WeArtMessageDispatcher(self.__logger)
+        self.__trackingRouter = WeArtTrackingRouter()
+        self.__callbacks = WeArtCallbackDispatcher(self.__logger)
+        self.AddMessageListener(self.__trackingRouter)
+
+    def Run(self):
+        """
+        Starts replaying the session from a background thread. Use Wait to wait for the end of the session.
+        """
+        self.__stop.clear()
+        self.__thread = Thread(target=self.Replay, name="WeArtReplayClient", daemon=True)
+        self.__thread.start()
+
+    def Replay(self) -> int:
+        """
+        Replays the session from the calling thread, returning at the end of the session or when closed.
+        Listeners and callbacks are called from the calling thread.
+
+        :return: The number of replayed frames.
+        :raises ValueError: If the file is not a recorded session.
+        """
+        if current_thread() is not self.__thread:
+            self.__stop.clear()
+        self.__replayedFrames = 0
+        self.__Connected = True
+        self.__NotifyConnectionStatus(True)
+        try:
+            self.__Replay()
+        finally:
+            self.__Connected = False
+            self.__NotifyConnectionStatus(False)
+        return self.__replayedFrames
+
+    def Wait(self, timeout: float = None) -> bool:
+        """
+        Waits for the end of the replay started by Run.
+
+        :param timeout: The maximum time to wait, in seconds, None to wait indefinitely.
+        :return: True if the replay has ended, False on timeout.
+        """
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+            return not self.__thread.is_alive()
+        return True
+
+    def ReplayedFrames(self) -> int:
+        """
+        Returns the number of frames replayed so far, not counting the frames that could not be deserialized.
+
+        :return: The number of replayed frames.
+        """
+        return self.__replayedFrames
+
+    def IsConnected(self):
+        """
+        Checks if the session is being replayed.
+
+        :return: True while replaying, False otherwise.
+        """
+        return self.__Connected
+
+    def Close(self):
+        """
+        Stops the replay. Can be called from a listener or callback, during the replay.
+        """
+        self.__stop.set()
+        thread = self.__thread
+        if thread is not None and thread is not current_thread():
+            thread.join()
+            self.__thread = None
+
+    def Start(self, tracking_type = TrackingType.WEART_HAND):
+        """
+        Does nothing, the recorded session already contains the messages of the started devices.
+        """
+
+    def Stop(self):
+        """
+        Does nothing, the recorded session cannot be changed.
+        """
+
+    def StartCalibration(self):
+        """
+        Does nothing, the recorded session already contains the calibration messages.
+        """
+
+    def StopCalibration(self):
+        """
+        Does nothing, the recorded session cannot be changed.
+        """
+
+    def StartRawData(self):
+        """
+        Does nothing, the recorded session already contains the raw data messages.
+        """
+
+    def StopRawData(self):
+        """
+        Does nothing, the recorded session cannot be changed.
+        """
+
+    def AddThimbleTracking(self, trackingObject: WeArtThimbleTrackingObject):
+        """
+        Adds a thimble tracking object, updated with the replayed tracking messages.
+
+        :param trackingObject: The WeArtThimbleTrackingObject to add.
+        """
+        self.__trackingRouter.AddThimbleTracking(trackingObject)
+        self.__thimbleTrackingObjects.append(trackingObject)
+
+    def RemoveThimbleTracking(self, trackingObject: WeArtThimbleTrackingObject):
+        """
+        Removes a thimble tracking object.
+
+        :param trackingObject: The WeArtThimbleTrackingObject to remove.
+        """
+        if trackingObject in self.__thimbleTrackingObjects:
+            self.__thimbleTrackingObjects.remove(trackingObject)
+            self.__trackingRouter.RemoveThimbleTracking(trackingObject)
+
+    def ThimbleTrackingObjectsSize(self):
+        """
+        Returns the number of thimble tracking objects currently being tracked.
+
+        :return: The number of thimble tracking objects.
+        """
+        return len(self.__thimbleTrackingObjects)
+
+    def AddMessageListener(self, listener: WeArtMessageListener):
+        """
+        Adds a message listener, called with the replayed messages it accepts.
+
+        :param listener: The WeArtMessageListener to add.
+        """
+        self.__messageDispatcher.AddListener(listener)
+
+    def RemoveMessageListener(self, listener: WeArtMessageListener):
+        """
+        Removes a message listener.
+
+        :param listener: The WeArtMessageListener to remove.
+        """
+        self.__messageDispatcher.RemoveListener(listener)
+
+    def AddConnectionStatusCallback(self, callback):
+        """
+        Adds a callback function called with True when the replay starts and False when it ends.
+
+        :param callback: The callback function to be called.
+        """
+        self.__callbacks.AddConnectionStatusCallback(callback)
+
+    def AddErrorCallback(self, callback):
+        """
+        Adds a callback function called with ErrorType.ReceiveMessageError when a recorded frame cannot be deserialized.
+
+        :param callback: The callback function to be called.
+        """
+        self.__callbacks.AddErrorCallback(callback)
+
+    @contextmanager
+    def Batch(self):
+        """
+        Does nothing, the messages sent during a replay are discarded.
+        """
+        yield
+
+    def _sendMessage(self, msg: WeArtMessages.WeArtMessage):
+        """
+        Discards a message sent by the application, e.g. by a WeArtHapticObject.
+
+        :param msg: The message.
+        """
+
+    def __Replay(self):
+        speed = self.__speed
+        stop = self.__stop
+        deserialize = self._messageSerializer.Deserialize
+        forward = self.__messageDispatcher.Forward
+        start = None
+        for record in ReadSessionLog(self.__path):
+            if stop.is_set():
+                return
+            if record.direction != RecordDirection.RECEIVED:
+                continue
+            if speed is not None:
+                if start is None:
+                    start = (time.monotonic(), record.timestamp)
+                delay = start[0] + (record.timestamp - start[1]) / 1e9 / speed - time.monotonic()
+                if delay > 0 and stop.wait(delay):
+                    return
+            message = deserialize(record.data)
+            if message is None:
+                self.__logger.error(f"Replayed frame { record.data !r} could not be deserialized")
+                self.__NotifyError(self.ErrorType.ReceiveMessageError)
+                continue
+            self.__replayedFrames += 1
+            forward((message,))
+
+    def __NotifyConnectionStatus(self, connected: bool):
+        self.__callbacks.NotifyConnectionStatus(connected)
+
+    def __NotifyError(self, errorType):
+        self.__callbacks.NotifyError(errorType)
+
+__all__ = ['WeArtReplayClient']
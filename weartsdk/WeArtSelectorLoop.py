@@ -0,0 +1,128 @@
+from threading import Thread, Lock
+import selectors
+from selectors import EVENT_READ, EVENT_WRITE
+import socket
+import logging
+
+class WeArtSelectorLoop:
+    """
+    I/O loop waiting for the readiness of many sockets from a single thread, using the most efficient
+    selector of the platform (epoll on Linux).
+
+    Sockets are registered with a callback, called from the loop thread each time the socket is ready.
+    Registrations can be changed from any thread: changes are queued and applied by the loop thread,
+    which is woken up through an internal socket pair.
+
+    Attributes:
+        __selector (selectors.BaseSelector): The selector waiting for the sockets.
+        __changes (list): The registration changes not yet applied by the loop thread.
+    """
+    def __init__(self):
+        """
+        Initializes a WeArtSelectorLoop. The loop thread is started by Start.
+        """
+        self.__selector = selectors.DefaultSelector()
+        self.__wakeupReader, self.__wakeupWriter = socket.socketpair()
+        self.__wakeupReader.setblocking(False)
+        self.__wakeupWriter.setblocking(False)
+        self.__selector.register(self.__wakeupReader, EVENT_READ, None)
+        self.__changes = []
+        self.__lock = Lock()
+        self.__running = False
+        self.__thread = None
+        self.__logger = logging.getLogger("WeArtClient")
+
+    def Start(self):
+        """
+        Starts the loop thread, if not already running.
+        """
+        with self.__lock:
+            if self.__running:
+                return
+            self.__running = True
+        self.__thread = Thread(target=self.__Run, name="WeArtSelectorLoop", daemon=True)
+        self.__thread.start()
+
+    def Stop(self, timeout: float = 1.0):
+        """
+        Stops the loop thread. Registered sockets are not closed.
+
+        Parameters:
+            timeout (float): The maximum time to wait for the loop thread to exit, in seconds.
+        """
+        with self.__lock:
+            self.__running = False
+        self.__Wakeup()
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+            self.__thread = None
+
+    def Register(self, sock, callback, events: int = EVENT_READ):
+        """
+        Registers a socket, or changes the events of an already registered socket.
+
+        Parameters:
+            sock (socket.socket): The socket.
+            callback (Callable[[int], None]): Function called from the loop thread with the ready events.
+            events (int): The events to wait for, a combination of EVENT_READ and EVENT_WRITE.
+        """
+        self.__Change((sock, callback, events))
+
+    def Unregister(self, sock):
+        """
+        Unregisters a socket. The callback is not called anymore once the change is applied.
+
+        Parameters:
+            sock (socket.socket): The socket.
+        """
+        self.__Change((sock, None, 0))
+
+    def __Change(self, change: tuple):
+        with self.__lock:
+            self.__changes.append(change)
+        self.__Wakeup()
+
+    def __Wakeup(self):
+        try:
+            self.__wakeupWriter.send(b'\0')
+        except BlockingIOError:
+            # The loop has already been woken up
+            pass
+
+    def __ApplyChanges(self):
+        with self.__lock:
+            changes = self.__changes
+            self.__changes = []
+        selector = self.__selector
+        for sock, callback, events in changes:
+            try:
+                key = selector.get_map().get(sock)
+                if callback is None:
+                    if key is not None:
+                        selector.unregister(sock)
+                elif key is None:
+                    selector.register(sock, events, callback)
+                else:
+                    selector.modify(sock, events, callback)
+            except (OSError, ValueError, KeyError) as e:
+                # The socket has already been closed
+                self.__logger.debug(f"Selector registration change failed: { e }")
+
+    def __Run(self):
+        selector = self.__selector
+        while self.__running:
+            self.__ApplyChanges()
+            for key, events in selector.select():
+                if key.data is None:
+                    try:
+                        while self.__wakeupReader.recv(4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                    continue
+                try:
+                    key.data(events)
+                except Exception:
+                    self.__logger.exception("Socket callback failed")
+
+__all__ = ['WeArtSelectorLoop', 'EVENT_READ', 'EVENT_WRITE']
@@ -0,0 +1,254 @@
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+import logging
+import os
+import struct
+from threading import Thread, Event, Lock
+import time
+
+class RecordDirection(Enum):
+    """
+    Direction of a recorded frame.
+
+    Attributes:
+        RECEIVED: Frame received from the Middleware or WeArtApp.
+        SENT: Frame sent by the client.
+    """
+    RECEIVED = 0
+    SENT = 1
+
+@dataclass
+class WeArtSessionRecord:
+    """
+    A frame recorded by WeArtSessionRecorder.
+
+    Attributes:
+        timestamp (int): The time the frame was received or sent, in nanoseconds of time.monotonic_ns,
+            or of time.time_ns if the log was read with wall_clock set.
+        direction (RecordDirection): Whether the frame was received or sent.
+        data (bytes): The frame, without the messages separator.
+    """
+    timestamp: int
+    direction: RecordDirection
+    data: bytes
+
+# File header: magic, format version, wall clock and monotonic clock at creation, in nanoseconds
+_MAGIC = b"WEARTLOG"
+_VERSION = 1
+_HEADER = struct.Struct("<8sBqq")
+# Record header: frame length, monotonic timestamp in nanoseconds, direction
+_RECORD = struct.Struct("<IqB")
+_DIRECTIONS = {d.value: d for d in RecordDirection}
+
+def _RotatedPath(path, index: int) -> str:
+    return os.fspath(path) if index == 0 else f"{ os.fspath(path) }.{ index }"
+
+class WeArtSessionRecorder:
+    """
+    Records the frames received and sent by a client into an append-only binary log, for later analysis or replay.
+
+    Recording a frame only appends it to an in-memory queue; a background thread writes the queued frames
+    every flush interval. If writes stall and the queued frames exceed the maximum pending size, the frames
+    recorded meanwhile are dropped and counted, with a logged warning. Each record holds the frame length, the monotonic time it was received or sent,
+    its direction and its raw bytes. When a file exceeds the maximum size, recording continues in a new file
+    named after the first one with an increasing suffix (session.weartlog, session.weartlog.1, ...).
+    Recorded logs are read with ReadSessionLog.
+
+    Usage:
+        recorder = WeArtSessionRecorder("session.weartlog")
+        client = WeArtClient(WeArtCommon.DEFAULT_IP_ADDRESS, WeArtCommon.DEFAULT_TCP_PORT, recorder = recorder)
+        ...
+        client.Close()
+        recorder.Close()
+
+    Attributes:
+        __pending (collections.deque): The recorded frames not yet written, as (direction, timestamp, frames) tuples.
+        __pendingSize (int): The size of the frames not yet written, in bytes.
+    """
+    def __init__(self, path, max_file_size: int = 64 * 1024 * 1024, flush_interval: float = 0.1, max_pending_size: int = 16 * 1024 * 1024):
+        """
+        Initializes a WeArtSessionRecorder and creates the first log file.
+
+        Parameters:
+            path (str | os.PathLike): The path of the first log file.
+            max_file_size (int): The size, in bytes, above which recording continues in a new file.
+            flush_interval (float): The maximum time a recorded frame waits before being written, in seconds.
+            max_pending_size (int): The size, in bytes, of the frames waiting to be written above which
+                recorded frames are dropped.
+
+        Raises:
+            FileExistsError: If the log file already exists, logs are never overwritten.
+            ValueError: If max_file_size, flush_interval or max_pending_size is not positive.
+        """
+        if max_file_size <= 0 or flush_interval <= 0 or max_pending_size <= 0:
+            raise ValueError("max_file_size, flush_interval and max_pending_size must be positive")
+        self.__path = path
+        self.__maxFileSize = max_file_size
+        self.__flushInterval = flush_interval
+        self.__pending = deque()
+        self.__pendingLock = Lock()
+        self.__pendingSize = 0
+        self.__maxPendingSize = max_pending_size
+        self.__droppedFrames = 0
+        self.__dropping = False
+        self.__files = []
+        self.__file = None
+        self.__fileSize = 0
+        self.__failed = False
+        self.__stop = Event()
+        self.__logger = logging.getLogger("WeArtClient")
+        self.__Open()
+        self.__thread = Thread(target=self.__Run, name="WeArtSessionRecorder", daemon=True)
+        self.__thread.start()
+
+    def Record(self, direction: RecordDirection, frames: list):
+        """
+        Records frames received or sent at the same time. Safe to call from any thread.
+        Frames recorded after Close, or after a write error stopped the recording, are discarded.
+        Frames exceeding the maximum pending size are dropped, see DroppedFrames.
+
+        Parameters:
+            direction (RecordDirection): Whether the frames were received or sent.
+            frames (list[bytes]): The frames, without the messages separator.
+        """
+        if self.__stop.is_set() or self.__failed:
+            return
+        size = sum(map(len, frames))
+        with self.__pendingLock:
+            if self.__pendingSize + size <= self.__maxPendingSize:
+                self.__pendingSize += size
+                self.__dropping = False
+                self.__pending.append((direction.value, time.monotonic_ns(), frames))
+                return
+            self.__droppedFrames += len(frames)
+            if self.__dropping:
+                return
+            self.__dropping = True
+        # Warn once each time frames start being dropped, not for every frame
+        self.__logger.warning(f"Session recording is falling behind, dropping frames above { self.__maxPendingSize } pending bytes")
+
+    def DroppedFrames(self) -> int:
+        """
+        Returns the number of frames dropped because too many frames were waiting to be written.
+
+        Returns:
+            int: The number of dropped frames.
+        """
+        return self.__droppedFrames
+
+    def Files(self) -> list:
+        """
+        Returns the log files created so far.
+
+        Returns:
+            list[str]: The paths of the log files, in recording order.
+        """
+        return list(self.__files)
+
+    def Close(self, timeout: float = 5.0):
+        """
+        Writes the pending frames and closes the log. Frames recorded afterwards are discarded.
+
+        Parameters:
+            timeout (float): The maximum time to wait for the pending frames to be written, in seconds.
+        """
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+            self.__thread = None
+
+    def __Open(self):
+        path = _RotatedPath(self.__path, len(self.__files))
+        # Exclusive creation, so that a previous session is never overwritten
+        self.__file = open(path, "xb")
+        self.__file.write(_HEADER.pack(_MAGIC, _VERSION, time.time_ns(), time.monotonic_ns()))
+        self.__fileSize = _HEADER.size
+        self.__files.append(path)
+
+    def __Run(self):
+        while True:
+            stopping = self.__stop.wait(self.__flushInterval)
+            self.__Write()
+            if stopping:
+                break
+        self.__pending.clear()
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+    def __Write(self):
+        pending = self.__pending
+        pack = _RECORD.pack
+        chunk = bytearray()
+        released = 0
+        try:
+            while pending:
+                direction, timestamp, frames = pending.popleft()
+                released += sum(map(len, frames))
+                if self.__failed:
+                    continue
+                for frame in frames:
+                    size = _RECORD.size + len(frame)
+                    if self.__fileSize + len(chunk) + size > self.__maxFileSize and self.__fileSize + len(chunk) > _HEADER.size:
+                        self.__file.write(chunk)
+                        chunk.clear()
+                        self.__file.close()
+                        self.__Open()
+                    chunk += pack(len(frame), timestamp, direction)
+                    chunk += frame
+            if chunk:
+                self.__file.write(chunk)
+                self.__fileSize += len(chunk)
+                self.__file.flush()
+        except OSError as e:
+            # Recording must never disturb the client: stop recording and discard the frames
+            self.__logger.error(f"Session recording failed, recording stopped: { e }")
+            self.__failed = True
+        finally:
+            with self.__pendingLock:
+                self.__pendingSize -= released
+
+def ReadSessionLog(path, wall_clock: bool = False):
+    """
+    Iterates over the frames of a log recorded by WeArtSessionRecorder, including the rotated files,
+    without loading the files in memory. A record truncated by an interrupted recording ends the iteration.
+
+    Parameters:
+        path (str | os.PathLike): The path of the first log file.
+        wall_clock (bool): If True, timestamps are converted to time.time_ns wall clock time.
+
+    Yields:
+        WeArtSessionRecord: The recorded frames, in recording order.
+
+    Raises:
+        ValueError: If a file is not a session log.
+    """
+    index = 0
+    while True:
+        filePath = _RotatedPath(path, index)
+        if index > 0 and not os.path.exists(filePath):
+            return
+        with open(filePath, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return
+            magic, version, wallTime, monotonicTime = _HEADER.unpack(header)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f"'{ filePath }' is not a session log")
+            offset = wallTime - monotonicTime if wall_clock else 0
+            read = f.read
+            unpack = _RECORD.unpack
+            recordSize = _RECORD.size
+            while True:
+                recordHeader = read(recordSize)
+                if len(recordHeader) < recordSize:
+                    break
+                length, timestamp, direction = unpack(recordHeader)
+                data = read(length)
+                if len(data) < length:
+                    return
+                yield WeArtSessionRecord(timestamp + offset, _DIRECTIONS[direction], data)
+        index += 1
+
+__all__ = ['WeArtSessionRecorder', 'WeArtSessionRecord', 'RecordDirection', 'ReadSessionLog']
@@ -0,0 +1,64 @@
+from dataclasses import dataclass
+import socket
+import sys
+
+@dataclass
+class WeArtSocketOptions:
+    """
+    TCP options applied to the socket of a WeArtClient before connecting.
+
+    The defaults favour latency: haptic commands are small messages, which Nagle's algorithm would hold back
+    until the previous ones are acknowledged, so TCP_NODELAY is enabled. Keepalive detects a dead peer
+    (e.g. a crashed Middleware host) within about keepAliveIdle + keepAliveInterval * keepAliveCount seconds.
+
+    Attributes:
+        tcpNoDelay (bool): Disables Nagle's algorithm (TCP_NODELAY).
+        receiveBufferSize (int): The kernel receive buffer size (SO_RCVBUF), None to keep the system default.
+        sendBufferSize (int): The kernel send buffer size (SO_SNDBUF), None to keep the system default.
+        keepAlive (bool): Enables TCP keepalive probes (SO_KEEPALIVE).
+        keepAliveIdle (int): Seconds of inactivity before the first probe, where supported.
+        keepAliveInterval (int): Seconds between two probes, where supported.
+        keepAliveCount (int): Number of unanswered probes before the connection is dropped, where supported.
+        connectTimeout (float): Maximum time to establish the connection, in seconds, None to wait indefinitely.
+    """
+    tcpNoDelay: bool = True
+    receiveBufferSize: int = None
+    sendBufferSize: int = None
+    keepAlive: bool = True
+    keepAliveIdle: int = 10
+    keepAliveInterval: int = 5
+    keepAliveCount: int = 3
+    connectTimeout: float = 5.0
+
+    def apply(self, sock: socket.socket):
+        """
+        Applies the options to a socket not yet connected.
+
+        Parameters:
+            sock (socket.socket): The socket.
+        """
+        if self.tcpNoDelay:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self.receiveBufferSize is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.receiveBufferSize)
+        if self.sendBufferSize is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.sendBufferSize)
+        if self.keepAlive:
+            self.__applyKeepAlive(sock)
+        sock.settimeout(self.connectTimeout)
+
+    def __applyKeepAlive(self, sock: socket.socket):
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if sys.platform == "win32" and hasattr(socket, "SIO_KEEPALIVE_VALS"):
+            sock.ioctl(socket.SIO_KEEPALIVE_VALS, (1, self.keepAliveIdle * 1000, self.keepAliveInterval * 1000))
+            return
+        # TCP_KEEPIDLE is named TCP_KEEPALIVE on macOS
+        idleOption = getattr(socket, "TCP_KEEPIDLE", getattr(socket, "TCP_KEEPALIVE", None))
+        if idleOption is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, idleOption, self.keepAliveIdle)
+        if hasattr(socket, "TCP_KEEPINTVL"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, self.keepAliveInterval)
+        if hasattr(socket, "TCP_KEEPCNT"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, self.keepAliveCount)
+
+__all__ = ['WeArtSocketOptions']
@@ -1,20 +1,36 @@
+from dataclasses import dataclass
 from .WeArtMessageListener import WeArtMessageListener
 from .WeArtCommon import HandSide, ActuationPoint
 from .WeArtMessages import WeArtMessage, TrackingMessage, TrackingBendingG2Message
 from . import WeArtCommon
 
+@dataclass(frozen=True)
+class ThimbleTracking:
+    """
+    Represents the tracking values of a thimble, taken from the same tracking message.
+
+    Attributes:
+        closure (float): The relative closure of the thimble (0-1).
+        abduction (float): The relative abduction of the thimble (0-1).
+    """
+    closure: float = WeArtCommon.defaultClosure
+    abduction: float = WeArtCommon.defaultAbduction
+
 class WeArtThimbleTrackingObject(WeArtMessageListener):
     """
     Represents a tracking object for a WeArt thimble, which listens for messages regarding tracking and bending data.
+
+    Closure and abduction are published together as an immutable ThimbleTracking object, replaced as a whole
+    by the receive thread, so readers always get values coming from the same tracking message without locking.
     
     Attributes:
         _handSide (HandSide): The side of the hand (left or right) associated with the object.
         _actuation_point (ActuationPoint): The actuation point of the thimble (e.g., thumb, index).
-        _closure (float): The closure value of the thimble, representing the relative closure of the thimble (0-1).
-        _abduction (float): The abduction value of the thimble, representing the relative abduction of the thimble (0-1).
+        _tracking (ThimbleTracking): The last closure and abduction values of the thimble.
 
     Methods:
         OnMessageReceived: Handles the received message and updates the closure and abduction values accordingly.
+        GetTracking: Returns the current closure and abduction values.
         GetClosure: Returns the current closure value.
         GetAbduction: Returns the current abduction value.
     """
@@ -30,8 +46,7 @@ class WeArtThimbleTrackingObject(WeArtMessageListener):
         super().__init__([TrackingMessage.ID, TrackingBendingG2Message.ID])
         self._handSide = handSide
         self._actuation_point = actuationPoint
-        self._closure = WeArtCommon.defaultClosure
-        self._abduction = WeArtCommon.defaultAbduction
+        self._tracking = ThimbleTracking()
     
     def OnMessageReceived(self, message: WeArtMessage):
         """
@@ -41,11 +56,47 @@ class WeArtThimbleTrackingObject(WeArtMessageListener):
             message (WeArtMessage): The message containing tracking or bending data.
         """
         if message.getID() == TrackingMessage.ID:
-            self._closure = message.GetClosure(self._handSide, self._actuation_point)
-            self._abduction = message.GetAbduction(self._handSide, self._actuation_point)
+            self._setTracking(message.GetClosure(self._handSide, self._actuation_point), message.GetAbduction(self._handSide, self._actuation_point))
         elif message.getID() == TrackingBendingG2Message.ID and self._handSide == message.GetHandSide():
-            self._closure = message.GetClosure(self._actuation_point)
-            self._abduction = message.GetAbduction(self._actuation_point)
+            self._setTracking(message.GetClosure(self._actuation_point), message.GetAbduction(self._actuation_point))
+
+    def _setTracking(self, closure: float, abduction: float):
+        """
+        Publishes new closure and abduction values. Used by WeArtTrackingRouter.
+
+        Parameters:
+            closure (float): The relative closure of the thimble (0-1).
+            abduction (float): The relative abduction of the thimble (0-1).
+        """
+        self._tracking = ThimbleTracking(closure, abduction)
+
+    def GetHandSide(self) -> HandSide:
+        """
+        Returns the hand side of the thimble.
+
+        Returns:
+            HandSide: The hand side (left or right).
+        """
+        return self._handSide
+
+    def GetActuationPoint(self) -> ActuationPoint:
+        """
+        Returns the actuation point of the thimble.
+
+        Returns:
+            ActuationPoint: The actuation point (e.g., thumb, index).
+        """
+        return self._actuation_point
+
+    def GetTracking(self) -> ThimbleTracking:
+        """
+        Returns the current closure and abduction values, both taken from the same tracking message.
+        Use this method instead of GetClosure and GetAbduction when both values are needed.
+
+        Returns:
+            ThimbleTracking: The current tracking values.
+        """
+        return self._tracking
 
     def GetClosure(self):
         """
@@ -55,12 +106,12 @@ class WeArtThimbleTrackingObject(WeArtMessageListener):
         Returns:
             float: The relative closure value of finger (0-1).
         """
-        return self._closure
+        return self._tracking.closure
     
     def GetAbduction(self):
         """
         Returns the current abduction value. 0 means fully adducted, 1 means fully abducted.
         """
-        return self._abduction
+        return self._tracking.abduction
 
-__all__ = ['WeArtThimbleTrackingObject']
+__all__ = ['WeArtThimbleTrackingObject', 'ThimbleTracking']
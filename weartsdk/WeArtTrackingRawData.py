@@ -2,6 +2,12 @@ from .WeArtMessageListener import WeArtMessageListener
 from .WeArtCommon import HandSide, ActuationPoint, SensorData, AccelerometerData, GyroscopeData, TofData
 from .WeArtMessages import WeArtMessage, RawSensorsData, RawDataTDPro
 from dataclasses import dataclass
+from collections import deque
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 @dataclass
 class Sample:
@@ -23,40 +29,124 @@ class WeArtTrackingRawData(WeArtMessageListener):
     Attributes:
         __handSide (HandSide): The hand side (left or right) associated with the data.
         __actuationPoint (ActuationPoint): The specific actuation point being tracked.
-        __K_NUM_SAMPLES (int): The maximum number of stored samples.
-        __samples (list): A list of stored sensor data samples.
+        __capacity (int): The maximum number of stored samples.
+        __samples (deque): A bounded buffer of the stored sensor data samples, from the oldest to the newest.
+        __lastSample (Sample): The most recent sample, published as a whole after the samples are updated.
         __callbacks (list): A list of callback functions to be executed when a new sample is received.
 
     Methods:
         GetLastSample: Returns the most recent sensor data sample.
+        GetSamples: Returns the stored samples newer than a timestamp.
+        GetWindow: Returns the most recent stored samples.
+        GetArrays: Returns the most recent stored samples as NumPy arrays.
         AddSampleCallback: Registers a callback function to be called when new sensor data arrives.
         OnMessageReceived: Processes incoming messages and updates the stored samples.
     """
-    def __init__(self, handSide: HandSide, actuationPoint: ActuationPoint):
+    DefaultCapacity = 3
+
+    def __init__(self, handSide: HandSide, actuationPoint: ActuationPoint, capacity: int = DefaultCapacity):
         """
         Initializes the tracking object to listen for raw sensor data messages.
 
         Parameters:
             handSide (HandSide): The hand side (left or right) to track.
             actuationPoint (ActuationPoint): The specific actuation point to track.
+            capacity (int): The maximum number of stored samples (default is 3). Older samples are discarded.
         """
         super().__init__([RawSensorsData.ID, RawDataTDPro.ID])
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got { capacity }")
         self.__handSide = handSide
         self.__actuationPoint = actuationPoint
-        self.__K_NUM_SAMPLES = 3
-        self.__samples = []
+        self.__capacity = capacity
+        self.__samples = deque(maxlen=capacity)
+        self.__lastSample = Sample(0, SensorData(AccelerometerData(), GyroscopeData(), TofData()))
         self.__callbacks =  []
 
     def GetLastSample(self) -> Sample:
         """
         Returns the most recent sensor data sample, or a default sample with timestamp = 0 if no data is available.
+        Samples are never modified once published, so the returned sample is consistent even while new data arrives.
 
         Returns:
             Sample: The last recorded sample.
         """
-        if len(self.__samples) == 0:
-            return Sample(0, SensorData(AccelerometerData(), GyroscopeData(), TofData()))
-        return self.__samples[-1]
+        return self.__lastSample
+
+    def GetCapacity(self) -> int:
+        """
+        Returns the maximum number of stored samples.
+
+        Returns:
+            int: The capacity of the samples buffer.
+        """
+        return self.__capacity
+
+    def GetSamples(self, since_ts: int = None) -> list:
+        """
+        Returns the stored samples with a timestamp greater than the given one, from the oldest to the newest.
+
+        Parameters:
+            since_ts (int): The timestamp after which samples are returned. If None, all stored samples are returned.
+
+        Returns:
+            list[Sample]: The stored samples newer than since_ts.
+        """
+        samples = list(self.__samples)
+        if since_ts is None:
+            return samples
+        start = len(samples)
+        while start > 0 and samples[start - 1].timestamp > since_ts:
+            start -= 1
+        return samples[start:]
+
+    def GetWindow(self, n: int) -> list:
+        """
+        Returns the n most recent stored samples, from the oldest to the newest.
+
+        Parameters:
+            n (int): The number of samples. If fewer samples are stored, all of them are returned.
+
+        Returns:
+            list[Sample]: The most recent stored samples.
+        """
+        samples = list(self.__samples)
+        return samples[max(len(samples) - n, 0):]
+
+    def GetArrays(self, n: int = None) -> dict:
+        """
+        Returns the n most recent stored samples as NumPy arrays, one per sensor, from the oldest to the newest.
+        Values missing from a sample (e.g. Time-of-Flight on Touch Diver Pro) are set to NaN.
+        Requires NumPy.
+
+        Parameters:
+            n (int): The number of samples. If None, all stored samples are returned.
+
+        Returns:
+            dict: The arrays, with keys:
+                * "timestamp": timestamps (N), int64
+                * "accelerometer": accelerometer x, y, z (Nx3), float64
+                * "gyroscope": gyroscope x, y, z (Nx3), float64
+                * "timeOfFlight": Time-of-Flight distances (N), float64
+        """
+        if numpy is None:
+            raise ImportError("GetArrays requires NumPy, install it with 'pip install numpy'")
+        samples = self.GetSamples() if n is None else self.GetWindow(n)
+        nan = float("nan")
+        timestamps = numpy.empty(len(samples), dtype=numpy.int64)
+        accelerometer = numpy.full((len(samples), 3), nan)
+        gyroscope = numpy.full((len(samples), 3), nan)
+        timeOfFlight = numpy.full(len(samples), nan)
+        for i, sample in enumerate(samples):
+            timestamps[i] = sample.timestamp
+            data = sample.data
+            if data.accelerometer is not None:
+                accelerometer[i] = (data.accelerometer.x, data.accelerometer.y, data.accelerometer.z)
+            if data.gyroscope is not None:
+                gyroscope[i] = (data.gyroscope.x, data.gyroscope.y, data.gyroscope.z)
+            if data.timeOfFlight is not None:
+                timeOfFlight[i] = data.timeOfFlight.distance
+        return {"timestamp": timestamps, "accelerometer": accelerometer, "gyroscope": gyroscope, "timeOfFlight": timeOfFlight}
 
     def AddSampleCallback(self, callback):
         """
@@ -93,9 +183,7 @@ class WeArtTrackingRawData(WeArtMessageListener):
 
         sample = Sample(timestamp = rawSensorsData.timestamp(), data = rawSensorsData.getSensor(self.__actuationPoint))
         self.__samples.append(sample)
-
-        while len(self.__samples) > self.__K_NUM_SAMPLES:
-            self.__samples.pop(0)
+        self.__lastSample = sample
         
         for callback in self.__callbacks:
             callback(sample)
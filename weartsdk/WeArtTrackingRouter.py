@@ -0,0 +1,83 @@
+from .WeArtMessageListener import WeArtMessageListener
+from .WeArtMessages import WeArtMessage, TrackingMessage, TrackingBendingG2Message
+from .WeArtThimbleTrackingObject import WeArtThimbleTrackingObject
+from . import WeArtCommon
+
+class WeArtTrackingRouter(WeArtMessageListener):
+    """
+    Forwards tracking data to the registered thimble tracking objects.
+
+    Each tracking message is read once into per-hand tables of closures and abductions, and only the
+    objects of the hand carried by the message are updated, each with a single table lookup.
+    Objects of subclasses overriding OnMessageReceived are given the messages instead, as before the router existed.
+
+    Attributes:
+        __objectsByHand (dict): For each hand side, a tuple of (tracking object, actuation point index) pairs.
+        __listeners (tuple): The tracking objects overriding OnMessageReceived.
+    """
+    def __init__(self):
+        """
+        Initializes the WeArtTrackingRouter, listening for tracking and bending messages.
+        """
+        super().__init__([TrackingMessage.ID, TrackingBendingG2Message.ID])
+        self.__objectsByHand = {handSide: () for handSide in WeArtCommon.HAND_SIDES}
+        self.__listeners = ()
+
+    def AddThimbleTracking(self, trackingObject: WeArtThimbleTrackingObject):
+        """
+        Adds a thimble tracking object to be updated with the tracking data of its hand and actuation point.
+
+        Parameters:
+            trackingObject (WeArtThimbleTrackingObject): The tracking object to add.
+
+        Raises:
+            ValueError: If the hand side or the actuation point of the object is not a single valid value.
+        """
+        handSide = trackingObject.GetHandSide()
+        actuationPoint = trackingObject.GetActuationPoint()
+        if handSide not in self.__objectsByHand:
+            raise ValueError(f"Invalid hand side { handSide !r}, expected one of { WeArtCommon.HAND_SIDES }")
+        if actuationPoint not in WeArtCommon.ACTUATION_POINTS:
+            raise ValueError(f"Invalid actuation point { actuationPoint !r}, expected one of { WeArtCommon.ACTUATION_POINTS }")
+        if type(trackingObject).OnMessageReceived is not WeArtThimbleTrackingObject.OnMessageReceived:
+            self.__listeners = self.__listeners + (trackingObject,)
+            return
+        index = WeArtCommon.ACTUATION_POINTS.index(actuationPoint)
+        self.__objectsByHand[handSide] = self.__objectsByHand[handSide] + ((trackingObject, index),)
+
+    def RemoveThimbleTracking(self, trackingObject: WeArtThimbleTrackingObject):
+        """
+        Removes a thimble tracking object.
+
+        Parameters:
+            trackingObject (WeArtThimbleTrackingObject): The tracking object to remove.
+        """
+        self.__listeners = tuple(listener for listener in self.__listeners if listener is not trackingObject)
+        handSide = trackingObject.GetHandSide()
+        if handSide in self.__objectsByHand:
+            self.__objectsByHand[handSide] = tuple(entry for entry in self.__objectsByHand[handSide] if entry[0] is not trackingObject)
+
+    def OnMessageReceived(self, message: WeArtMessage):
+        """
+        Updates the closure and abduction values of the tracking objects of the hand(s) carried by the message.
+
+        Parameters:
+            message (WeArtMessage): The message containing tracking or bending data.
+        """
+        if message.getID() == TrackingMessage.ID:
+            for handSide in WeArtCommon.HAND_SIDES:
+                objects = self.__objectsByHand[handSide]
+                if objects:
+                    self.__update(objects, message.GetHandTracking(handSide))
+        elif message.getID() == TrackingBendingG2Message.ID:
+            objects = self.__objectsByHand.get(message.GetHandSide())
+            if objects:
+                self.__update(objects, message.GetHandTracking())
+        for listener in self.__listeners:
+            listener.OnMessageReceived(message)
+
+    @staticmethod
+    def __update(objects: tuple, tracking: tuple):
+        closures, abductions = tracking
+        for trackingObject, index in objects:
+            trackingObject._setTracking(closures[index], abductions[index])
@@ -1,20 +1,29 @@
-# internal, not wildcarded: WeArtMessageListener, WeArtMessages, WeArtMessageSerializer
+# internal, not wildcarded: WeArtMessageListener, WeArtMessages, WeArtConversions, WeArtMessageSerializer, WeArtMessageFramer, WeArtMessageDispatcher, WeArtJsonCodec, WeArtTrackingRouter, WeArtMessageSender, WeArtSelectorLoop
+# not imported by the package, so that it can be run with python -m: WeArtMiddlewareSimulator
 
-from . import MiddlewareStatusListener, WeArtAnalogSensorData, WeArtClient, WeArtCommon, WeArtEffect, WeArtForce, WeArtHapticObject, WeArtTemperature, WeArtTexture, WeArtThimbleTrackingObject, WeArtTrackingCalibration, WeArtTrackingRawData, TDProStatusListener, DeviceStatusListener
+from . import AsyncWeArtClient, HandStateBuffer, MiddlewareStatusListener, WeArtAnalogSensorData, WeArtClient, WeArtClientPool, WeArtCommon, WeArtEffect, WeArtForce, WeArtHapticCoalescer, WeArtHapticObject, WeArtRawDataExporter, WeArtReplayClient, WeArtSessionRecorder, WeArtSocketOptions, WeArtTemperature, WeArtTexture, WeArtThimbleTrackingObject, WeArtTrackingCalibration, WeArtTrackingRawData, TDProStatusListener, DeviceStatusListener
 
 __all__ = ['WeArtCommon']
-for submod in (MiddlewareStatusListener, TDProStatusListener, DeviceStatusListener, WeArtAnalogSensorData, WeArtClient, WeArtCommon, WeArtEffect, WeArtForce, WeArtHapticObject, WeArtTemperature, WeArtTexture, WeArtThimbleTrackingObject, WeArtTrackingCalibration, WeArtTrackingRawData):
+for submod in (AsyncWeArtClient, HandStateBuffer, MiddlewareStatusListener, TDProStatusListener, DeviceStatusListener, WeArtAnalogSensorData, WeArtClient, WeArtClientPool, WeArtCommon, WeArtEffect, WeArtForce, WeArtHapticCoalescer, WeArtHapticObject, WeArtRawDataExporter, WeArtReplayClient, WeArtSessionRecorder, WeArtSocketOptions, WeArtTemperature, WeArtTexture, WeArtThimbleTrackingObject, WeArtTrackingCalibration, WeArtTrackingRawData):
     __all__.extend(submod.__all__)
 
+from .AsyncWeArtClient import *
+from .HandStateBuffer import *
 from .MiddlewareStatusListener import *
 from .DeviceStatusListener import *
 from .TDProStatusListener import *
 from .WeArtAnalogSensorData import *
 from .WeArtClient import *
+from .WeArtClientPool import *
 # from .WeArtCommon import * # we have access to all objects through WeArtCommon.<something>
 from .WeArtEffect import *
 from .WeArtForce import *
+from .WeArtHapticCoalescer import *
 from .WeArtHapticObject import *
+from .WeArtRawDataExporter import *
+from .WeArtReplayClient import *
+from .WeArtSessionRecorder import *
+from .WeArtSocketOptions import *
 from .WeArtTemperature import *
 from .WeArtTexture import *
 from .WeArtThimbleTrackingObject import *